@@ -1,5 +1,10 @@
 import pandas as pd
+import numpy as np
 import copy
+import functools
+
+from core import catalog
+from core.sinks import FrameSink
 
 # -*- coding: utf-8 -*-
 """
@@ -13,39 +18,85 @@ Units accounted for include "kg/kWh", "kg/MJmile", "kg/MJ", "MJ/MJmile", "MJ/kWh
 """
 
 
-def compute_activity_flows(df, flow_output, flow_info):
-    flow_dict = {}
-    flows = pd.unique(df['flows'].dropna())
-
-    for i in flows:
-        row = df[df['flows'] == i].groupby('flows').agg({'value': 'sum', 'unit': 'first'}).reset_index().iloc[0]
-        row['value'] = float(row['value'])
-        flow = {"name": i.lower()}
-        upper_unit, lower_unit = row['unit'].split('/')
-        flow["unit"] = upper_unit
+def _flow_records(names, values, units, flow_output, flow_info):
+    """
+    Converts summed flow `values` (per unit of activity output) into flow
+    dicts, scaled by the activity output and, for per-mile units, by the
+    distance. Unit checks and scaling are applied to all flows at once.
+    """
+    if len(names) == 0:
+        return []
+
+    # each distinct unit string is only split once
+    parts = {}
+    for unit in set(units):
+        upper_unit, lower_unit = unit.split('/')
+        parts[unit] = (upper_unit, lower_unit)
+    lower_units = np.array([parts[unit][1] for unit in units], dtype=object)
+
+    is_mj_mile = lower_units == "MJmile"
+    is_kg_mile = lower_units == "kgmile"
+    expected_units = np.where(is_mj_mile, "MJ", np.where(is_kg_mile, "kg", lower_units))
+    mismatched = expected_units != flow_output['unit']
+    assert not mismatched.any(), "flow units don't match the output unit ({}): {}".format(
+        flow_output['unit'],
+        ', '.join(f'{name} ({unit})' for name, unit, bad in zip(names, units, mismatched) if bad),
+    )
+
+    scaled = np.asarray(values, dtype=float) * float(flow_output['value'])
+    per_mile = is_mj_mile | is_kg_mile
+    if per_mile.any():
+        scaled[per_mile] = scaled[per_mile] * float(flow_info["distance"])
+
+    # rounded like the scaled values were one at a time: with numpy's
+    # rounding when the output value (or the distance) is a numpy scalar,
+    # which made the product one, and with Python's `round` otherwise. The
+    # two disagree on some halfway values (e.g. 0.0005127145).
+    numpy_rounded = np.full(len(names), isinstance(flow_output['value'], np.generic))
+    if per_mile.any() and isinstance(flow_info["distance"], np.generic):
+        numpy_rounded |= per_mile
 #Tony changed rounding from 4 to 9 because nuclear and hydro power csv numbers are very small
-        if lower_unit == "MJmile":
-            assert flow_output['unit'] == "MJ"
-            flow["value"] = round(row['value'] * flow_output['value'] * flow_info["distance"], 9)
-        elif lower_unit == "kgmile":
-            assert flow_output['unit'] == "kg"
-            flow["value"] = round(row['value'] * flow_output['value'] * flow_info["distance"], 9)
-        else:
-            assert flow_output['unit'] == lower_unit
-            flow["value"] = round(row['value'] * flow_output['value'], 9)
+    values = [
+        rounded if numpy else round(value, 9)
+        for value, rounded, numpy in zip(scaled.tolist(), np.round(scaled, 9).tolist(), numpy_rounded)
+    ]
+    return [
+        {
+            "name": name.lower(),
+            "unit": parts[unit][0],
+            "value": value,
+        }
+        for name, unit, value in zip(names, units, values)
+    ]
+
+
+def _group_flows(df, by):
+    return df.groupby(by, sort=False).agg({'value': 'sum', 'unit': 'first'})
 
-        flow_dict[i.lower()] = flow
-        
-    return flow_dict
+
+def compute_activity_flows(df, flow_output, flow_info):
+    grouped = _group_flows(df, 'flows')
+    records = _flow_records(
+        grouped.index.tolist(), grouped['value'].to_numpy(), grouped['unit'].tolist(), flow_output, flow_info
+    )
+    return {flow["name"]: flow for flow in records}
 
 
 def compute_flows(df, flow_output, flow_info):
     final_dict = {}
     if "activity" in list(df.columns):
-        activities = list(df["activity"].unique())
-        for activity in activities:
-            activity_df = df[df["activity"] == activity]
-            final_dict[activity] = compute_activity_flows(activity_df, flow_output, flow_info)
+        # a single grouped pass over every (activity, flow) pair
+        grouped = _group_flows(df, ["activity", "flows"])
+        activities = grouped.index.get_level_values(0)
+        names = grouped.index.get_level_values(1)
+        records = _flow_records(
+            names.tolist(), grouped['value'].to_numpy(), grouped['unit'].tolist(), flow_output, flow_info
+        )
+
+        for activity in df["activity"].unique():
+            final_dict[activity] = {}
+        for activity, flow in zip(activities, records):
+            final_dict[activity][flow["name"]] = flow
     else:
         final_dict["aggregate"] = compute_activity_flows(df, flow_output, flow_info)
 
@@ -188,39 +239,143 @@ def calculate_co2_emissions(results):
     return df[df['flows'] == 'co2']
 
 
-def perform_lcia(results, indicator='GWP'):
+@functools.lru_cache(maxsize=None)
+def _lcia_data():
+    # shared between callers: do not modify in place
+    return catalog.read_csv('analysis/lca/lciadata.csv')
+
+
+@functools.lru_cache(maxsize=None)
+def characterization_factors():
+    """
+    Returns the characterization factors as a flows x indicators data frame,
+    in the order they appear in `lciadata.csv`. Factors that are not defined
+    are 0.
+    """
+    df = _lcia_data()
+    factors = pd.DataFrame(0.0, index=pd.unique(df['flows']), columns=pd.unique(df['indicator']))
+    for flow, indicator, value in df[['flows', 'indicator', 'value']].itertuples(index=False):
+        factors.loc[flow, indicator] += value
+    return factors
+
+
+def _characterize(emissions_df, indicators):
+    """
+    Characterizes the emissions of every (stage, sub stage) for all
+    `indicators` with a single matrix multiply.
+    """
+    lcia_df = _lcia_data()
+    factors = characterization_factors()
+    for indicator in indicators:
+        if indicator not in factors.columns:
+            raise ValueError(f'unknown indicator: {indicator}')
+
+    emissions_df = emissions_df[emissions_df['flows'].isin(factors.index)]
+    groups = emissions_df.groupby(['stage', 'sub_stage'])
+    rows = groups.ngroup().to_numpy()
+    keys = list(groups.size().index)
+    cols = factors.index.get_indexer(emissions_df['flows'])
+
+    emissions = np.zeros((len(keys), len(factors.index)))
+    np.add.at(emissions, (rows, cols), np.nan_to_num(emissions_df['value'].to_numpy(dtype=float)))
+    present = np.zeros((len(keys), len(factors.index)), dtype=bool)
+    present[rows, cols] = True
+    units = np.empty((len(keys), len(factors.index)), dtype=object)
+    units[rows[::-1], cols[::-1]] = emissions_df['unit'].to_numpy()[::-1]
+
+    values = emissions @ factors[indicators].to_numpy()
+
+    frames = []
+    for idx, indicator in enumerate(indicators):
+        indicator_df = lcia_df[lcia_df['indicator'] == indicator]
+        flow_cols = factors.index.get_indexer(indicator_df['flows'])
+
+        # the unit is the one of the first emitted flow of the indicator
+        indicator_present = present[:, flow_cols]
+        has_flows = indicator_present.any(axis=1)
+        first_flows = flow_cols[indicator_present.argmax(axis=1)]
+
+        frames.append(pd.DataFrame({
+            'stage': [key[0] for key in keys],
+            'sub_stage': [key[1] for key in keys],
+            'value': values[:, idx],
+            'unit': units[np.arange(len(keys)), first_flows],
+            'indicator': indicator,
+            'name': indicator_df['name'].iloc[0],
+        })[has_flows])
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def perform_lcia(results, indicator='GWP', indicators=None):
+    """
+    Returns the impact of each (stage, sub stage) for `indicator`, or for
+    each of `indicators` if given.
+    """
     emissions_df = calculate_emissions(results)
-
-    lcia_df = pd.read_csv('analysis/lca/lciadata.csv')
-    lcia_df = lcia_df[lcia_df['indicator'] == indicator]
-
-    merged_df = pd.merge(emissions_df, lcia_df, on='flows', how='right')
-    merged_df['value'] = merged_df['value_x'] * merged_df['value_y']
-    merged_df = merged_df.rename(columns={'unit_x': 'unit'})
-    merged_df.drop(columns=['value_x', 'value_y', 'flows', 'unit_y'], inplace=True)
-    merged_df = merged_df.groupby(['stage', 'sub_stage']).agg({
-        'value': 'sum',
-        'unit': 'first',
-        'indicator': 'first',
-        'name': 'first',
-    }).reset_index()
-
-    return merged_df
+    if indicators is None:
+        indicators = [indicator]
+    return _characterize(emissions_df, list(indicators))
 
 
 def indicators():
-    df = pd.read_csv('analysis/lca/lciadata.csv')
+    df = _lcia_data()
     return [
         {'value': value, 'label': label} for label, value in df[['name', 'indicator']].drop_duplicates().to_numpy()
     ]
 
 
-def run(pathways, indicator='GWP'):
-    data = pd.DataFrame()
-    name = None
+def _pathway_frame(pathway, pathway_results, indicator, indicators=None):
+    df = perform_lcia(pathway_results, indicator=indicator, indicators=indicators)
+    df.value = df.value*1000
+    df.unit = "g"
+    df['pathway'] = pathway.name
+
+    # sort by stage
+    df['stage'] = pd.Categorical(df['stage'], categories=['Enduse', 'GateToEnduse', 'Process', 'Midstream', 'Upstream'], ordered=True)
+    if indicators is None:
+        df = df.sort_values('stage')
+    else:
+        order = {name: idx for idx, name in enumerate(indicators)}
+        df = df.sort_values(
+            ['indicator', 'stage'],
+            key=lambda column: column.map(order) if column.name == 'indicator' else column
+        )
+
+    return df
+
+
+def _columns(indicators):
+    columns = ['value', 'stage', 'sub_stage', 'pathway']
+    if indicators is not None:
+        columns.append('indicator')
+    return columns
+
+
+def _result(data, value, indicator, indicators=None):
+    params = {'indicator': indicator}
+    if indicators is not None:
+        params = {'indicators': list(indicators)}
 
+    return dict(
+        title=f'Lifecycle GHG Emissions',
+        unit=f'gCO\u2082e/{value}',
+        value=value,
+        columns=_columns(indicators),
+        params=params,
+        data=data
+    )
+
+
+def stream(pathways, indicator='GWP', indicators=None, cached=True):
+    """
+    Performs the pathways of the iterable `pathways` one at a time, yielding
+    `(unit, data)` for each, where `unit` is the unit of the Enduse output and
+    `data` the result rows of the pathway. With `cached=False`, the results
+    are neither looked up in nor added to the results cache.
+    """
     for pathway in pathways:
-        pathway_results = pathway.perform()
+        pathway_results = pathway.perform(cached=cached)
         # elec = total = 0
         # for stage in pathway_results.items():
         #     elec = elec + stage["elec_emissions"]['aggregate']['co2']['value']
@@ -230,23 +385,46 @@ def run(pathways, indicator='GWP'):
         #     for stage in pathway_results.items():
         #         stage['flow_emissions']['aggregate']['co2']['value'] = stage['flow_emissions']['aggregate']['co2']['value']*x*pathway_results["Enduse"]["flow_output"]["value"]/elec
         value = pathway_results["Enduse"]["flow_output"]["unit"]
-        df = perform_lcia(pathway_results, indicator=indicator)
-        df.value = df.value*1000
-        df.unit = "g"
-        df['pathway'] = pathway.name
+        df = _pathway_frame(pathway, pathway_results, indicator, indicators)
+        yield value, df[_columns(indicators)]
 
-        # sort by stage
-        df['stage'] = pd.Categorical(df['stage'], categories=['Enduse', 'GateToEnduse', 'Process', 'Midstream', 'Upstream'], ordered=True)
-        df = df.sort_values('stage')
 
-        name = df['name'].iloc[0]
-        data = data.append(df[['value', 'stage', 'sub_stage', 'pathway']])
+def run(pathways, indicator='GWP', indicators=None, sink=None, cached=True):
+    """
+    Returns the LCIA results of `pathways` for `indicator`. If `indicators`
+    is given, the results for all of them are computed from a single
+    `perform()` of each pathway and the data has an `indicator` column.
 
-    return dict(
-        title=f'Lifecycle GHG Emissions',
-        unit=f'gCO\u2082e/{value}',
-        value=value,
-        columns=['value', 'stage', 'sub_stage', 'pathway'],
-        params={'indicator': indicator},
-        data=data
-    )
+    `pathways` can be any iterable. The result rows are written to `sink`
+    (by default a `FrameSink`, which concatenates them in memory), and the
+    sink's result is returned as the data. `cached` is passed to
+    `Pathway.perform`.
+    """
+    if sink is None:
+        sink = FrameSink()
+
+    value = None
+    for value, df in stream(pathways, indicator, indicators, cached=cached):
+        sink.write(df)
+
+    return _result(sink.result(), value, indicator, indicators)
+
+
+def run_batch(pathways, indicator='GWP', indicators=None, workers=None, chunk_size=None):
+    """
+    Same as `run`, but the pathways are performed across a pool of `workers`
+    processes (see `Pathway.perform_many`) and combined into a single frame.
+    """
+    from core.pathway import Pathway
+
+    pathways = list(pathways)
+    all_results = Pathway.perform_many(pathways, workers=workers, chunk_size=chunk_size)
+
+    sink = FrameSink()
+    value = None
+    for pathway, pathway_results in zip(pathways, all_results):
+        value = pathway_results["Enduse"]["flow_output"]["unit"]
+        df = _pathway_frame(pathway, pathway_results, indicator, indicators)
+        sink.write(df[_columns(indicators)])
+
+    return _result(sink.result(), value, indicator, indicators)
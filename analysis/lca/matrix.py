@@ -0,0 +1,364 @@
+"""
+Matrix formulation of the pathway LCA.
+
+Every Enduse -> ... -> Upstream chain of the topology is compiled, with the
+default source and inputs of each activity, into
+
+  - a technology matrix `A`, where column `j` holds the activity `j` itself
+    (1 on the diagonal) and the amount of the next activity in the chain it
+    requires per unit of its output, and
+  - an intervention matrix `B`, holding the emissions of each activity per
+    unit of its output, one row per (stage, sub stage, flow, unit).
+
+The coefficients of an activity (its life cycle inventory per unit of
+output) are computed once, from its own tables: its source is evaluated on
+its own, for `REFERENCE_AMOUNT` units of the flow the previous activity
+supplies it with (large enough for the rounding of the flows to the 9th
+decimal not to matter), and again for twice that to check that it is
+linear. Activities appearing
+in several chains (e.g. natural gas extraction) are evaluated once.
+
+Solving `A s = f` for a final demand `f` gives the scaling `s` of every
+activity of every chain at once, and `B diag(s)` the per-stage emissions.
+Each chain is its own block of `A`, since the chains are alternative
+pathways for their Enduse rather than suppliers of each other.
+"""
+import math
+import numbers
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+from analysis.lca import calculate_emissions
+
+REFERENCE_AMOUNT = 1e6
+
+# flows are rounded to the 9th decimal by the steps (see `compute_flows`)
+ROUNDING = 0.5e-9
+
+
+class MatrixLCAError(Exception):
+    """
+    Raised when an activity of a chain can't be compiled, e.g. when its
+    default inputs fail or it isn't linear in its output.
+    """
+
+
+def topology_chains(metadata):
+    """
+    Returns every chain of activities from an Enduse activity to an activity
+    without links, following `Activity.links`.
+    """
+    def walk(activity, chain):
+        chain = chain + [activity]
+        if len(activity.links) == 0:
+            yield chain
+        for next_activity in activity.links:
+            yield from walk(next_activity, chain)
+
+    return [
+        chain
+        for activity in metadata.stages[0].activities
+        for chain in walk(activity, [])
+    ]
+
+
+def chain_name(chain):
+    return ' > '.join(activity.name for activity in chain)
+
+
+def _is_flow(flow):
+    return isinstance(flow, dict) and isinstance(flow.get('value'), numbers.Number)
+
+
+class _Chain:
+    """
+    Stands in for the pathway of an activity evaluated on its own, for the
+    activities reading other steps of their pathway (e.g. a process reading
+    the upstream coal type): returns the default instances of the other
+    activities of the chain, and records which ones were read.
+    """
+
+    def __init__(self, chain, context):
+        self.sources = {str(activity.stage.id): activity.sources[0] for activity in chain}
+        self.context = context
+        self.read = {}
+        self._instances = {}
+
+    def instance(self, stage_id):
+        source = self.sources.get(stage_id)
+        if source is None:
+            return None
+        self.read[stage_id] = source.id
+        if stage_id not in self._instances:
+            obj = source.instantiate()
+            obj.prepare(_input_set(source, self.context))
+            obj.pathway = self
+            self._instances[stage_id] = obj
+        return self._instances[stage_id]
+
+
+def _input_set(source, context):
+    # imported here since the topology imports this package
+    from core.pathway import Step
+    return Step.build(source.id, context=context).input_set
+
+
+def _evaluate(source, output, chain, context):
+    """
+    Performs `source` with its default inputs for the `output` flow, as a
+    step of `chain`. Returns its primary input flow, its emissions (in the
+    shape of `calculate_emissions`) and the steps of the chain it read.
+    """
+    pathway = _Chain(chain, context)
+    input_set = _input_set(source, context)
+
+    obj = source.instantiate()
+    obj.prepare(input_set)
+    obj.pathway = pathway
+    obj.output = output
+    obj.prepare(input_set)
+
+    primary = obj.get_inputs()['primary']
+    emissions = calculate_emissions({str(source.activity.stage): obj.serialize()})
+    return primary, emissions, pathway.read
+
+
+class MatrixLCA:
+
+    @classmethod
+    def compile(cls, metadata=None, context=None, chains=None, skip_errors=False):
+        """
+        Builds the matrices for the `chains` of activities (every chain of
+        `metadata`, the pathway topology by default). A chain that can't be
+        compiled raises a `MatrixLCAError`, or with `skip_errors`, is left
+        out and listed with its error in `errors`.
+        """
+        if chains is None:
+            if metadata is None:
+                from pathway.topology import metadata
+            chains = topology_chains(metadata)
+
+        model = cls(context=context)
+        for chain in chains:
+            try:
+                model._add_chain(chain)
+            except MatrixLCAError as e:
+                if not skip_errors:
+                    raise
+                model.errors[chain_name(chain)] = e
+
+        model._build()
+        return model
+
+    def __init__(self, context=None):
+        self.context = context
+        self.chains = []
+        self.errors = {}
+        self.stages = []
+        self.keys = []
+
+        # inventories of the activities evaluated so far, by source and
+        # reference flow: lists of (steps read, inventory)
+        self._inventories = {}
+
+        # sparse entries, collected per chain and assembled by `_build`
+        self._technology = ([], [], [])
+        self._interventions = ([], [], [])
+        self._key_index = {}
+
+    def _inventory(self, chain, idx, output):
+        """
+        Returns the primary flow and the emissions of the activity `idx` of
+        `chain` per unit of `output` (or for the Enduse, per functional
+        unit), computed once per activity.
+        """
+        activity = chain[idx]
+        source = activity.sources[0]
+        key = (source.id, None) if output is None else (source.id, output.get('name'), output.get('unit'))
+        sources = {str(other.stage.id): other.sources[0].id for other in chain if len(other.sources) > 0}
+
+        for read, inventory in self._inventories.get(key, []):
+            if all(sources.get(stage_id) == source_id for stage_id, source_id in read.items()):
+                return inventory
+
+        try:
+            if output is None:
+                primary, emissions, read = _evaluate(source, None, chain, self.context)
+            else:
+                primary, emissions, read = _evaluate(source, dict(output, value=REFERENCE_AMOUNT), chain, self.context)
+                doubled_primary, doubled, _ = _evaluate(
+                    source, dict(output, value=2 * REFERENCE_AMOUNT), chain, self.context,
+                )
+
+                # the coefficients only hold if the activity is linear in its output
+                linear = len(doubled) == len(emissions) and all(
+                    math.isclose(b, 2 * a, rel_tol=1e-6, abs_tol=1e-8)
+                    for a, b in zip(emissions['value'], doubled['value'])
+                )
+                if _is_flow(primary):
+                    linear = linear and _is_flow(doubled_primary) and math.isclose(
+                        doubled_primary['value'], 2 * primary['value'], rel_tol=1e-6, abs_tol=1e-8,
+                    )
+                if not linear:
+                    raise MatrixLCAError(f'{source.id}: not linear in its output')
+
+                emissions = emissions.assign(value=emissions['value'] / REFERENCE_AMOUNT)
+                if _is_flow(primary):
+                    primary = dict(primary, value=primary['value'] / REFERENCE_AMOUNT)
+        except MatrixLCAError:
+            raise
+        except Exception as e:
+            raise MatrixLCAError(f'{source.id}: {type(e).__name__}: {e}') from e
+
+        if idx > 0 and output is None and (emissions['value'] != 0).any():
+            # performed without input, so doesn't scale with the demand
+            raise MatrixLCAError(f'{source.id}: has emissions without an input from {chain[idx - 1].name}')
+        if idx + 1 < len(chain) and primary is not None and not _is_flow(primary):
+            raise MatrixLCAError(f'{source.id}: its input from {chain[idx + 1].name} is not a single flow')
+
+        inventory = (primary, emissions)
+        self._inventories.setdefault(key, []).append((read, inventory))
+        return inventory
+
+    def _add_chain(self, chain):
+        name = chain_name(chain)
+        for activity in chain:
+            if len(activity.sources) == 0:
+                raise MatrixLCAError(f'{activity.name}: no source')
+
+        inventories = []
+        output = None
+        for idx in range(len(chain)):
+            primary, emissions = self._inventory(chain, idx, output)
+            inventories.append((primary, emissions))
+            output = primary
+
+        offset = len(self.stages)
+        technology = ([], [], [])
+        interventions = ([], [], [])
+        for idx, (primary, emissions) in enumerate(inventories):
+            technology[0].append(offset + idx)
+            technology[1].append(offset + idx)
+            technology[2].append(1.0)
+            if idx + 1 < len(chain) and primary is not None:
+                technology[0].append(offset + idx + 1)
+                technology[1].append(offset + idx)
+                technology[2].append(-float(primary['value']))
+
+            for stage, sub_stage, flow, value, unit in emissions.itertuples(index=False):
+                key = (stage, sub_stage, flow, unit)
+                if key not in self._key_index:
+                    self._key_index[key] = len(self.keys)
+                    self.keys.append(key)
+                interventions[0].append(self._key_index[key])
+                interventions[1].append(offset + idx)
+                interventions[2].append(float(value))
+
+        for entries, chain_entries in [(self._technology, technology), (self._interventions, interventions)]:
+            for items, chain_items in zip(entries, chain_entries):
+                items.extend(chain_items)
+
+        self.chains.append({
+            'name': name,
+            'source_ids': [activity.sources[0].id for activity in chain],
+            'offset': offset,
+            'size': len(chain),
+        })
+        self.stages.extend(str(activity.stage) for activity in chain)
+
+    def _build(self):
+        size = len(self.stages)
+        rows, cols, values = self._technology
+        self.technology = sparse.csc_matrix((values, (rows, cols)), shape=(size, size))
+
+        # kept as coordinates so that zero emissions still show up in results
+        rows, cols, values = self._interventions
+        self._intervention_rows = np.array(rows, dtype=int)
+        self._intervention_cols = np.array(cols, dtype=int)
+        self._intervention_values = np.array(values, dtype=float)
+        self.interventions = sparse.csc_matrix(
+            (self._intervention_values, (self._intervention_rows, self._intervention_cols)),
+            shape=(len(self.keys), size),
+        )
+
+    def scaling(self, demand=None):
+        """
+        Returns the activity levels of every step of every chain for a final
+        demand of `demand[name]` functional units (as in the default pathway)
+        of the Enduse of each chain, by chain name (by default, one of each).
+        """
+        demand = demand or {}
+        unknown = set(demand) - {chain['name'] for chain in self.chains}
+        if len(unknown) > 0:
+            raise ValueError(f'unknown chains: {", ".join(sorted(unknown))}')
+
+        final_demand = np.zeros(len(self.stages))
+        for chain in self.chains:
+            final_demand[chain['offset']] = demand.get(chain['name'], 1.0)
+        return np.atleast_1d(spsolve(self.technology, final_demand))
+
+    def solve(self, demand=None):
+        """
+        Returns the emissions of every stage of every chain as a data frame
+        in the shape of `calculate_emissions`, with a `pathway` column.
+        """
+        scaling = self.scaling(demand)
+        values = self._intervention_values * scaling[self._intervention_cols]
+
+        pathways = np.empty(len(self.stages), dtype=object)
+        for chain in self.chains:
+            pathways[chain['offset']:chain['offset'] + chain['size']] = chain['name']
+
+        keys = [self.keys[row] for row in self._intervention_rows]
+        df = pd.DataFrame(keys, columns=['stage', 'sub_stage', 'flows', 'unit'])
+        df.insert(0, 'pathway', pathways[self._intervention_cols])
+        df.insert(4, 'value', values)
+        return df
+
+    def totals(self, demand=None):
+        """
+        Returns the total emissions of each (stage, sub stage, flow, unit)
+        summed over every chain.
+        """
+        totals = self.interventions @ self.scaling(demand)
+        index = pd.MultiIndex.from_tuples(self.keys, names=['stage', 'sub_stage', 'flows', 'unit'])
+        return pd.Series(totals, index=index)
+
+    def verify(self, rel_tol=1e-6):
+        """
+        Checks the solution for one functional unit of each chain against
+        `Pathway.perform` with the default inputs, up to the rounding of the
+        flows of each step and its propagation down the chain. Returns the
+        names of the chains that differ.
+        """
+        from core.pathway import Pathway
+
+        solved = self.solve()
+        mismatches = []
+        for chain in self.chains:
+            results = Pathway.build(chain['source_ids'], context=self.context).perform(cached=False)
+            expected = calculate_emissions(results)
+            actual = solved[solved['pathway'] == chain['name']]
+
+            # error of the output of each step, from the rounding of the
+            # inputs of the steps before it
+            offset, size = chain['offset'], chain['size']
+            errors = np.zeros(size)
+            for idx in range(1, size):
+                errors[idx] = abs(self.technology[offset + idx, offset + idx - 1]) * errors[idx - 1] + ROUNDING
+            cols = self._intervention_cols[actual.index] - offset
+            tolerance = (
+                np.abs(self._intervention_values[actual.index]) * errors[cols]
+                + ROUNDING
+                + rel_tol * np.abs(expected['value'].to_numpy())
+            )
+
+            if len(expected) != len(actual) or not np.all(
+                np.abs(actual['value'].to_numpy() - expected['value'].to_numpy()) <= tolerance
+            ):
+                mismatches.append(chain['name'])
+
+        return mismatches
@@ -1,8 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+import math
+import multiprocessing
+import numbers
+import os
 from pprint import pprint
+import threading
 
+import numpy as np
+
+from analysis.uncertainty import latin_hypercube
+from core import cache
 from core.inputs import InputSet
 
-_cache = {}
+
+def _build_cache():
+    maxsize = int(os.environ.get('SENSITIVITY_CACHE_SIZE') or 1024)
+    ttl = float(os.environ.get('SENSITIVITY_CACHE_TTL') or 0) or None
+
+    # optional tier shared by all processes on the host
+    shared = None
+    path = os.environ.get('SENSITIVITY_CACHE_PATH')
+    if path:
+        shared = cache.SQLiteCache(path, maxsize=maxsize * 16, ttl=ttl)
+
+    return cache.TieredCache(maxsize=maxsize, ttl=ttl, shared=shared)
+
+
+_cache = _build_cache()
+
+# number of processes used to run the evaluations, opt-in for batch runs
+# (the default runs them in the calling process)
+workers = int(os.environ.get('SENSITIVITY_WORKERS') or 1)
+
+# analysis run by the worker processes of `_map`
+_worker_analysis = None
+
+
+def _init_worker(analysis):
+    global _worker_analysis
+    _worker_analysis = analysis
+
+
+def _call(call):
+    method, args = call
+    return getattr(_worker_analysis, method)(*args)
+
+
+def _map(analysis, calls):
+    """
+    Returns the result of each `(method, args)` call of `analysis`, in order.
+
+    The calls run in this process unless `workers` is raised above one, in
+    which case they are spread over a pool of at most `workers` processes.
+    The pool is forked so that the workers inherit the analysis (its
+    pathway, sources and their tables) instead of pickling it, and only the
+    arguments and results are sent between processes. Results cached by the
+    workers are lost with them, so the pool is meant for batch runs (e.g.
+    scripts), not for the API: calls still run in this process when other
+    threads are alive (forking them can deadlock on a lock held by another
+    thread) or when forking isn't available.
+    """
+    count = min(workers, len(calls))
+    if (count <= 1 or threading.active_count() > 1
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+        return [getattr(analysis, method)(*args) for method, args in calls]
+
+    with ProcessPoolExecutor(
+        max_workers=count,
+        mp_context=multiprocessing.get_context('fork'),
+        initializer=_init_worker,
+        initargs=(analysis,),
+    ) as executor:
+        return list(executor.map(_call, calls))
+
 
 class SensitivityInput:
     data_lacking_scalar = 0.3
@@ -34,15 +104,27 @@ class SensitivityInput:
         raise ValueError(f'no maximizing value for input: {self.name}')
 
 
+def _version(source):
+    # LCA sources and TEA analyses both wrap the class implementing the model
+    return getattr(getattr(source, 'cls', None), 'version', None)
+
+
+def cache_stats():
+    return _cache.stats()
+
+
 class SensitivityAnalysis:
 
     def __init__(self, pathway, runner, params=None):
         self.pathway = pathway
         self.runner = runner
         self.params = params or {}
+        self._default_input_sets = None
 
         self.sensitivity_inputs = {}
+        self._sources = []
         for step in self.pathway.steps:
+            self._sources.append(step.source)
             self.sensitivity_inputs[step.source] = [
                 sensitivity_input
                 for sensitivity_input in step.source.sensitivity(**self.params) or []
@@ -59,75 +141,338 @@ class SensitivityAnalysis:
         return res
 
     def default_input_sets(self):
-        return {
-            source: InputSet.build_default(source)
-            for source in self.sensitivity_inputs.keys()
-        }
+        # built once per analysis and shared by all runs: do not modify
+        if self._default_input_sets is None:
+            self._default_input_sets = {
+                source: InputSet.build_default(source)
+                for source in self.sensitivity_inputs.keys()
+            }
+        return self._default_input_sets
 
     def base_value(self):
-        return self.runner(self.pathway, self.default_input_sets())
+        # runners may modify the pathway they are given, so each run gets
+        # its own copy
+        return self.runner(self.pathway.copy(), dict(self.default_input_sets()))
 
-    def run(self, source, input_name, input_value):
+    def _cache_key(self, source, input_name, input_value):
+        # source versions are part of the key so that results computed by an
+        # older version of a model (e.g. in the shared tier) are not reused
         pathway_key = tuple([
             type(self.pathway).__module__,
             type(self.pathway).__name__,
+            self.runner.__module__,
+            self.runner.__qualname__,
         ] + [
-            step.source.identifier()
+            (step.source.identifier(), _version(step.source))
             for step in self.pathway.steps
         ])
 
-        cache_key = (
+        return cache.fingerprint([
             pathway_key,
             type(source).__module__,
             type(source).__name__,
             source.identifier(),
+            _version(source),
             input_name,
             input_value,
-        )
+        ])
 
-        if cache_key not in _cache:
-            input_sets = self.default_input_sets()
+    def _run(self, source, input_name, input_value):
+        input_sets = dict(self.default_input_sets())
 
-            # make sure defaults are set properly
-            values = { input_name: input_value }
-            input_set = InputSet.build_default(source, values=values)
-            input_sets[source] = input_set
+        # make sure defaults are set properly
+        values = { input_name: input_value }
+        input_set = InputSet.build_default(source, values=values)
+        input_sets[source] = input_set
 
-            _cache[cache_key] = self.runner(self.pathway, input_sets)
+        return self.runner(self.pathway.copy(), input_sets)
 
-        return _cache[cache_key]
+    def _run_step(self, idx, input_name, input_value):
+        # sources are passed to the worker processes by index
+        return self._run(self._sources[idx], input_name, input_value)
+
+    def run(self, source, input_name, input_value):
+        cache_key = self._cache_key(source, input_name, input_value)
+        value = _cache.get(cache_key)
+        if value is cache.MISSING:
+            value = self._run(source, input_name, input_value)
+            _cache.set(cache_key, value)
+
+        return value
 
     def serialize(self):
         default_input_sets = self.default_input_sets()
+
+        items = []
+        for source, inputs in self.sensitivity_inputs.items():
+            input_set = default_input_sets[source]
+            for sensitivity_input in inputs:
+                items.append((
+                    source,
+                    sensitivity_input,
+                    sensitivity_input.minimizing(input_set),
+                    sensitivity_input.maximizing(input_set),
+                ))
+
+        # identical runs (e.g. inputs whose minimizing and maximizing values
+        # are the same, or results cached by a previous analysis) are only
+        # evaluated once
+        values = {}
+        runs = {}
+        for source, sensitivity_input, minimizing, maximizing in items:
+            for input_value in [minimizing, maximizing]:
+                key = self._cache_key(source, sensitivity_input.name, input_value)
+                if key in values or key in runs:
+                    continue
+
+                value = _cache.get(key)
+                if value is not cache.MISSING:
+                    values[key] = value
+                else:
+                    runs[key] = (source, sensitivity_input.name, input_value)
+
+        calls = [('base_value', ())] + [
+            ('_run_step', (self._sources.index(source), input_name, input_value))
+            for source, input_name, input_value in runs.values()
+        ]
+        base_value, *results = _map(self, calls)
+        for key, value in zip(runs, results):
+            values[key] = value
+            _cache.set(key, value)
+
         return {
-            'base_value': self.base_value(),
+            'base_value': base_value,
             'inputs': [
-                self._serialize_input(source, input, default_input_sets)
-                for source, inputs in self.sensitivity_inputs.items()
-                for input in inputs
+                self._serialize_input(source, sensitivity_input, minimizing, maximizing, default_input_sets, values)
+                for source, sensitivity_input, minimizing, maximizing in items
             ],
         }
 
-    def _serialize_input(self, source, sensitivity_input, default_input_sets):
+    def _serialize_input(self, source, sensitivity_input, minimizing, maximizing, default_input_sets, values):
         input_set = default_input_sets[source]
         user_input = input_set.input(sensitivity_input.name)
 
-        minimizing = sensitivity_input.minimizing(input_set)
-        maximizing = sensitivity_input.maximizing(input_set)
-
         return {
             'name': sensitivity_input.name,
             'label': user_input.label,
             'default_value': input_set.value(sensitivity_input.name),
             'minimizing_value': minimizing,
             'maximizing_value': maximizing,
-            'min_value': self.run(source, sensitivity_input.name, minimizing),
-            'max_value': self.run(source, sensitivity_input.name, maximizing),
+            'min_value': values[self._cache_key(source, sensitivity_input.name, minimizing)],
+            'max_value': values[self._cache_key(source, sensitivity_input.name, maximizing)],
             'unit': user_input.unit,
             'data_lacking': sensitivity_input.data_lacking,
         }
 
 
+class GlobalSensitivityAnalysis(SensitivityAnalysis):
+    """
+    Varies all sensitivity inputs at once between their minimizing and
+    maximizing values, so that interactions between inputs are captured.
+
+    - `morris`: elementary effects over `trajectories` Morris trajectories,
+      (k + 1) evaluations each for k inputs. Returns mu, mu* and sigma.
+    - `sobol`: Saltelli sampling with `samples` base samples, N (k + 2)
+      evaluations. Returns first-order (S1) and total (ST) indices.
+
+    Inputs without a numeric range (e.g. options) take their minimizing value
+    in the lower half of the unit range and their maximizing value in the
+    upper half. Evaluations are split into chunks, run in this process or on
+    the opt-in pool of `workers` processes (see `_map`); each chunk performs
+    the same copy of the pathway repeatedly, so steps whose inputs did not
+    change between evaluations are not recomputed. The evaluations bypass
+    the results cache, which they would otherwise flush.
+
+    Evaluations failing (some combinations of inputs are not supported by
+    the models) are left out of the indices and counted in `failures`; more
+    than `max_failures` (a fraction of the evaluations) raises a
+    `RuntimeError`.
+    """
+
+    def __init__(self, pathway, runner, params=None, method='morris', trajectories=10, levels=4,
+                 samples=64, seed=None, max_failures=0.1):
+        super().__init__(pathway, runner, params=params)
+        if method not in ('morris', 'sobol'):
+            raise ValueError(f'unknown method: {method}')
+
+        self.method = method
+        self.trajectories = trajectories
+        self.levels = levels
+        self.samples = samples
+        self.seed = seed
+        self.max_failures = max_failures
+        self.failures = 0
+
+        default_input_sets = self.default_input_sets()
+        self.items = []
+        for source, inputs in self.sensitivity_inputs.items():
+            for sensitivity_input in inputs:
+                input_set = default_input_sets[source]
+                self.items.append((
+                    source,
+                    sensitivity_input,
+                    sensitivity_input.minimizing(input_set),
+                    sensitivity_input.maximizing(input_set),
+                ))
+
+    def _values(self, point):
+        """
+        Maps a point of the unit hypercube to input values.
+        """
+        res = []
+        for (_, _, minimizing, maximizing), x in zip(self.items, point):
+            if isinstance(minimizing, numbers.Number) and isinstance(maximizing, numbers.Number):
+                res.append(minimizing + x * (maximizing - minimizing))
+            else:
+                res.append(minimizing if x < 0.5 else maximizing)
+        return res
+
+    def _evaluate_chunk(self, points):
+        """
+        Returns the values at `points`, NaN where the evaluation failed, and
+        the errors of the failed evaluations.
+        """
+        pathway = self.pathway.copy()
+        default_input_sets = self.default_input_sets()
+
+        res = []
+        errors = []
+        for point in points:
+            values = {}
+            for (source, sensitivity_input, _, _), value in zip(self.items, self._values(point)):
+                values.setdefault(source, {})[sensitivity_input.name] = value
+
+            input_sets = dict(default_input_sets)
+            for source, source_values in values.items():
+                input_sets[source] = InputSet.build_default(source, values=source_values)
+
+            try:
+                res.append(self.runner(pathway, input_sets, cached=False))
+            except Exception as e:
+                res.append(math.nan)
+                errors.append(f'{type(e).__name__}: {e}')
+        return res, errors
+
+    def evaluate(self, points, chunk_size):
+        """
+        Returns the runner's value at each point of the unit hypercube.
+        Consecutive points in a chunk of `chunk_size` are evaluated in order
+        on the same pathway.
+        """
+        chunks = [points[i:i + chunk_size] for i in range(0, len(points), chunk_size)]
+        results = _map(self, [('_evaluate_chunk', (chunk,)) for chunk in chunks])
+
+        errors = [error for _, chunk_errors in results for error in chunk_errors]
+        self.failures += len(errors)
+        if len(errors) > self.max_failures * len(points):
+            raise RuntimeError(f'{len(errors)} of {len(points)} evaluations failed, e.g. {errors[0]}')
+        return np.array([value for values, _ in results for value in values], dtype=float)
+
+    def morris_points(self, rng):
+        """
+        Returns `trajectories` Morris trajectories of k + 1 points on a grid of
+        `levels` levels, as a (trajectories * (k + 1)) x k array.
+        """
+        k = len(self.items)
+        delta = self.levels / (2 * (self.levels - 1))
+        starts = np.arange(self.levels // 2) / (self.levels - 1)
+
+        points = []
+        for _ in range(self.trajectories):
+            point = rng.choice(starts, size=k)
+            # move each input up by `delta`, in random order
+            points.append(point.copy())
+            for idx in rng.permutation(k):
+                point[idx] += delta
+                points.append(point.copy())
+        return np.array(points)
+
+    def _morris(self, rng):
+        k = len(self.items)
+        delta = self.levels / (2 * (self.levels - 1))
+        points = self.morris_points(rng)
+        outputs = self.evaluate(points, chunk_size=k + 1)
+
+        effects = [[] for _ in range(k)]
+        for trajectory in range(self.trajectories):
+            offset = trajectory * (k + 1)
+            for step in range(k):
+                before, after = points[offset + step], points[offset + step + 1]
+                idx = int(np.argmax(after != before))
+                effects[idx].append((outputs[offset + step + 1] - outputs[offset + step]) / delta)
+
+        effects = np.array(effects)
+        indices = [
+            {
+                'mu': float(np.nanmean(effect)),
+                'mu_star': float(np.nanmean(np.abs(effect))),
+                'sigma': float(np.nanstd(effect, ddof=1)) if len(effect) > 1 else 0.0,
+            }
+            for effect in effects
+        ]
+        return indices, len(points)
+
+    def _sobol(self, rng):
+        k = len(self.items)
+        base = latin_hypercube(self.samples, 2 * k, rng)
+        a, b = base[:, :k], base[:, k:]
+
+        # A, B, then A with column i taken from B, for every input i
+        blocks = [a, b]
+        for idx in range(k):
+            ab = a.copy()
+            ab[:, idx] = b[:, idx]
+            blocks.append(ab)
+        points = np.concatenate(blocks)
+        outputs = self.evaluate(points, chunk_size=max(1, self.samples // 4))
+        outputs = outputs.reshape(k + 2, self.samples)
+
+        f_a, f_b = outputs[0], outputs[1]
+        variance = np.nanvar(np.concatenate([f_a, f_b]))
+        indices = []
+        for idx in range(k):
+            f_ab = outputs[idx + 2]
+            if variance == 0:
+                indices.append({'S1': 0.0, 'ST': 0.0})
+                continue
+
+            # Saltelli (2010) first-order and Jansen total-effect estimators
+            indices.append({
+                'S1': float(np.nanmean(f_b * (f_ab - f_a)) / variance),
+                'ST': float(0.5 * np.nanmean((f_a - f_ab) ** 2) / variance),
+            })
+        return indices, len(points)
+
+    def serialize(self):
+        rng = np.random.default_rng(self.seed)
+        self.failures = 0
+        if self.method == 'morris':
+            indices, evaluations = self._morris(rng)
+        else:
+            indices, evaluations = self._sobol(rng)
+
+        default_input_sets = self.default_input_sets()
+        inputs = []
+        for (source, sensitivity_input, minimizing, maximizing), item_indices in zip(self.items, indices):
+            user_input = default_input_sets[source].input(sensitivity_input.name)
+            inputs.append({
+                'name': sensitivity_input.name,
+                'label': user_input.label,
+                'minimizing_value': minimizing,
+                'maximizing_value': maximizing,
+                'unit': user_input.unit,
+                **item_indices,
+            })
+
+        return {
+            'method': self.method,
+            'base_value': self.base_value(),
+            'evaluations': evaluations,
+            'failures': self.failures,
+            'inputs': inputs,
+        }
+
+
 if __name__ == '__main__':
     from core.pathway import Pathway
     import pathway.topology
@@ -1,11 +1,13 @@
+from functools import partial
 import os
 import pandas as pd
 import numpy as np
 import math
-import matplotlib.pyplot as plt
 from analysis.system.grid.grid import Grid
 from core import validators, conditionals
 from core.common import InputSource, Versioned
+from core import catalog
+from core.utils import LazyData
 from core.inputs import ContinuousInput, OptionsInput, Default, InputSet, Option, InputGroup, ShareTableInput, Tooltip
 
 PATH = os.getcwd() + '/analysis/system/fleet/'
@@ -15,7 +17,9 @@ SIZES = [
     { 'name': 'LT', 'label': 'Light Truck' },
 ]
 REGIONS = ['US', 'US, California', 'US, Texas', 'US, New York', 'Norway']
-FLEET_DATA = pd.read_csv(PATH + "fleet_data.csv", index_col='year')
+DATA = LazyData({
+    'fleet': partial(catalog.read_csv, PATH + "fleet_data.csv", index_col='year'),
+})
 
 base_year, projected_year = [2019, 2050]
 
@@ -38,10 +42,10 @@ def sales_share_defaults(powertrain, size, year):
         return f'f_{powertrain}_{size}_{region_keys[region]}_{msps}'
 
     def default_value(region):
-        return percent_value(FLEET_DATA[column_name(region, 'default')][base_year])
+        return percent_value(DATA['fleet'][column_name(region, 'default')][base_year])
 
     def projected_value(region, msps):
-        return percent_value(FLEET_DATA[column_name(region, msps)][projected_year])
+        return percent_value(DATA['fleet'][column_name(region, msps)][projected_year])
 
     if year == base_year:
         return [
@@ -62,7 +66,7 @@ def sales_share_defaults(powertrain, size, year):
             )
             for region in REGIONS
             for msps in ['AEO20', '2035_ICE_ban', '~BNEF20']
-            if column_name(region, msps) in FLEET_DATA.columns
+            if column_name(region, msps) in DATA['fleet'].columns
         ] + [
             Default(
                 default_value(region),
@@ -497,11 +501,11 @@ class FleetModel(InputSource, Versioned):
     # defined to conform to `core.common.InputSource` interface
     @classmethod
     def inputs(cls):
-        return cls.user_inputs()
+        return super().inputs()
 
     def __init__(self):
-        self.fleet_data = FLEET_DATA
-        self.defaults = pd.read_csv(PATH + 'fleet_defaults.csv')
+        self.fleet_data = DATA['fleet']
+        self.defaults = catalog.read_csv(PATH + 'fleet_defaults.csv')
         self.lowest_year = 1970
         self.highest_year = 2050
         self.initial_year = 2000
@@ -1043,7 +1047,7 @@ class FleetModel(InputSource, Versioned):
         half_life.loc[:,'A'] = np.concatenate((half_life_historical.values,half_life_future.values),axis =0)
 
         self.cutoff_life = 50
-        survival_defaults = pd.read_csv(PATH + 'age_defaults.csv',index_col=['age'])
+        survival_defaults = catalog.read_csv(PATH + 'age_defaults.csv',index_col=['age'])
 
         for model in model_years:
             model_half_life = half_life.loc[model, :].values
@@ -1528,7 +1532,7 @@ class FleetModel(InputSource, Versioned):
 
     def lifecycle_e_per_d(self, lifetime, d_car, d_cum, fleet_data, fuel_dist_new, I_grid):
 
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
         #for pt in ['ICEG','HEV','PHEVf']:
         #    #updates default value based on biofuel inputs
         #   emissions_defaults.loc[pt,'I_TP'] =  self.I_TP_biofuel
@@ -1667,7 +1671,7 @@ class FleetModel(InputSource, Versioned):
         I_TP_gas = 264.168 # gCO2e/kWh, "MIT Insights into Future Mobility, assumes US average crude & refinery"
         I_TP_ethanol = 0 #gCO2e/kWh, https://iopscience.iop.org/article/10.1088/1748-9326/abde08/pdf
         #Gasoline CFP
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
         gas_prod_e = emissions_defaults['I_CFP'].loc['ICEG']
 
 
@@ -1727,12 +1731,12 @@ class FleetModel(InputSource, Versioned):
         d_new, d_car, d_cumulative = self.compute_d_car()
         # I_grid = self.compute_grid_intensity()
         delta_c = self.capacity_change_calc(d_cumulative)
-        batt_cap_table = pd.read_csv(PATH + 'batt_cap.csv',index_col = ['size'])
+        batt_cap_table = catalog.read_csv(PATH + 'batt_cap.csv',index_col = ['size'])
 
         #Computes TP and CFP emissions for biofuel blends
         I_biofuel, self.bio_frac_vol_y, self.GG_kWh_y = self.compute_biofuel_emissions(self.biofuel_perc_vol_2050, self.bio_fuel_prod_e)
         #print(self.bio_frac_vol_y)
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
         self.I_TP_pt_y = pd.DataFrame(0,index=np.arange(self.initial_year, self.final_year+1),columns=emissions_defaults.index)
         self.I_CFP_pt_y = pd.DataFrame(0, index=np.arange(self.initial_year, self.final_year + 1),columns=emissions_defaults.index)
 
@@ -1940,7 +1944,7 @@ class FleetModel(InputSource, Versioned):
         frac_LT_2020 = F_LT['F_LT'].loc[2020] / 100
         frac_LT_2030 = F_LT['F_LT'].loc[2030] / 100
 
-        e_sedan_2020, e_LT_2020, e_avg_2020, e_sedan_2030, e_LT_2030, e_avg_2030 = self.lifecycle_e_per_d(18, d_car, d_cumulative, FLEET_DATA, fuel_dist_new, I_grid)
+        e_sedan_2020, e_LT_2020, e_avg_2020, e_sedan_2030, e_LT_2030, e_avg_2030 = self.lifecycle_e_per_d(18, d_car, d_cumulative, DATA['fleet'], fuel_dist_new, I_grid)
 
         ## Calculating other RHS Variables
         tot_cars = stocks_plot.sum(axis = 1)
@@ -2098,9 +2102,9 @@ class FleetModel(InputSource, Versioned):
         model_years = np.arange(self.lowest_year, self.final_year + 1)
         F = pd.DataFrame(index=years, columns=['m_' + str(year) for year in model_years])
         F_new = pd.DataFrame(index=model_years,columns =['F'])
-        self.F_VIS_derates = pd.read_csv(PATH + "F_VIS_derates.csv", index_col='size')
+        self.F_VIS_derates = catalog.read_csv(PATH + "F_VIS_derates.csv", index_col='size')
         delta_efficiency = 0.65
-        self.subregion_data = pd.read_csv(PATH + "subregion_data.csv", index_col='Region')
+        self.subregion_data = catalog.read_csv(PATH + "subregion_data.csv", index_col='Region')
 
         column = powertrain + '_' + size
         # Past years which always pick from the default source
@@ -2148,7 +2152,7 @@ class FleetModel(InputSource, Versioned):
 
         model_years = np.arange(self.initial_year, self.final_year + 1)
         I = pd.DataFrame(index=model_years)
-        historical_em = pd.read_csv(PATH + 'historical_emissions.csv',index_col = ['year'])
+        historical_em = catalog.read_csv(PATH + 'historical_emissions.csv',index_col = ['year'])
         I.loc[self.initial_year:self.baseline_year, 'I'] = historical_em.loc[self.initial_year:self.baseline_year,self.region].values
         # I['I'] = self.fleet_data.loc[self.initial_year:self.baseline_year, 'CI' + self.pick_sources('CI')]
         if 'Fuel' in self.emissions_view:
@@ -2174,7 +2178,7 @@ class FleetModel(InputSource, Versioned):
 
     def compute_emissions(self, powertrain, fuel_total, I_grid):
 
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv',index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv',index_col=['fuel'])
         #for pt in ['ICEG','HEV','PHEVf']:
         #    # updates default value based on biofuel inputs
         #    emissions_defaults.loc[pt,'I_TP'] =  self.I_TP_biofuel
@@ -2227,7 +2231,7 @@ class FleetModel(InputSource, Versioned):
         return delta_c
 
     def compute_car_prod(self, I_grid, sales, column):
-        c_tsy_onecar = FLEET_DATA.loc[self.initial_year:self.final_year,column]
+        c_tsy_onecar = DATA['fleet'].loc[self.initial_year:self.final_year,column]
         years = np.arange(self.initial_year, self.final_year + 1)
         c_tsy = pd.DataFrame(index= years, columns = [column])
         I_2014 = I_grid.loc[2014,:].values[0]
@@ -1,10 +1,12 @@
+from functools import partial
 import os
 import pandas as pd
 import numpy as np
 import math
-import matplotlib.pyplot as plt
 from analysis.system.grid.grid import Grid
 from core import validators, conditionals
+from core import catalog
+from core.utils import LazyData
 from core.inputs import ContinuousInput, OptionsInput, Default, InputSet, Option, Tooltip
 PATH = os.getcwd() + '/analysis/system/fleet/'
 POWERTRAINS = ['ICEG', 'ICED', 'HEV', 'PHEV', 'BEV', 'FCEV']
@@ -13,12 +15,14 @@ SIZES = [
     { 'name': 'LT', 'label': 'Light Truck' },
 ]
 REGIONS = ['US', 'US, California', 'US, Texas', 'US, New York', 'Norway']
-FLEET_DATA = pd.read_csv(PATH + "fleet_data.csv", index_col='year')
+DATA = LazyData({
+    'fleet': partial(catalog.read_csv, PATH + "fleet_data.csv", index_col='year'),
+})
 class FleetModel:
     @classmethod
     def market_share(cls):
         res = []
-        columns = list(FLEET_DATA.columns)
+        columns = list(DATA['fleet'].columns)
         def value(x):
             if np.isnan(x):
                 return 0
@@ -35,7 +39,7 @@ class FleetModel:
             for powertrain in POWERTRAINS:
                 for size in [size['name'] for size in SIZES]:
                     default_column = f'f_{powertrain}_{size}_{region_key}_default'
-                    default_value = value(FLEET_DATA[default_column][2019])
+                    default_value = value(DATA['fleet'][default_column][2019])
                     # static
                     res.append({
                         'powertrain': powertrain,
@@ -56,7 +60,7 @@ class FleetModel:
                     for msps in ['AEO20', '2035_ICE_ban', '~BNEF20']:
                         msps_column = f'f_{powertrain}_{size}_{region_key}_{msps}'
                         if msps_column in columns:
-                            projected_value = value(FLEET_DATA[msps_column][2050])
+                            projected_value = value(DATA['fleet'][msps_column][2050])
                             res.append({
                                 'powertrain': powertrain,
                                 'size': size,
@@ -356,8 +360,8 @@ class FleetModel:
         ]
 
     def __init__(self):
-        self.fleet_data = FLEET_DATA
-        self.defaults = pd.read_csv(PATH + 'fleet_defaults.csv')
+        self.fleet_data = DATA['fleet']
+        self.defaults = catalog.read_csv(PATH + 'fleet_defaults.csv')
         self.lowest_year = 1970
         self.highest_year = 2050
         self.initial_year = 2000
@@ -899,7 +903,7 @@ class FleetModel:
         half_life.loc[:,'A'] = np.concatenate((half_life_historical.values,half_life_future.values),axis =0)
 
         self.cutoff_life = 50
-        survival_defaults = pd.read_csv(PATH + 'age_defaults.csv',index_col=['age'])
+        survival_defaults = catalog.read_csv(PATH + 'age_defaults.csv',index_col=['age'])
         for model in model_years:
             for curr in years:
                 a = curr - model
@@ -1370,7 +1374,7 @@ class FleetModel:
 
     def lifecycle_e_per_d(self, lifetime, d_car, d_cum, fleet_data, fuel_dist_new, I_grid):
 
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
         #for pt in ['ICEG','HEV','PHEVf']:
         #    #updates default value based on biofuel inputs
         #   emissions_defaults.loc[pt,'I_TP'] =  self.I_TP_biofuel
@@ -1509,7 +1513,7 @@ class FleetModel:
         I_TP_gas = 264.168 # gCO2e/kWh, "MIT Insights into Future Mobility, assumes US average crude & refinery"
         I_TP_ethanol = 0 #gCO2e/kWh, https://iopscience.iop.org/article/10.1088/1748-9326/abde08/pdf
         #Gasoline CFP
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
         gas_prod_e = emissions_defaults['I_CFP'].loc['ICEG']
 
 
@@ -1569,12 +1573,12 @@ class FleetModel:
         d_new, d_car, d_cumulative = self.compute_d_car()
         # I_grid = self.compute_grid_intensity()
         delta_c = self.capacity_change_calc(d_cumulative)
-        batt_cap_table = pd.read_csv(PATH + 'batt_cap.csv',index_col = ['size'])
+        batt_cap_table = catalog.read_csv(PATH + 'batt_cap.csv',index_col = ['size'])
 
         #Computes TP and CFP emissions for biofuel blends
         I_biofuel, self.bio_frac_vol_y, self.GG_kWh_y = self.compute_biofuel_emissions(self.biofuel_perc_vol_2050, self.bio_fuel_prod_e)
         #print(self.bio_frac_vol_y)
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv', index_col=['fuel'])
         self.I_TP_pt_y = pd.DataFrame(0,index=np.arange(self.initial_year, self.final_year+1),columns=emissions_defaults.index)
         self.I_CFP_pt_y = pd.DataFrame(0, index=np.arange(self.initial_year, self.final_year + 1),columns=emissions_defaults.index)
 
@@ -1783,7 +1787,7 @@ class FleetModel:
         frac_LT_2020 = F_LT['F_LT'].loc[2020] / 100
         frac_LT_2030 = F_LT['F_LT'].loc[2030] / 100
 
-        e_sedan_2020, e_LT_2020, e_avg_2020, e_sedan_2030, e_LT_2030, e_avg_2030 = self.lifecycle_e_per_d(18, d_car, d_cumulative, FLEET_DATA, fuel_dist_new, I_grid)
+        e_sedan_2020, e_LT_2020, e_avg_2020, e_sedan_2030, e_LT_2030, e_avg_2030 = self.lifecycle_e_per_d(18, d_car, d_cumulative, DATA['fleet'], fuel_dist_new, I_grid)
 
         ## Calculating other RHS Variables
         tot_cars = stocks_plot.sum(axis = 1)
@@ -1924,9 +1928,9 @@ class FleetModel:
         model_years = np.arange(self.lowest_year, self.final_year + 1)
         F = pd.DataFrame(index=years, columns=['m_' + str(year) for year in model_years])
         F_new = pd.DataFrame(index=model_years,columns =['F'])
-        self.F_VIS_derates = pd.read_csv(PATH + "F_VIS_derates.csv", index_col='size')
+        self.F_VIS_derates = catalog.read_csv(PATH + "F_VIS_derates.csv", index_col='size')
         delta_efficiency = 0.65
-        self.subregion_data = pd.read_csv(PATH + "subregion_data.csv", index_col='Region')
+        self.subregion_data = catalog.read_csv(PATH + "subregion_data.csv", index_col='Region')
 
         column = powertrain + '_' + size
         # Past years which always pick from the default source
@@ -1965,7 +1969,7 @@ class FleetModel:
 
         model_years = np.arange(self.initial_year, self.final_year + 1)
         I = pd.DataFrame(index=model_years)
-        historical_em = pd.read_csv(PATH + 'historical_emissions.csv',index_col = ['year'])
+        historical_em = catalog.read_csv(PATH + 'historical_emissions.csv',index_col = ['year'])
         I.loc[self.initial_year:self.baseline_year, 'I'] = historical_em.loc[self.initial_year:self.baseline_year,self.region].values
         # I['I'] = self.fleet_data.loc[self.initial_year:self.baseline_year, 'CI' + self.pick_sources('CI')]
         if 'Fuel' in self.emissions_view:
@@ -1991,7 +1995,7 @@ class FleetModel:
 
     def compute_emissions(self, powertrain, fuel_total, I_grid):
 
-        emissions_defaults = pd.read_csv(PATH + 'emission_intensity_defaults.csv',index_col=['fuel'])
+        emissions_defaults = catalog.read_csv(PATH + 'emission_intensity_defaults.csv',index_col=['fuel'])
         #for pt in ['ICEG','HEV','PHEVf']:
         #    # updates default value based on biofuel inputs
         #    emissions_defaults.loc[pt,'I_TP'] =  self.I_TP_biofuel
@@ -2044,7 +2048,7 @@ class FleetModel:
         return delta_c
 
     def compute_car_prod(self, I_grid, sales, column):
-        c_tsy_onecar = FLEET_DATA.loc[self.initial_year:self.final_year,column]
+        c_tsy_onecar = DATA['fleet'].loc[self.initial_year:self.final_year,column]
         years = np.arange(self.initial_year, self.final_year + 1)
         c_tsy = pd.DataFrame(index= years, columns = [column])
         I_2014 = I_grid.loc[2014,:].values[0]
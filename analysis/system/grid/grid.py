@@ -1,14 +1,15 @@
+from functools import partial
 import os
 import json
 import os
 import pandas as pd
 from core.pathway import Step, Pathway
-from core.utils import yes_no
+from core import catalog
+from core.utils import LazyData, yes_no
 import analysis.lca as lca_analysis
 import argparse
 import numpy as np
 import math
-import matplotlib.pyplot as plt
 
 # make sure the topology registries are loaded
 import pathway.topology
@@ -19,7 +20,9 @@ from core.inputs import ContinuousInput, OptionsInput, Default, InputSet, Option
 
 PATH = os.getcwd() + '/analysis/system/grid/'
 
-DEFAULT_DATA = D_table = pd.read_csv(PATH + 'Defaults.csv', index_col=['year'])
+DATA = LazyData({
+    'defaults': partial(catalog.read_csv, PATH + 'Defaults.csv', index_col=['year']),
+})
 
 power_sources = ['Coal', 'Natural gas', 'Solar', 'Wind', 'Nuclear', 'Hydro', 'Other']
 regions = ['US, California', 'US, Florida', 'US, New York', 'US, Northeast', 'US, Texas']
@@ -45,7 +48,7 @@ def generation_share_defaults(power_source, year):
         return f'{power_source}_{region_keys[region]}_{pgm}'
 
     def default_value(region, power_source, pgm):
-        return int(percentage(DEFAULT_DATA[column_name(power_source, region, pgm)][year], f=round))
+        return int(percentage(DATA['defaults'][column_name(power_source, region, pgm)][year], f=round))
 
     return [
         Default(
@@ -57,7 +60,7 @@ def generation_share_defaults(power_source, year):
         )
         for region in regions
         for pgm in ['AEO20']
-        if column_name(region, power_source, pgm) in DEFAULT_DATA.columns
+        if column_name(region, power_source, pgm) in DATA['defaults'].columns
     ]
 
 class Grid(InputSource, Versioned):
@@ -266,9 +269,9 @@ class Grid(InputSource, Versioned):
             ]
 
     def __init__(self):
-        self.smokestack_data = pd.read_csv(PATH + 'intensity_proj.csv', index_col = ['year'])
-        self.cp = pd.read_csv(PATH + 'charging_profiles.csv', index_col = ['hour'])
-        self.cp_parameters = pd.read_csv(PATH + 'cp_parameters.csv', index_col=['name'])
+        self.smokestack_data = catalog.read_csv(PATH + 'intensity_proj.csv', index_col = ['year'])
+        self.cp = catalog.read_csv(PATH + 'charging_profiles.csv', index_col = ['hour'])
+        self.cp_parameters = catalog.read_csv(PATH + 'cp_parameters.csv', index_col=['name'])
         self.powertypes = ["Coal", "Natural gas", "Solar", "Wind", "Nuclear", "Hydro"]
         self.lca_defaults = pd.DataFrame(0, index=self.powertypes, columns=['S', 'F', 'P_S'])
         # self.lca_defaults = pd.read_csv(PATH + 'lca_defaults.csv', index_col = ['Source'])
@@ -562,8 +565,8 @@ class Grid(InputSource, Versioned):
 
         nuclear = np.divide((np.ones((24)) * 1 / 24), Dh[self.region].values.flatten()) * fp[
             'Nuclear']
-        self.solar_gen = pd.read_csv(PATH + 'Solar_gen.csv', index_col=['hour'])
-        self.wind_gen = pd.read_csv(PATH + 'Wind_gen.csv', index_col=['hour'])
+        self.solar_gen = catalog.read_csv(PATH + 'Solar_gen.csv', index_col=['hour'])
+        self.wind_gen = catalog.read_csv(PATH + 'Wind_gen.csv', index_col=['hour'])
         solar = self.solar_gen[self.region].divide(Dh[self.region]).values.flatten() * fp['Solar']
         wind = self.wind_gen[self.region].divide(Dh[self.region]).values.flatten() * fp['Wind']
         f_nondisp_h = solar + wind + nuclear
@@ -611,7 +614,7 @@ class Grid(InputSource, Versioned):
         #Projection of non-EV power demand
         if self.PBD == "AEO20":
             #Looks up data
-            D_table = pd.read_csv(PATH + 'D_' + self.region + '_' + self.PBD + '.csv', index_col=['year'])
+            D_table = catalog.read_csv(PATH + 'D_' + self.region + '_' + self.PBD + '.csv', index_col=['year'])
             D = D_table.copy().filter(items = ['D','D_nEV','D_EV'])
             D['D_EV'] = D_EV_vals
         elif self.PBD == "User":
@@ -624,7 +627,7 @@ class Grid(InputSource, Versioned):
 
         PBGM = self.PGM
         if PBGM == "AEO20": # if self.PBGM == "AEO20":
-            D_table = pd.read_csv(PATH + 'D_' + self.region + '_' + PBGM + '.csv', index_col=['year'])
+            D_table = catalog.read_csv(PATH + 'D_' + self.region + '_' + PBGM + '.csv', index_col=['year'])
             f_p = D_table.loc[:,["Coal","Natural gas","Solar","Wind","Nuclear","Hydro","Other"]].copy()
             if self.model == "fleet":
                 ap = pd.DataFrame(
@@ -645,7 +648,7 @@ class Grid(InputSource, Versioned):
         output = (f_p.multiply(D['D'], axis=0) + ap.multiply(delta_D, axis=0)).divide(D['D_updated'], axis=0)
 
         #output = (f_p.multiply(D['D'], axis = 0) + ap.multiply(D['D_EV'], axis = 0)).divide(D['D_updated'], axis = 0)
-        D_nEV_h = pd.read_csv(PATH + 'Dhist.csv', index_col=['hour']).filter([self.region])
+        D_nEV_h = catalog.read_csv(PATH + 'Dhist.csv', index_col=['hour']).filter([self.region])
 
         D_EV_h_y = pd.DataFrame(0, index=np.arange(1,25), columns=years)
         Dh = pd.Series(data=0,index=years,dtype=object)
@@ -833,8 +836,8 @@ class Grid(InputSource, Versioned):
         '''
 
         # Reads data
-        self.D_past = pd.read_csv(PATH + 'D_past.csv', index_col=['year']) #Total demand
-        self.D_EV_past = pd.read_csv(PATH + 'D_EV_past.csv', index_col=['year']) #EV damand
+        self.D_past = catalog.read_csv(PATH + 'D_past.csv', index_col=['year']) #Total demand
+        self.D_EV_past = catalog.read_csv(PATH + 'D_EV_past.csv', index_col=['year']) #EV damand
 
         D0 = self.D_past[region][y0] #Total non-EV demand for specicif regi0on in year y0
         D_EV0 = self.D_EV_past[region][y0] #Total EV demand for specicif regi0on in year y0
@@ -862,8 +865,8 @@ class Grid(InputSource, Versioned):
         '''
 
         #Looks up population data since computed on per capita basis, see equations
-        self.pop_past = pd.read_csv(PATH + 'pop_past.csv', index_col=['year'])
-        self.P_P0 = pd.read_csv(PATH + 'pop_future.csv', index_col=['year'])
+        self.pop_past = catalog.read_csv(PATH + 'pop_past.csv', index_col=['year'])
+        self.P_P0 = catalog.read_csv(PATH + 'pop_future.csv', index_col=['year'])
 
         P0 = self.pop_past[region][y0]
         P = self.P_P0[region].values * P0
@@ -909,7 +912,7 @@ class Grid(InputSource, Versioned):
         i_col = 0
 
 
-        fpb0 = pd.read_csv(PATH + 'fpb0_' + self.region + '.csv', index_col=['year'])
+        fpb0 = catalog.read_csv(PATH + 'fpb0_' + self.region + '.csv', index_col=['year'])
 
         if speed == 'Slow':
             s = -1
@@ -988,8 +991,8 @@ class Grid(InputSource, Versioned):
 
         elif objective == 'Minimize storage, then flatten demand':
 
-            solar_gen = pd.read_csv(PATH + 'Solar_gen.csv', index_col=['hour'])
-            wind_gen = pd.read_csv(PATH + 'Wind_gen.csv', index_col=['hour'])
+            solar_gen = catalog.read_csv(PATH + 'Solar_gen.csv', index_col=['hour'])
+            wind_gen = catalog.read_csv(PATH + 'Wind_gen.csv', index_col=['hour'])
 
             solar = solar_gen[self.region].values.flatten() * f_sol
             wind = wind_gen[self.region].values.flatten() * f_wind
@@ -1033,8 +1036,8 @@ class Grid(InputSource, Versioned):
 
         elif objective == 'Minimize storage, then flatten dispatchable generation':
 
-            solar_gen = pd.read_csv(PATH + 'Solar_gen.csv', index_col=['hour'])
-            wind_gen = pd.read_csv(PATH + 'Wind_gen.csv', index_col=['hour'])
+            solar_gen = catalog.read_csv(PATH + 'Solar_gen.csv', index_col=['hour'])
+            wind_gen = catalog.read_csv(PATH + 'Wind_gen.csv', index_col=['hour'])
 
             solar = solar_gen[self.region].values.flatten() * f_sol
             wind = wind_gen[self.region].values.flatten() * f_wind
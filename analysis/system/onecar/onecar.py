@@ -5,7 +5,7 @@ import numpy as np
 
 import math
 
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 from core.inputs import ContinuousInput, OptionsInput, Default, CategoricalInput
 
 # PATH = os.getcwd() + '/'
@@ -41,7 +41,7 @@ class OneCar:
         # ui_dict = {'car_type': 'BEV', 'Region': 'Florida', 'City': 'Orlando', 'Vehicle Size': 'Sedan',
         #            'Vehicle MPG': 'Representative Vehicle-TESLA Model 3 Mid Range Auto-1 2WD MPG(128 city/117 hw)',
         #            'MPG_city': 128, 'MPG_hw': 117, 'f_city': 0.55, 'Charge Profile': 'Constant'}
-        inputs = pd.read_csv(PATH + 'inputs.csv')
+        inputs = catalog.read_csv(PATH + 'inputs.csv')
 
         # Powertrain Input
         print("Enter Powertrain type:")
@@ -74,7 +74,7 @@ class OneCar:
             print("Enter highway MPG:")
             self.mpg_hw = float(input())
         else:
-            models_list = pd.read_csv(self.size + '_' + self.car_type + '.csv')
+            models_list = catalog.read_csv(self.size + '_' + self.car_type + '.csv')
             print("Choose Vehicle Model:")
             print(models_list['Vehicle Model'].to_string(header=None))
             x = int(input())
@@ -86,14 +86,14 @@ class OneCar:
         self.f_city = float(input())
 
     def read_vars(self):
-        self.location_matrix = pd.read_csv(PATH + self.region + '.csv')
-        self.T = pd.read_csv(PATH + 'Temperatures' + '.csv', usecols=[self.city]).rename(columns={self.city: 'T'})
+        self.location_matrix = catalog.read_csv(PATH + self.region + '.csv')
+        self.T = catalog.read_csv(PATH + 'Temperatures' + '.csv', usecols=[self.city]).rename(columns={self.city: 'T'})
 
         self.p = self.location_matrix.filter(['dy', 'coal', 'hydro', 'gas', 'nuclear', 'petroleum', 'wind', 'solar', 'other'])
         self.p.loc[:, 'solar'] = self.p.loc[:, 'solar'] * (1.476)
         self.I_f = self.location_matrix.filter(['I_f'])
 
-        self.final = pd.read_csv(PATH + 'final.csv', index_col='dy')
+        self.final = catalog.read_csv(PATH + 'final.csv', index_col='dy')
         self.time = self.location_matrix.filter(['hd', 'dw'])
 
     def emission_intensity(self):
@@ -108,8 +108,8 @@ class OneCar:
         return I
 
     def cp(self):
-        charge_profile = pd.read_csv('charge_profile.csv', index_col=['hd'])
-        dist_profile = pd.read_csv('dist_profile.csv', index_col=['hd'])
+        charge_profile = catalog.read_csv('charge_profile.csv', index_col=['hd'])
+        dist_profile = catalog.read_csv('dist_profile.csv', index_col=['hd'])
         epsilon = pd.DataFrame(columns=['e', 'd'], index=self.time.index)
         cp_weekday = self.cptype + '_weekday'
         cp_weekend = self.cptype + '_weekend'
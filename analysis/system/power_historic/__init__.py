@@ -1,16 +1,44 @@
+import os
+
+from core import cache
 from core.inputs import CategoricalInput, ContinuousInput, OptionsInput
-from core.system import SystemAnalysis
+from core.system import SystemAnalysis, versioned
 from analysis.system.power_historic.queries import queries
 
 analyses = {}
 
-states = [row['state'] for row in queries.states()]
-if len(states) == 0:
-    # data must not be populated in the database
-    # add a placeholder
-    states.append('<placeholder>')
+# checked at most every DATA_VERSION_TTL seconds
+_data_version = cache.LRUCache(maxsize=1, ttl=float(os.environ.get('DATA_VERSION_TTL') or 10))
+
+def data_version():
+    """
+    Version of the ARP aggregates, bumped by their refresh.
+    """
+    version = _data_version.get('arp')
+    if version is cache.MISSING:
+        version = queries.data_version(name='arp')
+        _data_version.set('arp', version)
+    return version
+
+# queried when the inputs are first needed rather than on import
+@versioned(data_version)
+def states():
+    res = [row['state'] for row in queries.states()]
+    if len(res) == 0:
+        # data must not be populated in the database
+        # add a placeholder
+        res.append('<placeholder>')
+    return res
+
+def user_inputs():
+    return [
+        OptionsInput('state', 'State', options=states()),
+        CategoricalInput('start_year', 'Start year'),
+        CategoricalInput('end_year', 'End year'),
+    ]
 
 # FIXME: need to filter based on state
+@versioned(data_version)
 def years():
     year_range = queries.year_range()
     res = []
@@ -21,11 +49,7 @@ def years():
 analyses['hourly_generation'] = SystemAnalysis(
     'hourly_generation',
     queries.hourly_generation,
-    [
-        OptionsInput('state', 'State', options=states),
-        CategoricalInput('start_year', 'Start year'),
-        CategoricalInput('end_year', 'End year'),
-    ],
+    user_inputs,
     {
         'x': 'hour',
         'y': [
@@ -42,17 +66,14 @@ analyses['hourly_generation'] = SystemAnalysis(
                 'unit': 'tons',
             }
         ],
-    }
+    },
+    version=data_version,
 )
 
 analyses['yearly_generation'] = SystemAnalysis(
     'yearly_generation',
     queries.yearly_generation,
-    [
-        OptionsInput('state', 'State', options=states),
-        CategoricalInput('start_year', 'Start year'),
-        CategoricalInput('end_year', 'End year'),
-    ],
+    user_inputs,
     {
         'x': 'year',
         'y': [
@@ -63,5 +84,6 @@ analyses['yearly_generation'] = SystemAnalysis(
                 'unit': 'tons CO₂ / MW',
             }
         ],
-    }
+    },
+    version=data_version,
 )
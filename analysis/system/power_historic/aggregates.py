@@ -0,0 +1,183 @@
+"""
+Maintenance of the aggregates of the ARP data, `arp_egrid_capacity` and
+`arp_generation`, by (year, state) partition: only the partitions of the
+files imported since they were last refreshed (according to the
+`arp_ingestion_log`) are recomputed.
+"""
+import core.db as db
+from datetime import datetime
+import time
+
+import settings
+
+REFRESH_CAPACITY = '''
+    DELETE FROM arp_egrid_capacity WHERE year = %(year)s AND state = %(state)s;
+
+    INSERT INTO arp_egrid_capacity (
+        year, plant_id, unit, generation, max_generation, so2, nox, co2, heat,
+        state, orispl, capacity_mw, prime_mover, fuel_type, nameplate_capacity
+    )
+    SELECT
+        %(year)s,
+        arp.plant_id,
+        arp.unit,
+        sum(arp.gload),
+        max(arp.gload),
+        sum(arp.so2_mass),
+        sum(arp.nox_mass),
+        sum(arp.co2_mass),
+        sum(arp.heat_input),
+        grid_unit_genmap.state,
+        grid_unit_genmap.orispl,
+        grid_unit_genmap.capacity_mw,
+        grid_unit_genmap.gen_prime_mover,
+        grid_unit_genmap.gen_fuel,
+        greatest(max(arp.gload), grid_unit_genmap.capacity_mw)
+    FROM arp
+    JOIN grid_unit_genmap
+        ON arp.plant_id = grid_unit_genmap.plant_id
+        AND arp.unit = grid_unit_genmap.unit
+    WHERE
+        arp.timestamp >= %(start)s
+        AND arp.timestamp < %(end)s
+        AND grid_unit_genmap.state = %(state)s
+    GROUP BY
+        arp.plant_id,
+        arp.unit,
+        grid_unit_genmap.gen_prime_mover,
+        grid_unit_genmap.capacity_mw,
+        grid_unit_genmap.state,
+        grid_unit_genmap.orispl,
+        grid_unit_genmap.gen_fuel;
+'''
+
+# as `arp_lf` aggregated, for the hours of the year only
+REFRESH_GENERATION = '''
+    DELETE FROM arp_generation WHERE year = %(year)s AND state = %(state)s;
+
+    INSERT INTO arp_generation (year, hour, generation, so2, nox, co2, heat, total_capacity, state, status, type)
+    SELECT
+        arp_egrid_capacity.year,
+        date_part('hour', arp.timestamp) AS hour,
+        sum(arp.gload),
+        sum(arp.so2_mass),
+        sum(arp.nox_mass),
+        sum(arp.co2_mass),
+        sum(arp.heat_input),
+        sum(arp_egrid_capacity.nameplate_capacity),
+        arp_egrid_capacity.state,
+        loading_fraction.status,
+        loading_fraction.type
+    FROM arp
+    INNER JOIN arp_egrid_capacity ON
+        arp_egrid_capacity.year = %(year)s
+        AND arp_egrid_capacity.state = %(state)s
+        AND arp_egrid_capacity.plant_id = arp.plant_id
+        AND arp_egrid_capacity.unit = arp.unit
+    INNER JOIN loading_fraction ON
+        arp_bucket(arp.gload / arp_egrid_capacity.nameplate_capacity, arp_egrid_capacity.prime_mover) = loading_fraction.loading_fraction
+        AND arp_egrid_capacity.prime_mover = loading_fraction.prime_mover
+    WHERE
+        arp.timestamp >= %(start)s
+        AND arp.timestamp < %(end)s
+        AND arp_egrid_capacity.nameplate_capacity IS NOT NULL
+        AND arp_egrid_capacity.nameplate_capacity <> 0
+    GROUP BY
+        hour,
+        arp_egrid_capacity.year,
+        arp_egrid_capacity.state,
+        loading_fraction.status,
+        loading_fraction.type;
+'''
+
+
+def pending(connection):
+    """
+    Returns the (year, state) partitions with files imported since they were
+    last refreshed.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            SELECT DISTINCT year, upper(state)
+            FROM arp_ingestion_log
+            WHERE status = 'done' AND refreshed_at IS DISTINCT FROM finished_at
+            ORDER BY 1, 2
+        ''')
+        return cursor.fetchall()
+
+
+def partitions(connection):
+    """
+    Returns all the (year, state) partitions of the ARP data.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            SELECT DISTINCT date_part('year', arp.timestamp)::integer, grid_unit_genmap.state
+            FROM arp
+            JOIN grid_unit_genmap
+                ON arp.plant_id = grid_unit_genmap.plant_id
+                AND arp.unit = grid_unit_genmap.unit
+            ORDER BY 1, 2
+        ''')
+        return cursor.fetchall()
+
+
+def refresh_partition(connection, year, state):
+    """
+    Recomputes the aggregates of `state` (e.g. 'CA') for `year`, marks the
+    files of the partition as refreshed and bumps the 'arp' data version, in
+    one transaction.
+    """
+    with connection.cursor() as cursor:
+        # the imports finished before the refresh started: those finishing
+        # during the refresh stay pending
+        cursor.execute('''
+            SELECT month, state, finished_at FROM arp_ingestion_log
+            WHERE year = %s AND upper(state) = %s AND status = 'done'
+        ''', (year, state))
+        imports = cursor.fetchall()
+
+        params = {
+            'year': year,
+            'state': state,
+            'start': datetime(year, 1, 1),
+            'end': datetime(year + 1, 1, 1),
+        }
+        cursor.execute(REFRESH_CAPACITY, params)
+        cursor.execute(REFRESH_GENERATION, params)
+
+        cursor.executemany('''
+            UPDATE arp_ingestion_log SET refreshed_at = finished_at
+            WHERE year = %s AND month = %s AND state = %s AND finished_at = %s
+        ''', [(year, month, file_state, finished_at) for month, file_state, finished_at in imports])
+
+        # invalidates the cached results of the queries on the aggregates
+        cursor.execute('''
+            INSERT INTO data_versions (name, version, updated_at) VALUES ('arp', 1, now())
+            ON CONFLICT (name) DO UPDATE SET version = data_versions.version + 1, updated_at = now()
+        ''')
+
+    connection.commit()
+
+
+def refresh(full=False):
+    """
+    Refreshes the partitions with files imported since they were last
+    refreshed, or all of them if `full` (e.g. to fill the aggregates of data
+    imported before the `arp_ingestion_log`).
+    """
+    connection = db.engine.raw_connection()
+    try:
+        refreshed = partitions(connection) if full else pending(connection)
+        print(f'refreshing {len(refreshed)} partitions')
+        for year, state in refreshed:
+            start = time.perf_counter()
+            refresh_partition(connection, int(year), state)
+            print(f'{year} {state}: {time.perf_counter() - start:.1f} s')
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    return refreshed
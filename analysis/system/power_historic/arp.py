@@ -1,71 +1,242 @@
-from datetime import datetime, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import contextlib
 import core.db as db
-from core.models import Plant, ARP
-import numpy as np
+import io
 import os
 import pandas as pd
-import redis
-import sys
-from tqdm import tqdm
-import us
-from utils import LRUCache
-import sqlalchemy
+import time
 
 import settings
 
-plant_ids = LRUCache(1000)
+# measurement columns of the CAMD hourly emissions CSVs, by `arp` column
+MEASUREMENTS = {
+    'gload': 'GLOAD (MW)',
+    'so2_mass': 'SO2_MASS (lbs)',
+    'nox_mass': 'NOX_MASS (lbs)',
+    'co2_mass': 'CO2_MASS (tons)',
+    'heat_input': 'HEAT_INPUT (mmBtu)',
+}
 
-def import_row(row):
-    orispl = str(row['ORISPL_CODE'])
-    plant_id = plant_ids.get(orispl)
-    if plant_id is None:
-        plant = Plant.query.filter(Plant.orispl == orispl).first()
-        if plant is None:
-            raise Exception(f'plant not found: {orispl}')
-        plant_id = plant.id
-        plant_ids.set(orispl, plant_id)
+COLUMNS = ['orispl', 'unit', 'timestamp'] + list(MEASUREMENTS)
 
 
-    date = datetime.strptime(row['OP_DATE'], '%m-%d-%Y')
-    hour = time(row['OP_HOUR'], 0)
-    timestamp = datetime.combine(date, hour)
-    unit = str(row['UNITID'])
+def read_csv(path):
+    """
+    Reads a CAMD hourly emissions CSV into a data frame with the `COLUMNS`,
+    typed, and with one row per (timestamp, plant, unit): the last one, as
+    when the rows were imported one after the other.
+    """
+    df = pd.read_csv(
+        path,
+        usecols=['ORISPL_CODE', 'UNITID', 'OP_DATE', 'OP_HOUR'] + list(MEASUREMENTS.values()),
+        keep_default_na=False,
+        na_values=[''],
+    )
 
-    def update_arp_attrs(arp):
-        arp.gload=row['GLOAD (MW)']
-        arp.so2_mass=row['SO2_MASS (lbs)']
-        arp.nox_mass=row['NOX_MASS (lbs)']
-        arp.co2_mass=row['CO2_MASS (tons)']
-        arp.heat_input=row['HEAT_INPUT (mmBtu)']
+    data = pd.DataFrame({
+        # as the plants and units were keyed so far (e.g. unit '01' is '1')
+        'orispl': df['ORISPL_CODE'].astype(str),
+        'unit': df['UNITID'].astype(str),
+        'timestamp': pd.to_datetime(df['OP_DATE'], format='%m-%d-%Y') + pd.to_timedelta(df['OP_HOUR'], unit='h'),
+    })
+    for column, name in MEASUREMENTS.items():
+        data[column] = df[name].astype(float)
 
-    try:
-        # try the insert first (since this will be the case most of the time)
-        arp = ARP(plant_id=plant_id, timestamp=timestamp, unit=unit)
-        update_arp_attrs(arp)
-        db.save(arp)
-    except sqlalchemy.exc.IntegrityError as e:
-        db.rollback()
-        if e.orig.pgcode == '23505':
-            # duplicate key, update existing record
-            arp = ARP.query.filter(ARP.plant_id == plant_id, ARP.timestamp == timestamp, ARP.unit == unit).first()
-            update_arp_attrs(arp)
-            db.save(arp)
-        else:
-            raise e
-
-
-def import_csv(year, month, state):
+    return data.drop_duplicates(subset=['timestamp', 'orispl', 'unit'], keep='last')
+
+
+def upsert(df, connection):
+    """
+    Inserts the rows of `df` (as returned by `read_csv`) in the `arp` table,
+    or updates the measurements of the existing rows, in the current
+    transaction of the DB-API `connection`: the rows are copied to a
+    temporary table, then merged with their plant ids in a single statement.
+    Returns the number of rows merged and the plants (ORISPL codes) not
+    found, whose rows are skipped.
+    """
+    buffer = io.StringIO()
+    df[COLUMNS].to_csv(buffer, index=False, header=False, na_rep='', date_format='%Y-%m-%d %H:%M:%S')
+    buffer.seek(0)
+
+    measurements = ', '.join(MEASUREMENTS)
+    updates = ', '.join(f'{column} = EXCLUDED.{column}' for column in MEASUREMENTS)
+
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            CREATE TEMPORARY TABLE arp_staging (
+                orispl TEXT NOT NULL,
+                unit TEXT NOT NULL,
+                timestamp TIMESTAMP NOT NULL,
+                gload DOUBLE PRECISION,
+                so2_mass DOUBLE PRECISION,
+                nox_mass DOUBLE PRECISION,
+                co2_mass DOUBLE PRECISION,
+                heat_input DOUBLE PRECISION
+            )
+        ''')
+        cursor.copy_expert(f'COPY arp_staging ({", ".join(COLUMNS)}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+        cursor.execute(f'''
+            INSERT INTO arp (timestamp, plant_id, unit, {measurements})
+            SELECT arp_staging.timestamp, plants.id, arp_staging.unit, {measurements}
+            FROM arp_staging
+            INNER JOIN plants ON plants.orispl = arp_staging.orispl
+            ON CONFLICT (timestamp, plant_id, unit) DO UPDATE SET {updates}
+        ''')
+        rows = cursor.rowcount
+
+        cursor.execute('''
+            SELECT DISTINCT arp_staging.orispl
+            FROM arp_staging
+            LEFT JOIN plants ON plants.orispl = arp_staging.orispl
+            WHERE plants.id IS NULL
+        ''')
+        missing = sorted(orispl for orispl, in cursor.fetchall())
+        cursor.execute('DROP TABLE arp_staging')
+
+    return rows, missing
+
+
+def completed(connection):
+    """
+    Returns the (year, month, state) of the files imported so far.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT year, month, state FROM arp_ingestion_log WHERE status = 'done'")
+        return set(cursor.fetchall())
+
+
+def log(connection, year, month, state, status, stats=None, error=None):
+    stats = stats or {}
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            INSERT INTO arp_ingestion_log (year, month, state, status, rows, skipped, seconds, error, finished_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, now())
+            ON CONFLICT (year, month, state) DO UPDATE SET
+                status = EXCLUDED.status,
+                rows = EXCLUDED.rows,
+                skipped = EXCLUDED.skipped,
+                seconds = EXCLUDED.seconds,
+                error = EXCLUDED.error,
+                finished_at = EXCLUDED.finished_at
+        ''', (year, month, state, status, stats.get('rows'), stats.get('skipped'), stats.get('seconds'), error))
+
+
+def import_csv(year, month, state, data_dir='data', connection=None):
+    """
+    Imports the CSV of `state` for `month`/`year` and records it in the
+    `arp_ingestion_log`, in the same transaction, so that a file is only
+    logged as done if its rows are committed. Returns the `rows` imported,
+    the rows `skipped` (of `missing_plants`), the time taken and the rows
+    imported per second.
+    """
     print(f'import: {month}/{year} {state}')
 
-    data_dir = 'data'
     filename = f'{year}{state}{str(month).zfill(2)}.csv'
     path = os.path.join(data_dir, filename)
 
-    df = pd.read_csv(path, keep_default_na=False, na_values=['']).replace({ np.nan: None })
-    with tqdm(total=len(df)) as pbar:
-        for idx, row in df.iterrows():
-            try:
-                import_row(row)
-            except Exception as err:
-                print("import error: {0}".format(err))
-            pbar.update(1)
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    close = connection is None
+    if connection is None:
+        connection = db.engine.raw_connection()
+    try:
+        start = time.perf_counter()
+        df = read_csv(path)
+        rows, missing = upsert(df, connection)
+        seconds = time.perf_counter() - start
+        stats = {
+            'rows': rows,
+            'skipped': len(df) - rows,
+            'missing_plants': missing,
+            'seconds': seconds,
+            'rows_per_second': rows / seconds,
+        }
+        log(connection, year, month, state, 'done', stats)
+        connection.commit()
+    except Exception as e:
+        # the import error is raised, not that of its logging
+        try:
+            connection.rollback()
+            log(connection, year, month, state, 'failed', error=f'{type(e).__name__}: {e}')
+            connection.commit()
+        except Exception as log_error:
+            print(f'import error: failed to log the failure: {log_error}')
+            with contextlib.suppress(Exception):
+                connection.rollback()
+        raise
+    finally:
+        if close:
+            connection.close()
+
+    for orispl in missing:
+        print(f'import error: plant not found: {orispl}')
+    print(f'imported {rows} rows in {seconds:.1f} s ({rows / seconds:.0f} rows/s)')
+
+    return stats
+
+
+# connection of each worker process of `import_files`
+_connection = None
+
+def _init_worker():
+    global _connection
+    # the pool inherited from the parent is empty (see `import_files`): the
+    # connection is the worker's own
+    _connection = db.engine.raw_connection()
+
+def _import_file(year, month, state, data_dir):
+    try:
+        return import_csv(year, month, state, data_dir=data_dir, connection=_connection), None
+    except FileNotFoundError:
+        return None, 'CSV not found'
+    except Exception as e:
+        return None, f'{type(e).__name__}: {e}'
+
+
+def import_files(files, workers=None, data_dir='data', force=False):
+    """
+    Imports the CSVs of the (year, month, state) `files` in `workers`
+    processes (`None`: the number of CPUs), each with its own connection.
+    The files imported by previous runs (according to the
+    `arp_ingestion_log`) are skipped, unless `force`. Returns the results
+    by file: the stats returned by `import_csv`, or the `error`.
+    """
+    files = list(files)
+    if not force:
+        connection = db.engine.raw_connection()
+        try:
+            done = completed(connection)
+        finally:
+            connection.close()
+        files = [file for file in files if tuple(file) not in done]
+        print(f'importing {len(files)} files ({len(done)} imported already)')
+
+    # closes the pooled connections before forking, so that the workers
+    # don't inherit (and close) connections of the parent process
+    db.engine.dispose()
+
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(_import_file, year, month, state, data_dir): (year, month, state)
+            for year, month, state in files
+        }
+        for future in as_completed(futures):
+            year, month, state = file = futures[future]
+            stats, error = future.result()
+            if error is None:
+                results[file] = stats
+                print(f'{month}/{year} {state}: {stats["rows"]} rows ({stats["rows_per_second"]:.0f} rows/s), {stats["skipped"]} skipped')
+            else:
+                results[file] = {'error': error}
+                print(f'{month}/{year} {state}: {error}')
+
+    seconds = time.perf_counter() - start
+    rows = sum(result.get('rows', 0) for result in results.values())
+    errors = sum(1 for result in results.values() if 'error' in result)
+    print(f'imported {rows} rows from {len(results) - errors} files in {seconds:.1f} s ({rows / max(seconds, 1e-9):.0f} rows/s), {errors} errors')
+
+    return results
@@ -1,5 +1,6 @@
+import aggregates
 import argparse
-from arp import import_csv
+from arp import import_csv, import_files
 import egrid
 import itertools
 import os
@@ -63,11 +64,12 @@ def arp_import(args):
         for (year, month, state) in arp_range(args):
             queue.enqueue(import_csv, year, month, state)
     else:
-        for (year, month, state) in arp_range(args):
-            try:
-                import_csv(year, month, state)
-            except FileNotFoundError:
-                print(f'{month}/{year} {state} CSV not found')
+        import_files(arp_range(args), workers=args.workers, force=args.force)
+        if args.refresh:
+            aggregates.refresh()
+
+def arp_refresh(args):
+    aggregates.refresh(full=args.all)
 
 
 if __name__ == '__main__':
@@ -86,6 +88,12 @@ if __name__ == '__main__':
     arp_import_parser.add_argument('--start-state', help='starting state (i.e. ca)', required=False)
     arp_import_parser.add_argument('--end-state', help='ending state (i.e. ny)', required=False)
     arp_import_parser.add_argument('--enqueue', help='enqueue the imports to be performed later', required=False, action='store_true')
+    arp_import_parser.add_argument('--workers', help='number of files imported at the same time (default: number of CPUs)', required=False, type=int)
+    arp_import_parser.add_argument('--force', help='import the files imported already', required=False, action='store_true')
+    arp_import_parser.add_argument('--refresh', help='refresh the aggregates of the imported data', required=False, action='store_true')
+
+    arp_refresh_parser = subparsers.add_parser('arp_refresh')
+    arp_refresh_parser.add_argument('--all', help='refresh all the years and states, rather than those imported since the last refresh', required=False, action='store_true')
 
     args = parser.parse_args()
 
@@ -95,3 +103,5 @@ if __name__ == '__main__':
         arp_download(args)
     elif args.command == 'arp_import':
         arp_import(args)
+    elif args.command == 'arp_refresh':
+        arp_refresh(args)
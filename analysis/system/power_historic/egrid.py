@@ -1,84 +1,152 @@
 import core.db as db
-from core.models import Utility, BalancingAuthority, Plant, Egrid
 import numpy as np
-import os
 import pandas as pd
-import sys
-from tqdm import tqdm
+from psycopg2.extras import execute_values
+import time
 
 import settings
 
-def import_row(row):
-    utlsrvid = str(row['UTLSRVID'])
-    utility = Utility.query.filter(Utility.utlsrvid == utlsrvid).first()
-    if utility is None:
-        utility = Utility(
-            utlsrvid=utlsrvid,
-            name=row['UTLSRVNM']
-        )
-        db.save(utility)
-
-    balancing_authority = None
-
-    if 'BACODE' in row:
-        bacode = row['BACODE']
-        if bacode is not None:
-            balancing_authority = BalancingAuthority.query.filter(BalancingAuthority.code == bacode).first()
-            if balancing_authority is None:
-                balancing_authority = BalancingAuthority(
-                    code=bacode,
-                    name=row['BANAME'],
-                )
-                db.save(balancing_authority)
-
-    orispl = str(row['ORISPL'])
-    plant = Plant.query.filter(Plant.orispl == orispl).first()
-    if plant is None:
-        plant = Plant(
-            orispl=orispl,
-            utility=utility,
-            balancing_authority=balancing_authority,
-            state=row['PSTATABB'],
-            name=row['PNAME'],
-            nerc_region=row['NERC'],
-            subregion_acronym=row['SUBRGN'],
-            subregion_name=row['SRNAME'],
-            isorto=row['ISORTO'],
-            county_name=row['CNTYNAME'],
-            latitude=row['LAT'],
-            longitude=row['LON'],
-            num_units=row.get('NUMUNT'),
-            num_generators=row.get('NUMGEN'),
-            primary_fuel=row['PLPRMFL'],
-            nameplate_capacity=row['NAMEPCAP'],
-            power_to_heat_ratio=row.get('PWRTOHT'),
+# `plants` columns, by spreadsheet column
+PLANT_COLUMNS = {
+    'PSTATABB': 'state',
+    'PNAME': 'name',
+    'NERC': 'nerc_region',
+    'SUBRGN': 'subregion_acronym',
+    'SRNAME': 'subregion_name',
+    'ISORTO': 'isorto',
+    'CNTYNAME': 'county_name',
+    'LAT': 'latitude',
+    'LON': 'longitude',
+    'NUMUNT': 'num_units',
+    'NUMGEN': 'num_generators',
+    'PLPRMFL': 'primary_fuel',
+    'NAMEPCAP': 'nameplate_capacity',
+    'PWRTOHT': 'power_to_heat_ratio',
+}
+# not in every eGRID year
+OPTIONAL_PLANT_COLUMNS = ['NUMUNT', 'NUMGEN', 'PWRTOHT']
+
+# `egrid` columns, by spreadsheet column
+EGRID_COLUMNS = {
+    'PLNOXRTA': 'annual_nox_rate',
+    'PLNOXRTO': 'ozone_season_nox_rate',
+    'PLSO2RTA': 'annual_so2_rate',
+    'PLCO2RTA': 'annual_co2_rate',
+    'PLCH4RTA': 'annual_ch4_rate',
+    'PLN2ORTA': 'annual_n2o_rate',
+    'PLC2ERTA': 'annual_co2_equivalent_rate',
+    'PLHGRTA': 'annual_hg_rate',
+    'PLHTRT': 'nominal_heat_rate',
+}
+
+
+def _rows(df):
+    # as Python values (e.g. `int` rather than `np.int64`), for psycopg2
+    return list(zip(*(df[column].tolist() for column in df.columns)))
+
+
+def _insert(cursor, table, df, conflict):
+    """
+    Inserts the rows of `df` in `table` in a single statement, except those
+    conflicting with existing rows (which are kept as they are). Returns the
+    number of rows inserted.
+    """
+    if len(df) == 0:
+        return 0
+    execute_values(
+        cursor,
+        f'INSERT INTO {table} ({", ".join(df.columns)}) VALUES %s ON CONFLICT ({conflict}) DO NOTHING',
+        _rows(df),
+        page_size=len(df),
+    )
+    return cursor.rowcount
+
+
+def _ids(cursor, table, key, values):
+    """
+    Returns the ids of the rows of `table` by `key`, for the `key` values.
+    """
+    cursor.execute(f'SELECT {key}, id FROM {table} WHERE {key} = ANY(%s)', (list(values),))
+    return dict(cursor.fetchall())
+
+
+def import_frame(df, connection):
+    """
+    Imports the rows of an eGRID plant sheet: the utilities, balancing
+    authorities and plants not imported yet (as of their first row in the
+    sheet), then the `egrid` rates of the plants for the year, unless they
+    were imported already. Runs in the current transaction of the DB-API
+    `connection`, with one statement per table, and returns the number of
+    rows inserted by table.
+    """
+    df = df.replace({ np.nan: None })
+    counts = {}
+
+    with connection.cursor() as cursor:
+        utilities = pd.DataFrame({
+            'utlsrvid': df['UTLSRVID'].map(str),
+            'name': df['UTLSRVNM'],
+        }).drop_duplicates('utlsrvid')
+        counts['utilities'] = _insert(cursor, 'utilities', utilities, 'utlsrvid')
+        utility_ids = _ids(cursor, 'utilities', 'utlsrvid', utilities['utlsrvid'])
+
+        balancing_authority_ids = {}
+        if 'BACODE' in df:
+            balancing_authorities = pd.DataFrame({
+                'code': df['BACODE'],
+                'name': df['BANAME'],
+            }).dropna(subset=['code']).drop_duplicates('code')
+            counts['balancing_authorities'] = _insert(cursor, 'balancing_authorities', balancing_authorities, 'code')
+            balancing_authority_ids = _ids(cursor, 'balancing_authorities', 'code', balancing_authorities['code'])
+
+        plants = pd.DataFrame({
+            'orispl': df['ORISPL'].map(str),
+            'utility_id': df['UTLSRVID'].map(str).map(utility_ids),
+        })
+        # as objects, so that the ids of the plants without one aren't floats
+        plants['balancing_authority_id'] = pd.Series(
+            [balancing_authority_ids.get(code) for code in df['BACODE']] if 'BACODE' in df else None,
+            index=df.index,
+            dtype=object,
         )
-        db.save(plant)
-
-    year = row.get('YEAR')
-    if year is not None:
-        egrid = Egrid.query.filter(Egrid.plant == plant, Egrid.year == year).first()
-        if egrid is None:
-            egrid = Egrid(
-                year=year,
-                plant=plant,
-                annual_nox_rate=row['PLNOXRTA'],
-                ozone_season_nox_rate=row['PLNOXRTO'],
-                annual_so2_rate=row['PLSO2RTA'],
-                annual_co2_rate=row['PLCO2RTA'],
-                annual_ch4_rate=row['PLCH4RTA'],
-                annual_n2o_rate=row['PLN2ORTA'],
-                annual_co2_equivalent_rate=row['PLC2ERTA'],
-                annual_hg_rate=row['PLHGRTA'],
-                nominal_heat_rate=row['PLHTRT'],
-            )
-            db.save(egrid)
+        for name, column in PLANT_COLUMNS.items():
+            if name in df or name not in OPTIONAL_PLANT_COLUMNS:
+                plants[column] = df[name]
+            else:
+                plants[column] = None
+        plants = plants.replace({ np.nan: None }).drop_duplicates('orispl')
+        counts['plants'] = _insert(cursor, 'plants', plants, 'orispl')
+
+        if 'YEAR' in df:
+            plant_ids = _ids(cursor, 'plants', 'orispl', plants['orispl'])
+            egrid = pd.DataFrame({
+                'year': df['YEAR'],
+                'plant_id': df['ORISPL'].map(str).map(plant_ids),
+            })
+            for name, column in EGRID_COLUMNS.items():
+                egrid[column] = df[name]
+            egrid = egrid.dropna(subset=['year']).drop_duplicates(['year', 'plant_id'])
+            counts['egrid'] = _insert(cursor, 'egrid', egrid, 'year, plant_id')
+
+    return counts
+
 
 def import_spreadsheet(path, sheet_name, header=1):
     print(f'reading spreadsheet: {path}')
-    df = pd.read_excel(path, sheet_name=sheet_name, header=header, keep_default_na=False, na_values=[None, '', 'N/A', '--']).replace({ np.nan: None })
+    df = pd.read_excel(path, sheet_name=sheet_name, header=header, keep_default_na=False, na_values=[None, '', 'N/A', '--'])
     print(f'importing {sheet_name}')
-    with tqdm(total=len(df)) as pbar:
-        for idx, row in df.iterrows():
-            import_row(row)
-            pbar.update(1)
+
+    start = time.perf_counter()
+    connection = db.engine.raw_connection()
+    try:
+        counts = import_frame(df, connection)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    inserted = ', '.join(f'{count} {table}' for table, count in counts.items())
+    print(f'imported {len(df)} rows in {time.perf_counter() - start:.1f} s: {inserted} inserted')
+    return counts
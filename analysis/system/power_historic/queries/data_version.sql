@@ -0,0 +1,3 @@
+-- :name data_version :scalar
+
+select version from data_versions where name = :name;
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from core.sinks import FrameSink
+
 
 def perform_tea(tea_result):
     # FIXME: find better way to pass this into TEA class
@@ -26,20 +28,41 @@ def perform_tea(tea_result):
     return df
 
 
-def run(tea_pathway):
-    data = pd.DataFrame()
+def stream(tea_pathways):
+    """
+    Performs the TEA pathways of the iterable `tea_pathways` one at a time,
+    yielding `(tea_pathway, table, data)` for each.
+    """
+    for tea_pathway in tea_pathways:
+        results = tea_pathway.perform()
+        cost_df = perform_tea(results)
+        cost_df['pathway'] = tea_pathway.name
+        yield tea_pathway, results['table'], cost_df[['value', 'cost_category', 'cost_category_by_parts', 'pathway']]
+
+
+def run(tea_pathways, sink=None):
+    """
+    Returns the cost breakdown of a TEA pathway, or of an iterable of TEA
+    pathways. The result rows are written to `sink` (by default a
+    `FrameSink`), and the sink's result is returned as the data. The unit
+    and table are those of the last pathway.
+    """
+    if hasattr(tea_pathways, 'perform'):
+        tea_pathways = [tea_pathways]
+    if sink is None:
+        sink = FrameSink()
+
+    unit = None
     table = None
-    results = tea_pathway.perform()
-    cost_df = perform_tea(results)
-    cost_df['pathway'] = tea_pathway.name
-    data = data.append(cost_df[['value', 'cost_category', 'cost_category_by_parts', 'pathway']])
-    table = results['table']
+    for tea_pathway, table, df in stream(tea_pathways):
+        unit = tea_pathway.unit
+        sink.write(df)
 
     return dict(
         title=f'TEA Cost Breakdown',
-        unit=tea_pathway.unit,
+        unit=unit,
         value='Cost',
         columns=['value', 'cost_category', 'cost_category_by_parts', 'pathway'],
-        data=data,
+        data=sink.result(),
         table=table,
     )
@@ -0,0 +1,221 @@
+"""
+Monte Carlo uncertainty analysis over the sensitivity inputs of a pathway.
+
+Every `SensitivityInput` of the pathway's sources is sampled between its
+minimizing and maximizing values (inputs without a numeric range, e.g.
+options, are sampled between the two values) with a Latin hypercube design.
+Samples are evaluated in chunks, either in this process or across a pool of
+worker processes. Each chunk loads the pathway once and re-performs it for
+each sample, so only the steps whose inputs changed are recomputed.
+
+The models themselves compute one sample at a time, so the throughput is
+that of their `prepare`/`get_inputs`/`get_emissions` per worker: on one
+core, about 400 samples/s for the wind pathway and 35 samples/s for the
+solar one, whose model is a sequence of pandas operations.
+
+Samples that can't be performed (some combinations of inputs are not
+supported by the models) are left out of the statistics, counted in the
+`failed_samples` parameter and listed in `errors`; more than `max_failures`
+(a fraction of the samples) raises a `RuntimeError`.
+"""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import math
+import numbers
+import os
+
+import numpy as np
+import pandas as pd
+
+from analysis.lca import characterization_factors
+from core import utils
+
+
+def latin_hypercube(samples, dimensions, rng):
+    """
+    Returns a `samples` x `dimensions` array of points in [0, 1) with exactly
+    one point in each of the `samples` equal strata of every dimension.
+    """
+    points = (np.arange(samples)[:, None] + rng.random((samples, dimensions))) / samples
+    for dimension in range(dimensions):
+        rng.shuffle(points[:, dimension])
+    return points
+
+
+def stage_impacts(results, indicator='GWP'):
+    """
+    Returns the impact (in grams, as in `lca.run`) of each stage of the
+    pathway `results`.
+    """
+    factors = characterization_factors()[indicator].to_dict()
+
+    impacts = {}
+    for stage, stage_results in results.items():
+        if stage == 'other_info':
+            continue
+
+        total = 0.0
+        for emissions in stage_results['flow_emissions'].values():
+            for flow in emissions.values():
+                factor = factors.get(flow['name'])
+                value = flow['value']
+                if factor is not None and value is not None and not math.isnan(value):
+                    total += value * factor
+        impacts[stage] = total * 1000
+
+    return impacts
+
+
+def _evaluate(pathway, parameters, rows, indicator):
+    """
+    Returns `(impacts, error)` for each row: the stage impacts, or `None`
+    and the error if the pathway could not be performed.
+    """
+    res = []
+    for row in rows:
+        for (step_idx, input_name), value in zip(parameters, row):
+            pathway.steps[step_idx].input_set.set_value(input_name, value)
+
+        try:
+            res.append((stage_impacts(pathway.perform(cached=False), indicator), None))
+        except Exception as e:
+            res.append((None, f'{type(e).__name__}: {e}'))
+    return res
+
+
+def _evaluate_chunk(serialized_pathway, parameters, rows, indicator):
+    from core.pathway import Pathway
+    return _evaluate(Pathway.load(serialized_pathway), parameters, rows, indicator)
+
+
+class MonteCarloAnalysis:
+
+    def __init__(self, pathway, samples=1000, indicator='GWP', percentiles=(5, 50, 95), seed=None,
+                 max_failures=0.1):
+        self.pathway = pathway
+        self.samples = samples
+        self.indicator = indicator
+        self.percentiles = list(percentiles)
+        self.seed = seed
+        self.max_failures = max_failures
+
+        # (step index, input name, low, high, numeric)
+        self.parameters = []
+        for step_idx, step in enumerate(self.pathway.steps):
+            for sensitivity_input in step.source.sensitivity() or []:
+                if sensitivity_input.name not in step.input_set:
+                    continue
+
+                low = sensitivity_input.minimizing(step.input_set)
+                high = sensitivity_input.maximizing(step.input_set)
+                numeric = isinstance(low, numbers.Number) and isinstance(high, numbers.Number)
+                if numeric and low > high:
+                    low, high = high, low
+                self.parameters.append((step_idx, sensitivity_input.name, low, high, numeric))
+
+    @property
+    def runnable(self):
+        return len(self.parameters) > 0
+
+    def sample(self):
+        """
+        Returns the sampled input values: one tuple per sample, with one value
+        per parameter.
+        """
+        rng = np.random.default_rng(self.seed)
+        points = latin_hypercube(self.samples, len(self.parameters), rng)
+
+        columns = []
+        for idx, (_, _, low, high, numeric) in enumerate(self.parameters):
+            if numeric:
+                columns.append((low + points[:, idx] * (high - low)).tolist())
+            else:
+                columns.append([low if point < 0.5 else high for point in points[:, idx]])
+
+        return list(zip(*columns))
+
+    def evaluate(self, rows, workers=None, chunk_size=None):
+        """
+        Returns the stage impacts for each row of input values (`None` where
+        the pathway could not be performed), and the errors of the rows that
+        could not be performed, by row. Duplicate rows are evaluated once.
+        """
+        unique_rows = list(dict.fromkeys(rows))
+        parameters = [(step_idx, name) for step_idx, name, _, _, _ in self.parameters]
+        serialized = self.pathway._serialize_with_context()
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(unique_rows))
+
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(unique_rows) / (max(workers, 1) * 4)))
+        chunks = list(utils.chunks(unique_rows, chunk_size))
+
+        if workers <= 1:
+            results = [_evaluate_chunk(serialized, parameters, chunk, self.indicator) for chunk in chunks]
+        else:
+            from core.pathway import _init_worker
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                results = list(executor.map(
+                    _evaluate_chunk,
+                    [serialized] * len(chunks),
+                    [parameters] * len(chunks),
+                    chunks,
+                    [self.indicator] * len(chunks),
+                ))
+
+        results = dict(zip(unique_rows, [res for chunk in results for res in chunk]))
+        errors = {row: error for row, (_, error) in results.items() if error is not None}
+        return [results[row][0] for row in rows], errors
+
+    def run(self, workers=None, chunk_size=None):
+        """
+        Returns the mean and percentile bands of the impact of each stage (and
+        of the total) over the samples.
+        """
+        base_results = self.pathway.perform()
+        unit = base_results['Enduse']['flow_output']['unit']
+        stages = list(stage_impacts(base_results, self.indicator).keys())
+
+        rows = self.sample()
+        impacts, errors = self.evaluate(rows, workers=workers, chunk_size=chunk_size)
+
+        failed_samples = sum(sample is None for sample in impacts)
+        if failed_samples > self.max_failures * len(rows):
+            raise RuntimeError(
+                f'{failed_samples} of {len(rows)} samples failed, e.g. {next(iter(errors.values()))}'
+            )
+
+        values = np.full((len(impacts), len(stages) + 1), np.nan)
+        for idx, sample in enumerate(impacts):
+            if sample is not None:
+                values[idx, :-1] = [sample.get(stage, np.nan) for stage in stages]
+        values[:, -1] = values[:, :-1].sum(axis=1)
+
+        data = pd.DataFrame({
+            'stage': stages + ['Total'],
+            'mean': np.nanmean(values, axis=0),
+        })
+        for percentile in self.percentiles:
+            data[f'p{percentile}'] = np.nanpercentile(values, percentile, axis=0)
+
+        return dict(
+            title=f'Lifecycle GHG Emissions Uncertainty',
+            unit=f'gCO\u2082e/{unit}',
+            value=unit,
+            columns=['stage', 'mean'] + [f'p{percentile}' for percentile in self.percentiles],
+            params={
+                'indicator': self.indicator,
+                'samples': self.samples,
+                'failed_samples': failed_samples,
+                'inputs': [name for _, name, _, _, _ in self.parameters],
+            },
+            # distinct errors of the failed samples, with how many samples
+            # failed with each
+            errors=[
+                {'error': error, 'samples': count}
+                for error, count in Counter(errors[row] for row in rows if row in errors).most_common()
+            ],
+            data=data,
+        )
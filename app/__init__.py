@@ -21,11 +21,13 @@ from app.tea import app as tea_app
 from app.fleet import app as fleet_app
 from app.power_historic import app as power_historic_app
 from app.grid import app as grid_app
+from app.jobs import app as jobs_app
 from app.pps import app as pps_app
 from app.industry.cement import app as industry_cement_app
 from app.industry.steel import app as industry_steel_app
 from app.industry.aluminum import app as industry_aluminum_app
 from app.industry.fleet import app as industrial_fleet_app
+from core import registry
 from core.common import JSONEncoder
 
 app = Flask('SESAME')
@@ -59,8 +61,14 @@ app.register_blueprint(tea_app, url_prefix='/tea')
 app.register_blueprint(fleet_app, url_prefix='/fleet')
 app.register_blueprint(power_historic_app, url_prefix='/power_historic')
 app.register_blueprint(grid_app, url_prefix='/grid')
+app.register_blueprint(jobs_app, url_prefix='/jobs')
 app.register_blueprint(pps_app, url_prefix='/pps')
 app.register_blueprint(industry_cement_app, url_prefix='/industry/cement')
 app.register_blueprint(industry_steel_app, url_prefix='/industry/steel')
 app.register_blueprint(industry_aluminum_app, url_prefix='/industry/aluminum')
 app.register_blueprint(industrial_fleet_app, url_prefix='/industry/fleet')
+
+if settings.PRELOAD_DATA:
+    # load the data tables once, before the server forks its workers
+    # (e.g. gunicorn --preload), so that the workers share them
+    registry.preload()
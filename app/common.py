@@ -1,13 +1,15 @@
 from core.common import JSONEncoder
 from core.inputs import InputSet
 import core.users as users
-from flask import request, Response
+from flask import current_app, jsonify, request, Response
+import functools
 import hashlib
 import json
 import math
 import numbers
 import numpy as np
 import pandas as pd
+import threading
 from schematics.exceptions import BaseError
 
 class HTTPException(Exception):
@@ -43,18 +45,48 @@ def auth_required(f):
     return decorator
 
 
-def metadata_response(f):
+def metadata_response(f=None, version=None):
+    """
+    Metadata only changes with the code and data, so the response of `f` is
+    built, serialized and hashed once per process (and per arguments), and
+    again whenever `version()` changes, for metadata built from data that
+    changes without a restart (e.g. `@metadata_response(version=...)`). The
+    hash is sent as the ETag, and requests with a matching `If-None-Match`
+    get a 304 Not Modified without a body.
+    """
+    if f is None:
+        return functools.partial(metadata_response, version=version)
+
+    responses = {}
+    lock = threading.Lock()
+
     def decorator(*args, **kwargs):
-        data = f(*args, **kwargs)
-        text = json.dumps(data, cls=JSONEncoder)
-        sha = hashlib.sha256()
-        sha.update(text.encode('utf-8'))
-        data['hash'] = sha.hexdigest()
-        return data
+        key = (args, tuple(sorted(kwargs.items())))
+        current = version() if version is not None else None
+        entry = responses.get(key)
+        if entry is None or entry[0] != current:
+            with lock:
+                entry = responses.get(key)
+                if entry is None or entry[0] != current:
+                    data = f(*args, **kwargs)
+                    text = json.dumps(data, cls=JSONEncoder)
+                    sha = hashlib.sha256()
+                    sha.update(text.encode('utf-8'))
+                    if version is not None:
+                        sha.update(repr(current).encode('utf-8'))
+                    data['hash'] = sha.hexdigest()
+                    entry = responses[key] = (current, data['hash'], jsonify(data).get_data())
+
+        _, etag, body = entry
+        response = current_app.response_class(body, mimetype=current_app.config['JSONIFY_MIMETYPE'])
+        response.set_etag(etag)
+        # clients may keep the metadata but must check that it is current
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
     return decorator
 
 
-def create_model(model_class, input_values):
+def validate_inputs(model_class, input_values):
     input_set = InputSet(model_class.inputs(), input_values)
 
     try:
@@ -62,6 +94,12 @@ def create_model(model_class, input_values):
     except BaseError as e:
         raise HTTPException({ 'errors': e.to_primitive() }, 422)
 
+    return input_set
+
+
+def create_model(model_class, input_values):
+    input_set = validate_inputs(model_class, input_values)
+
     model = model_class()
     model.prepare(input_set)
     return model
@@ -1,4 +1,5 @@
 from app.common import metadata_response, create_model
+from app.jobs import submit
 import analysis.system.fleet.fleet as fleet
 from flask import Blueprint, request
 import pandas as pd
@@ -11,7 +12,7 @@ app = Blueprint('fleet', __name__)
 @app.route('/metadata', methods=['GET'])
 @metadata_response
 def _metadata():
-    user_inputs = fleet.FleetModel.user_inputs()
+    user_inputs = fleet.FleetModel.inputs()
     return {
         'user_inputs': [
             user_input.serialize()
@@ -22,7 +23,10 @@ def _metadata():
 
 @app.route('/analysis', methods=['POST'])
 def _analysis():
-    model = create_model(fleet.FleetModel, request.json)
+    return submit(run_analysis, fleet.FleetModel, request.json)
+
+def run_analysis(input_values):
+    model = create_model(fleet.FleetModel, input_values)
     outputs = model.run()
 
     plots = [
@@ -1,4 +1,5 @@
 from app.common import metadata_response, create_model
+from app.jobs import submit
 import analysis.system.grid.grid as grid
 from flask import Blueprint, request
 import pandas as pd
@@ -11,7 +12,7 @@ app = Blueprint('grid', __name__)
 @app.route('/metadata', methods=['GET'])
 @metadata_response
 def _metadata():
-    user_inputs = grid.Grid.user_inputs()
+    user_inputs = grid.Grid.inputs()
     return {
         'user_inputs': [user_input.serialize() for user_input in user_inputs],
         'version': grid.Grid.version,
@@ -19,7 +20,10 @@ def _metadata():
 
 @app.route('/analysis', methods=['POST'])
 def _analysis():
-    model = create_model(grid.Grid, request.json)
+    return submit(run_analysis, grid.Grid, request.json)
+
+def run_analysis(input_values):
+    model = create_model(grid.Grid, input_values)
     results = model.run()
 
     def round_down(value):
@@ -28,8 +32,22 @@ def _analysis():
         else:
             return value
 
+    def round_down_frame(df):
+        values = df.to_numpy()
+        if len(df) == 0 or any(dtype.kind != 'f' for dtype in df.dtypes) or np.isnan(values).any():
+            return df.replace({ np.nan: None }).applymap(round_down)
+
+        small = values < 0.001
+        data = pd.DataFrame(np.where(small, 0.0, values), index=df.index)
+        zeros = small.all(axis=0)
+        if zeros.any():
+            # columns of zeros hold integers, as when mapping `round_down`
+            data = data.astype({idx: np.int64 for idx in np.flatnonzero(zeros)})
+        data.columns = df.columns
+        return data
+
     def dataset(df, **kwargs):
-        data = df.replace({ np.nan: None }).applymap(round_down)
+        data = round_down_frame(df)
         data = data.reset_index().rename(columns={'index': 'year'})
         dataset = {
             'data': data,
@@ -0,0 +1,59 @@
+from app.common import HTTPException, validate_inputs
+from core import cache
+from core.jobs import JobQueue
+from flask import Blueprint, request, url_for
+import os
+
+app = Blueprint('jobs', __name__)
+
+
+def _build_queue():
+    ttl = float(os.environ.get('JOB_TTL') or 3600)
+    maxsize = int(os.environ.get('JOB_STORE_SIZE') or 64)
+
+    # jobs are run by the process that received them, but their records can
+    # be shared by all processes on the host, so that any API worker can
+    # report on any job
+    path = os.environ.get('JOB_STORE_PATH')
+    if path:
+        store = cache.SQLiteCache(path, maxsize=maxsize, ttl=ttl)
+    else:
+        store = cache.LRUCache(maxsize=maxsize, ttl=ttl)
+
+    # number of analyses run at the same time by each API worker: the limit
+    # for the host is this times the number of API workers
+    workers = int(os.environ.get('JOB_WORKERS') or 2)
+    return JobQueue(workers=workers, store=store, ttl=ttl)
+
+
+queue = _build_queue()
+
+
+def _job(job_id):
+    job = queue.status(job_id)
+    if job is None:
+        raise HTTPException('no such job', 404)
+
+    fields = ['status', 'submitted', 'started', 'finished', 'position', 'elapsed', 'result', 'error']
+    data = {'id': job_id}
+    data.update((field, job[field]) for field in fields if field in job)
+    return data
+
+
+def submit(fn, model_class, input_values):
+    """
+    Returns `fn(input_values)`, or with `?async=true`, queues it and returns
+    202 Accepted with the job, to be polled at `/jobs/<id>`. The inputs are
+    validated before the job is queued.
+    """
+    if request.args.get('async', '').lower() not in ('1', 'true', 'yes'):
+        return fn(input_values)
+
+    validate_inputs(model_class, input_values)
+    job_id = queue.submit(fn, input_values)
+    return _job(job_id), 202, {'Location': url_for('jobs._status', job_id=job_id)}
+
+
+@app.route('/<job_id>', methods=['GET'])
+def _status(job_id):
+    return _job(job_id)
@@ -6,6 +6,7 @@ from schematics.models import Model
 from schematics.types import StringType, IntType, FloatType, ListType, ModelType, UnionType, DictType
 from analysis.system.power_historic import analyses as system_analyses
 from analysis.system.power_historic import years as system_years
+from analysis.system.power_historic import data_version as system_data_version
 
 app = Blueprint('power_historic', __name__)
 
@@ -25,7 +26,7 @@ class Analysis(Model):
         input_set.validate()
 
 @app.route('/metadata', methods=['GET'])
-@metadata_response
+@metadata_response(version=system_data_version)
 def _metadata():
     return {
         'analyses': [
@@ -0,0 +1,88 @@
+"""
+Reports the size of every data table and the memory the workers of a
+pre-forking server save by sharing them (see `core.registry`).
+
+The saving is measured by forking `--workers` processes that each read every
+table, once with the tables loaded by each worker and once with the tables
+preloaded in the parent, and comparing their private memory (Linux only).
+
+Run from the repository root:
+
+    python -m benchmarks.data_memory --workers 16
+"""
+import argparse
+import multiprocessing
+import re
+import warnings
+
+from core import registry
+
+MB = 1024 * 1024
+
+
+def private_bytes():
+    res = 0
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            match = re.match(r'(Private_Clean|Private_Dirty):\s+(\d+) kB', line)
+            if match:
+                res += int(match.group(2)) * 1024
+    return res
+
+
+def _worker(preloaded, queue):
+    start = private_bytes()
+    if not preloaded:
+        registry.preload()
+    for df in registry.tables().values():
+        # reads every value, as requests do over time
+        registry.table_bytes(df)
+    queue.put(private_bytes() - start)
+
+
+def measure(workers, preloaded):
+    """
+    Returns the private memory (in bytes) each of `workers` forked processes
+    allocated to load and read the tables.
+    """
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    processes = [context.Process(target=_worker, args=(preloaded, queue)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    res = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return res
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--top', type=int, default=20, help='number of tables to list')
+    parser.add_argument('--no-measure', dest='measure', action='store_false')
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    if args.measure:
+        # the modules are imported first so that only the tables are measured
+        for module in registry.MODULES:
+            __import__(module)
+        unshared = measure(args.workers, preloaded=False)
+
+    registry.preload()
+    report = registry.report(args.workers)
+    for row in report['tables'][:args.top]:
+        print(f'{row["bytes"] / MB:8.2f} MB  {row["rows"]:>7} x {row["columns"]:<4} {row["table"]}')
+    print(f'{len(report["tables"])} tables, {report["total_bytes"] / MB:.2f} MB per process')
+    print(f'saving over {args.workers} workers, at most: {report["max_shared_bytes"] / MB:.2f} MB')
+
+    if args.measure:
+        shared = measure(args.workers, preloaded=True)
+        print(f'private memory per worker, loading the tables: {sum(unshared) / len(unshared) / MB:.2f} MB')
+        print(f'private memory per worker, preloaded tables: {sum(shared) / len(shared) / MB:.2f} MB')
+        print(f'measured saving over {args.workers} workers: {(sum(unshared) - sum(shared)) / MB:.2f} MB')
+
+
+if __name__ == '__main__':
+    main()
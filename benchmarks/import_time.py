@@ -0,0 +1,65 @@
+"""
+Measures the cold-start import time of the modules loaded by workers, the
+CLI and the app, each in a fresh interpreter. Exits with a non-zero status
+if any module takes longer than `--limit` seconds.
+
+Run from the repository root:
+
+    python -m benchmarks.import_time
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    'core.pathway',
+    'pathway.topology',
+    'tea.topology',
+    'analysis.lca',
+    'analysis.system.grid.grid',
+    'analysis.system.fleet.fleet',
+]
+
+SCRIPT = '''
+import time
+import warnings
+warnings.simplefilter('ignore')
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+'''
+
+
+def import_time(module):
+    res = subprocess.run(
+        [sys.executable, '-c', SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(res.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--number', type=int, default=5)
+    parser.add_argument('--limit', type=float, default=None)
+    args = parser.parse_args()
+
+    slow = []
+    for module in args.modules:
+        times = [import_time(module) for _ in range(args.number)]
+        median = statistics.median(times)
+        print(f'{module}: median {median * 1000:.0f} ms, min {min(times) * 1000:.0f} ms')
+        if args.limit is not None and median > args.limit:
+            slow.append(module)
+
+    if len(slow) > 0:
+        print(f'over {args.limit} s: {", ".join(slow)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Compares `analysis.lca.compute_input_flows` and `compute_emission_flows`
+with the previous per-flow implementation on the GREET-based process tables.
+
+Run from the repository root:
+
+    python -m benchmarks.lca_flows
+"""
+import argparse
+import timeit
+
+import pandas as pd
+
+import analysis.lca as lca
+from pathway.topology import metadata
+
+
+def legacy_activity_flows(df, flow_output, flow_info):
+    flow_dict = {}
+    flows = pd.unique(df['flows'].dropna())
+
+    for i in flows:
+        row = df[df['flows'] == i].groupby('flows').agg({'value': 'sum', 'unit': 'first'}).reset_index().iloc[0]
+        row['value'] = float(row['value'])
+        flow = {"name": i.lower()}
+        upper_unit, lower_unit = row['unit'].split('/')
+        flow["unit"] = upper_unit
+        if lower_unit in ("MJmile", "kgmile"):
+            flow["value"] = round(row['value'] * flow_output['value'] * flow_info["distance"], 9)
+        else:
+            flow["value"] = round(row['value'] * flow_output['value'], 9)
+
+        flow_dict[i.lower()] = flow
+
+    return flow_dict
+
+
+def legacy_flows(df, flow_output, flow_info):
+    final_dict = {}
+    if "activity" in list(df.columns):
+        for activity in list(df["activity"].unique()):
+            activity_df = df[df["activity"] == activity]
+            final_dict[activity] = legacy_activity_flows(activity_df, flow_output, flow_info)
+    else:
+        final_dict["aggregate"] = legacy_activity_flows(df, flow_output, flow_info)
+    return final_dict
+
+
+def greet_tables():
+    seen = set()
+    for stage in metadata.stages:
+        if stage.name != 'Process':
+            continue
+        for activity in stage.activities:
+            for source in activity.sources:
+                table = source.cls.lookup_table
+                if table is not None and 'greet' in table.lower() and table not in seen:
+                    seen.add(table)
+                    yield table, source.cls.data_frame()
+
+
+def workload(df):
+    """
+    Restricts `df` to rows whose units are consistent with a single output
+    unit, so that both implementations accept it.
+    """
+    df = df[df['flows'].notna() & df['unit'].notna()]
+    lower_units = df['unit'].str.split('/').str[1]
+    output_units = lower_units.replace({'MJmile': 'MJ', 'kgmile': 'kg'})
+    unit = output_units.mode().iloc[0]
+    return df[output_units == unit], {'unit': unit, 'value': 2.5}, {'distance': 100}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    legacy_total = 0
+    vectorized_total = 0
+    for table, df in greet_tables():
+        df, flow_output, flow_info = workload(df)
+        outputs = df[df['direction'] == 'output']
+        inputs = df[df['direction'] == 'input']
+
+        assert lca.compute_flows(outputs, flow_output, flow_info) == legacy_flows(outputs, flow_output, flow_info)
+        assert lca.compute_flows(inputs, flow_output, flow_info) == legacy_flows(inputs, flow_output, flow_info)
+
+        def run_legacy():
+            legacy_flows(outputs, flow_output, flow_info)
+            legacy_flows(inputs, flow_output, flow_info)
+
+        def run_vectorized():
+            lca.compute_flows(outputs, flow_output, flow_info)
+            lca.compute_flows(inputs, flow_output, flow_info)
+
+        legacy = timeit.timeit(run_legacy, number=args.number) / args.number
+        vectorized = timeit.timeit(run_vectorized, number=args.number) / args.number
+        legacy_total += legacy
+        vectorized_total += vectorized
+        print(f'{table}: {len(df)} rows, legacy {legacy * 1000:.2f} ms, '
+              f'vectorized {vectorized * 1000:.2f} ms ({legacy / vectorized:.1f}x)')
+
+    print(f'total: legacy {legacy_total * 1000:.2f} ms, vectorized {vectorized_total * 1000:.2f} ms '
+          f'({legacy_total / vectorized_total:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Measures the time to serialize analysis results to JSON: the grid and fleet
+model outputs (with default inputs), an hourly data frame and an
+`AnalysisResult`.
+
+Run from the repository root:
+
+    python -m benchmarks.serialization
+"""
+import argparse
+import json
+import statistics
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from core.analysis import AnalysisResult
+from core.common import JSONEncoder
+from core.inputs import InputSet
+
+
+def model_outputs(cls):
+    model = cls()
+    model.prepare(InputSet(cls.inputs(), {}))
+    return model.run()
+
+
+def hourly_frame(rng):
+    df = pd.DataFrame(rng.normal(size=(8760, 20)), columns=[f'series {i}' for i in range(20)])
+    df[rng.random(df.shape) < 0.05] = np.nan
+    return df
+
+
+def analysis_result(rng):
+    n = 10000
+    return AnalysisResult(
+        title='Benchmark',
+        columns=['pathway', 'stage', 'flows', 'value'],
+        data=pd.DataFrame({
+            'pathway': rng.choice(['a', 'b', 'c'], n).astype(object),
+            'stage': rng.choice(['Enduse', 'Process', 'Upstream'], n).astype(object),
+            'flows': rng.choice(['co2', 'ch4', 'n2o'], n).astype(object),
+            'value': rng.normal(size=n),
+        }),
+    )
+
+
+def cases():
+    import analysis.system.fleet.fleet as fleet
+    import analysis.system.grid.grid as grid
+
+    rng = np.random.default_rng(0)
+    result = analysis_result(rng)
+    return {
+        'grid': model_outputs(grid.Grid),
+        'fleet': model_outputs(fleet.FleetModel),
+        'hourly frame': hourly_frame(rng),
+        'analysis result': lambda: result.serialize(),
+    }
+
+
+def serialize(data):
+    if callable(data):
+        data = data()
+    return json.dumps(data, cls=JSONEncoder)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+    warnings.simplefilter('ignore')
+
+    for name, data in cases().items():
+        times = []
+        for _ in range(args.number):
+            start = time.perf_counter()
+            text = serialize(data)
+            times.append(time.perf_counter() - start)
+        median = statistics.median(times)
+        print(f'{name}: {len(text) / 1024:.0f} kB, median {median * 1000:.2f} ms, min {min(times) * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
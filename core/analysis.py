@@ -55,10 +55,7 @@ class AnalysisResult:
             'value': self.value,
             'columns': self.columns,
             'params': self.params,
-            'data': [
-                item.tolist()
-                for item in self.data.to_numpy()
-            ]
+            'data': self.data.to_numpy().tolist(),
         }
 
 
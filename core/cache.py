@@ -0,0 +1,272 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+MISSING = object()
+
+
+def fingerprint(obj):
+    """
+    Returns a stable hash of `obj`, which should be made up of dicts, lists and
+    scalars. Dicts are hashed independently of their key order.
+    """
+    text = json.dumps(obj, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory cache holding at most `maxsize` entries, evicting
+    the least recently used entry first. If `ttl` is set, entries expire
+    `ttl` seconds after they were set.
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            if key in self._entries:
+                value, expires = self._entries[key]
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': len(self._entries),
+        }
+
+
+class DiskCache:
+    """
+    Cache storing pickled values as one file per key under `path`.
+    Keys must be valid file names (e.g. the output of `fingerprint`).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], f'{key}.pickle')
+
+    def get(self, key, default=MISSING):
+        try:
+            with open(self._file(key), 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        file = self._file(key)
+        try:
+            os.makedirs(os.path.dirname(file), exist_ok=True)
+
+            # write to a temporary file first so that concurrent readers never
+            # see a partially written entry
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(file))
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f)
+            os.replace(tmp, file)
+        except OSError:
+            # the disk tier is best effort
+            pass
+
+    def clear(self):
+        try:
+            entries = os.listdir(self.path)
+        except OSError:
+            return
+        for entry in entries:
+            shutil.rmtree(os.path.join(self.path, entry), ignore_errors=True)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class SQLiteCache:
+    """
+    Cache storing pickled values in the SQLite database at `path`, which can
+    be shared by all processes on a host. Holds at most `maxsize` entries
+    (the oldest are evicted first) that expire after `ttl` seconds if set.
+    Keys must be strings (e.g. the output of `fingerprint`).
+    """
+
+    # number of `set` calls between checks of the number of entries
+    prune_interval = 100
+
+    def __init__(self, path, maxsize=None, ttl=None):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sets = 0
+        self._local = threading.local()
+
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS entries ('
+                    'key TEXT PRIMARY KEY, value BLOB NOT NULL, created REAL NOT NULL, expires REAL)'
+                )
+        except sqlite3.Error:
+            # the shared tier is best effort
+            pass
+
+    def _connection(self):
+        # sqlite connections can't be shared between threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key, default=MISSING):
+        try:
+            row = self._connection().execute(
+                'SELECT value FROM entries WHERE key = ? AND (expires IS NULL OR expires > ?)',
+                (key, time.time()),
+            ).fetchone()
+            value = pickle.loads(row[0]) if row is not None else MISSING
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError):
+            value = MISSING
+
+        if value is MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        now = time.time()
+        expires = now + self.ttl if self.ttl is not None else None
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO entries (key, value, created, expires) VALUES (?, ?, ?, ?)',
+                    (key, sqlite3.Binary(pickle.dumps(value)), now, expires),
+                )
+            self._sets += 1
+            if self._sets % self.prune_interval == 0:
+                self.prune()
+        except sqlite3.Error:
+            pass
+
+    def prune(self):
+        """
+        Removes expired entries and, beyond `maxsize`, the oldest entries.
+        """
+        with self._connection() as conn:
+            conn.execute('DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?', (time.time(),))
+            if self.maxsize is not None:
+                cursor = conn.execute(
+                    'DELETE FROM entries WHERE key IN ('
+                    'SELECT key FROM entries ORDER BY created DESC LIMIT -1 OFFSET ?)',
+                    (self.maxsize,),
+                )
+                self.evictions += max(cursor.rowcount, 0)
+
+    def clear(self):
+        try:
+            with self._connection() as conn:
+                conn.execute('DELETE FROM entries')
+        except sqlite3.Error:
+            pass
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class TieredCache:
+    """
+    In-memory LRU cache backed by an optional shared tier: either the
+    `shared` cache given, or a `DiskCache` at `path`. Values found in the
+    shared tier are promoted to memory.
+    """
+
+    def __init__(self, maxsize=128, path=None, ttl=None, shared=None):
+        self.memory = LRUCache(maxsize, ttl=ttl)
+        self.disk = shared
+        if self.disk is None and path:
+            self.disk = DiskCache(path)
+
+    def get(self, key, default=MISSING):
+        value = self.memory.get(key)
+        if value is MISSING and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not MISSING:
+                self.memory.set(key, value)
+        if value is MISSING:
+            return default
+        return value
+
+    def set(self, key, value):
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        res = {'memory': self.memory.stats()}
+        if self.disk is not None:
+            res['disk'] = self.disk.stats()
+        return res
@@ -0,0 +1,265 @@
+"""
+Binary cache of the data frames read from CSV files.
+
+`read_csv` is a drop-in replacement for `pd.read_csv`. The first time a file
+is read (with a given set of arguments) the parsed frame is converted into a
+binary file holding the arrays of its columns and index levels, plus a JSON
+file describing them, keyed by the SHA-256 of the CSV's content. Later reads
+memory-map the binary file and take every column as a view of it instead of
+parsing the CSV again. Any change to the CSV's content changes the key.
+
+Numeric, boolean and datetime columns are stored as they are, and loaded
+without copying. Text columns (strings and missing values, as `read_csv`
+returns them) are stored as the codes of their values in a fixed-width
+unicode array of the distinct values (-1 for missing values): loading them
+still builds a Python string per distinct value and an object array of
+references to them, so tables made mostly of unique strings gain less than
+numeric ones. Frames with other columns are returned without being cached.
+
+The cache lives in `DATA_CACHE_DIR` (`.cache/data` under the repository by
+default, relative paths are relative to the repository too); setting it to
+an empty value disables the cache.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.cache import fingerprint
+
+# bumped when the layout of the cached files changes
+FORMAT = 2
+
+# arrays are aligned to this many bytes in the binary file
+ALIGNMENT = 64
+
+# the same for the app, the CLI and the tests, whatever the working directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CACHE_DIR = os.environ.get('DATA_CACHE_DIR', os.path.join('.cache', 'data'))
+if CACHE_DIR:
+    CACHE_DIR = os.path.join(ROOT, CACHE_DIR)
+
+# (path, size, mtime) -> content hash, to hash each file once per process
+_hashes = {}
+_hashes_lock = threading.Lock()
+
+
+class Unsupported(Exception):
+    pass
+
+
+def content_hash(path):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    res = _hashes.get(key)
+    if res is None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        res = digest.hexdigest()
+        with _hashes_lock:
+            _hashes[key] = res
+    return res
+
+
+def cache_key(path, kwargs):
+    return fingerprint({
+        'content': content_hash(path),
+        'kwargs': kwargs,
+        'pandas': pd.__version__,
+        'format': FORMAT,
+    })
+
+
+def read_csv(path, **kwargs):
+    """
+    Returns `pd.read_csv(path, **kwargs)`, from the binary cache when
+    possible.
+    """
+    if not CACHE_DIR or not isinstance(path, (str, os.PathLike)) or kwargs.get('chunksize') or kwargs.get('iterator'):
+        return pd.read_csv(path, **kwargs)
+
+    entry = os.path.join(CACHE_DIR, *_split(cache_key(path, kwargs)))
+    try:
+        return load(entry)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    df = pd.read_csv(path, **kwargs)
+    try:
+        store(df, entry)
+    except (Unsupported, OSError):
+        # the cache is best effort
+        pass
+    return df
+
+
+def _split(key):
+    return key[:2], key + '.json'
+
+
+def _encode(values):
+    """
+    Returns the arrays to store for the column (or index level) `values`.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'biufcmM':
+        return {'kind': 'array'}, [values]
+
+    if values.dtype.kind == 'O':
+        missing = pd.isna(values)
+        present = values[~missing]
+        if all(type(value) is str for value in present):
+            codes, uniques = pd.factorize(values)
+            return {'kind': 'text'}, [codes.astype(np.int32), np.asarray(uniques, dtype=str)]
+
+    raise Unsupported(values.dtype)
+
+
+def _decode(meta, arrays):
+    if meta['kind'] == 'array':
+        return arrays[0]
+
+    codes, uniques = arrays
+    # missing values (-1) take the last item
+    return np.append(uniques.astype(object), np.nan).take(codes)
+
+
+def _label(label):
+    if isinstance(label, (str, int, float, bool)) or label is None:
+        return label
+    if isinstance(label, np.integer):
+        return int(label)
+    raise Unsupported(type(label))
+
+
+def _aligned(size):
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _add_arrays(arrays, new_arrays):
+    res = []
+    for array in new_arrays:
+        array = np.ascontiguousarray(array)
+        array_meta = {'dtype': array.dtype.str, 'shape': list(array.shape)}
+        arrays.append((array_meta, array))
+        res.append(array_meta)
+    return res
+
+
+def _write_arrays(f, arrays):
+    for _, array in arrays:
+        f.write(array.tobytes())
+        f.write(b'\0' * (_aligned(array.nbytes) - array.nbytes))
+
+
+def _write(path, write):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp, path)
+    except OSError:
+        os.remove(tmp)
+        raise
+
+
+def _data_path(path):
+    return path[:-len('.json')] + '.bin'
+
+
+def store(df, path):
+    """
+    Writes `df` to the cache entry at `path`. Raises `Unsupported` if any of
+    its columns can't be stored.
+    """
+    if isinstance(df.columns, pd.MultiIndex):
+        raise Unsupported('multi-level columns')
+
+    meta = {
+        'length': len(df),
+        'columns': [_label(column) for column in df.columns],
+        'column_values': [],
+        'index': None,
+        'index_values': [],
+    }
+    arrays = []
+
+    for idx in range(len(df.columns)):
+        column_meta, column_arrays = _encode(df.iloc[:, idx].values)
+        column_meta['arrays'] = _add_arrays(arrays, column_arrays)
+        meta['column_values'].append(column_meta)
+
+    index = df.index
+    if isinstance(index, pd.RangeIndex):
+        meta['index'] = {'range': [index.start, index.stop, index.step], 'name': _label(index.name)}
+    else:
+        meta['index'] = {'names': [_label(name) for name in index.names]}
+        for level in range(index.nlevels):
+            level_meta, level_arrays = _encode(index.get_level_values(level).values)
+            level_meta['arrays'] = _add_arrays(arrays, level_arrays)
+            meta['index_values'].append(level_meta)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    offset = 0
+    for array_meta, array in arrays:
+        array_meta['offset'] = offset
+        offset += _aligned(array.nbytes)
+    meta['size'] = offset
+
+    # the binary file is written before the JSON file that `load` opens first,
+    # and both through temporary files, so that concurrent readers never see
+    # a partially written entry
+    _write(_data_path(path), lambda f: _write_arrays(f, arrays))
+    _write(path, lambda f: f.write(json.dumps(meta).encode('utf-8')))
+
+
+def _load_values(data, meta):
+    arrays = [
+        np.ndarray(
+            shape=tuple(array_meta['shape']),
+            dtype=np.dtype(array_meta['dtype']),
+            buffer=data,
+            offset=array_meta['offset'],
+        )
+        for array_meta in meta['arrays']
+    ]
+    return _decode(meta, arrays)
+
+
+def load(path):
+    """
+    Returns the data frame stored in the cache entry at `path`.
+    """
+    with open(path) as f:
+        meta = json.load(f)
+
+    if meta['size'] > 0:
+        data = np.memmap(_data_path(path), mode='c', dtype=np.uint8, shape=(meta['size'],))
+    else:
+        data = b''
+
+    index_meta = meta['index']
+    if 'range' in index_meta:
+        index = pd.RangeIndex(*index_meta['range'], name=index_meta['name'])
+    else:
+        levels = [_load_values(data, level_meta) for level_meta in meta['index_values']]
+        if len(levels) == 1:
+            index = pd.Index(levels[0], name=index_meta['names'][0])
+        else:
+            index = pd.MultiIndex.from_arrays(levels, names=index_meta['names'])
+
+    columns = {
+        idx: _load_values(data, column_meta)
+        for idx, column_meta in enumerate(meta['column_values'])
+    }
+    # views of the memory-mapped file, which is copied on write
+    df = pd.DataFrame(columns, index=index, copy=False)
+    df.columns = pd.Index(meta['columns'])
+    return df
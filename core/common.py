@@ -1,12 +1,12 @@
 import json
 import math
-import matplotlib.colors as colors
 import numbers
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_numeric_dtype
 
-from core.inputs import InputSet
+from core import catalog
+from core.inputs import InputSet, schema
+from core.tables import Table
 
 
 class DataSource:
@@ -26,13 +26,19 @@ class DataSource:
             self._df = None
 
         if self._df is None and self.table is not None:
-            df = pd.read_csv(self.table)
+            df = catalog.read_csv(self.table)
             for field, value in type(self).filters:
                 df = df[df[field] == value]
             self._df = df
 
         return self._df
 
+    def data_table(self):
+        df = self.data_frame()
+        if getattr(self, '_table', None) is None or self._table.frame is not df:
+            self._table = Table(df)
+        return self._table
+
 
 class InputSource:
     """
@@ -46,8 +52,9 @@ class InputSource:
 
     @classmethod
     def inputs(cls):
-        # this should be overridden in child classes
-        return cls.user_inputs()
+        # the inputs declared by `user_inputs` are built once per class version
+        # and shared, see `core.inputs.schema`
+        return schema((cls, getattr(cls, 'version', None)), cls.user_inputs)
 
     @classmethod
     def input_set(cls, values):
@@ -86,16 +93,13 @@ class InputSource:
 
     # only applicable for instances that are also a `DataSource`
     def filtered_data_frame(self):
-        df = self.data_frame()
-
+        criteria = []
         for input_name, input in self.input_set.inputs.items():
             value = self.input_set.value(input_name, default=False)
             if value is not None and input.input_type == 'categorical':
-                if is_numeric_dtype(df[input.label].dtype):
-                    value = float(value)
-                df = df[df[input.label] == value]
+                criteria.append((input.label, value))
 
-        return df
+        return self.data_table().select(criteria)
 
     def categorical_options(self, input):
         df = self.filtered_data_frame()
@@ -115,28 +119,54 @@ class JSONEncoder(json.JSONEncoder):
         if isinstance(obj, np.integer) or isinstance(obj, np.floating):
             return self._value(obj)
         elif isinstance(obj, np.ndarray):
+            if obj.ndim == 1:
+                return self._values(obj)
             return [
                 self._value(value)
                 for value in obj.tolist()
             ]
         elif isinstance(obj, pd.DataFrame):
-            return [
-                [
-                    self._value(value)
-                    for value in item.tolist()
-                ]
-                for item in obj.to_numpy()
-            ]
+            return self._values(obj.to_numpy())
         elif isinstance(obj, pd.Series):
-            return [
-                self._value(value)
-                for value in obj.to_numpy().tolist()
-            ]
+            return self._values(obj.to_numpy())
         elif isinstance(obj, Color):
             return repr(obj)
         else:
             return super(JSONEncoder, self).default(obj)
 
+    def _values(self, values):
+        """
+        Returns the list (of rows, if `values` is 2-dimensional) of the
+        values of the array `values`, as `_value` returns them.
+        """
+        kind = values.dtype.kind
+        if kind == 'f':
+            # NaN and inf (but not -inf) are masked as a whole
+            mask = np.isnan(values) | (values == np.inf)
+            if mask.any():
+                values = values.astype(object)
+                values[mask] = None
+            return values.tolist()
+        elif kind in 'iub':
+            return values.tolist()
+        elif values.ndim == 2:
+            return [self._list(row) for row in values.tolist()]
+        else:
+            return self._list(values.tolist())
+
+    def _list(self, values):
+        res = []
+        for value in values:
+            # shortcuts for the most common types, `_value` for the others
+            cls = type(value)
+            if cls is float:
+                res.append(None if value != value or value == math.inf else value)
+            elif cls is int or cls is str or value is None:
+                res.append(value)
+            else:
+                res.append(self._value(value))
+        return res
+
     def _value(self, value):
         if value is None:
             return None
@@ -163,6 +193,8 @@ class Color:
         if self.hex is not None:
             return self.hex
         if self.name is not None:
+            # matplotlib is slow to import and only needed here
+            import matplotlib.colors as colors
             return colors.to_hex(self.name)
 
     def toJson(self):
@@ -1,16 +1,25 @@
-class Conditional:
+from core.inputs import Freezable
 
-    def __init__(self, name, fn, *args):
+class Conditional(Freezable):
+
+    def __init__(self, name, fn, *args, input_names=None):
         self.name = name
         self.fn = fn
         self.args = args
 
+        # names of the inputs whose value or relevance the check reads, or
+        # `None` if unknown (the check may then read any input)
+        self._input_names = input_names
+
     def __repr__(self):
         return f"Conditional('{self.name}', {self.args})"
 
     def check(self, input_set):
         return self.fn(input_set, *self.args)
 
+    def input_names(self):
+        return self._input_names
+
     def serialize(self):
         return {
             'name': self.name,
@@ -22,7 +31,23 @@ def conditional(fn):
         return Conditional(fn.__name__, fn, *args)
     return inner
 
-@conditional
+def input_conditional(fn):
+    """
+    Conditional on the input named by its first argument
+    """
+    def inner(input_name, *args):
+        return Conditional(fn.__name__, fn, input_name, *args, input_names=[input_name])
+    return inner
+
+def context_conditional(fn):
+    """
+    Conditional on the input set's context only
+    """
+    def inner(*args):
+        return Conditional(fn.__name__, fn, *args, input_names=[])
+    return inner
+
+@input_conditional
 def input_equal_to(input_set, input_name, input_value):
     input = input_set.input(input_name)
     if not input:
@@ -30,24 +55,24 @@ def input_equal_to(input_set, input_name, input_value):
     value = input_set.value(input_name)
     return input.is_relevant(input_set) and value == input_value
 
-@conditional
+@input_conditional
 def input_not_equal_to(input_set, input_name, input_value):
     input = input_set.input(input_name)
     value = input_set.value(input_name)
     return input.is_relevant(input_set) and value != input_value
 
-@conditional
+@input_conditional
 def input_greater_than(input_set, input_name, input_value):
     input = input_set.input(input_name)
     value = input_set.value(input_name)
     return input.is_relevant(input_set) and value > input_value
 
-@conditional
+@input_conditional
 def input_included_in(input_set, input_name, input_values):
     input = input_set.input(input_name)
     value = input_set.value(input_name)
     return input.is_relevant(input_set) and value in input_values
 
-@conditional
+@context_conditional
 def context_equal_to(input_set, context_key, context_val):
     return input_set.context.get(context_key, None) == context_val
@@ -1,9 +1,130 @@
+import copy
 import json
+import threading
 from schematics.exceptions import ValidationError, CompoundError, BaseError
 
 from core import validators
 
-class Default:
+_MISSING = object()
+
+class FrozenList(list):
+    """
+    List that can't be modified in place, used in shared input schemas.
+    Copies (`copy`, slicing, `+`) are plain lists.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('input schemas are shared and immutable, use `copy_inputs` to modify them')
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def copy(self):
+        return list(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+class Freezable:
+    """
+    Mixin for the objects making up input schemas. Once frozen (see
+    `freeze`), attributes can't be set and list attributes can't be modified.
+    Deep copies are not frozen.
+    """
+
+    _frozen = False
+
+    # attributes derived from the others, which copies recompute
+    _derived_attributes = ()
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise TypeError('input schemas are shared and immutable, use `copy_inputs` to modify them')
+        super().__setattr__(name, value)
+
+    def __deepcopy__(self, memo):
+        res = object.__new__(type(self))
+        memo[id(self)] = res
+        for name, value in self.__dict__.items():
+            if name != '_frozen' and name not in self._derived_attributes:
+                object.__setattr__(res, name, copy.deepcopy(value, memo))
+        return res
+
+def freeze(obj):
+    """
+    Makes the tree of schema objects under `obj` immutable, in place.
+    Returns the frozen `obj` (lists are replaced by `FrozenList`s).
+    """
+    if isinstance(obj, list):
+        return FrozenList(freeze(item) for item in obj)
+
+    if isinstance(obj, Freezable) and not obj._frozen:
+        for name, value in list(obj.__dict__.items()):
+            if isinstance(value, (list, Freezable)):
+                object.__setattr__(obj, name, freeze(value))
+        if isinstance(obj, InputNode):
+            # cached before freezing
+            obj.input_dependencies()
+        object.__setattr__(obj, '_frozen', True)
+    return obj
+
+def copy_inputs(inputs):
+    """
+    Returns a mutable copy of a (frozen) list of inputs.
+    """
+    return copy.deepcopy(list(inputs))
+
+_schemas = {}
+_schemas_lock = threading.Lock()
+
+def schema(key, build):
+    """
+    Returns the list of inputs built by `build()` for `key`, building it only
+    the first time. The inputs are frozen and shared by all callers.
+    """
+    inputs = _schemas.get(key)
+    if inputs is None:
+        with _schemas_lock:
+            inputs = _schemas.get(key)
+            if inputs is None:
+                inputs = freeze(list(build()))
+                _schemas[key] = inputs
+    return inputs
+
+def clear_schemas():
+    with _schemas_lock:
+        _schemas.clear()
+
+def conditional_input_names(conditionals):
+    """
+    Returns the names of the inputs read by `conditionals`, or `None` if any
+    of them may read any input
+    """
+    names = set()
+    for conditional in conditionals:
+        input_names = conditional.input_names()
+        if input_names is None:
+            return None
+        names.update(input_names)
+    return names
+
+def _copy_value(value):
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+def _same_value(a, b):
+    try:
+        return type(a) == type(b) and bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+class Default(Freezable):
 
     def __init__(self, value, conditionals=None):
         self.value = value
@@ -25,7 +146,7 @@ class Default:
             ]
         }
 
-class Tooltip:
+class Tooltip(Freezable):
 
     def __init__(self, content=None, source=None, source_link=None):
         self.content = content
@@ -39,10 +160,12 @@ class Tooltip:
             'source_link': self.source_link,
         }
 
-class InputNode:
+class InputNode(Freezable):
     # this class is intended to be overridden
     input_type = 'unknown'
 
+    _derived_attributes = ('_input_dependencies',)
+
     def __init__(self, name, label, conditionals=None, children=None):
         self.name = name
         self.label = label
@@ -50,11 +173,31 @@ class InputNode:
         self.children = children or []
 
     def is_relevant(self, input_set):
+        return input_set.is_relevant(self)
+
+    def check_relevant(self, input_set):
         relevant = True
         for conditional in self.conditionals:
             relevant = relevant and conditional.check(input_set)
         return relevant
 
+    def dependency_conditionals(self):
+        """
+        Returns the conditionals that the relevance and default value of this
+        node depend on
+        """
+        return list(self.conditionals)
+
+    def input_dependencies(self):
+        """
+        Returns the names of the inputs that the relevance and default value
+        of this node depend on, or `None` if unknown
+        """
+        # computed once: conditionals are only added while building the inputs
+        if not hasattr(self, '_input_dependencies'):
+            self._input_dependencies = conditional_input_names(self.dependency_conditionals())
+        return self._input_dependencies
+
     def validate(self, value):
         for validator in self.validators:
             validator.validate(value)
@@ -114,6 +257,12 @@ class Input(InputNode):
     def default_value(self, input_set):
         return default_value(self, input_set)
 
+    def dependency_conditionals(self):
+        res = super().dependency_conditionals()
+        for default in self.defaults:
+            res += default.conditionals
+        return res
+
     def transform(self, value):
         if value == '':
             return None
@@ -166,7 +315,7 @@ class PercentInput(ContinuousInput):
 class CategoricalInput(Input):
     input_type = 'categorical'
 
-class Option:
+class Option(Freezable):
 
     def __init__(self, value, conditionals=[]):
         self.value = value
@@ -228,7 +377,7 @@ class OptionsInput(Input):
 class ShareTableInput(Input):
     input_type = 'share_table'
 
-    class Cell:
+    class Cell(Freezable):
 
         def __init__(self, defaults=None, remainder=None, column_total=None):
             self.defaults = defaults
@@ -245,7 +394,7 @@ class ShareTableInput(Input):
                 'column_total': self.column_total,
             }
 
-    class Row:
+    class Row(Freezable):
 
         def __init__(self, name, cells=None, label=None, tooltip=None):
             self.name = name
@@ -289,6 +438,14 @@ class ShareTableInput(Input):
 
         return res
 
+    def dependency_conditionals(self):
+        res = super().dependency_conditionals()
+        for row in self.rows:
+            for cell in row.cells:
+                for default in cell.defaults or []:
+                    res += default.conditionals
+        return res
+
     def transform(self, value):
         value = super().transform(value)
         if type(value) == str:
@@ -320,6 +477,11 @@ class InputSet:
     """
     An `InputSet` is an ordered set of user inputs together
     with one or more corresponding values.
+
+    The relevance and default value of each input are memoized. The
+    conditionals of the inputs form a dependency graph (input -> inputs whose
+    conditionals read it), and setting a value only forgets the memoized
+    results of the inputs that depend on it, directly or not.
     """
 
     @classmethod
@@ -351,6 +513,14 @@ class InputSet:
         self.inputs = {}
         self._add_inputs(inputs)
 
+        # memoized relevance and default value of each input
+        self._relevance = {}
+        self._defaults = {}
+
+        # dict of input_name -> names of the inputs depending on it, built
+        # when first needed
+        self._dependents = None
+
         # dict of input_name -> value
         self.values = {}
         if values is not None:
@@ -362,11 +532,20 @@ class InputSet:
         # make a copy of the given context
         self.context = dict(context or {})
 
+    @property
+    def context(self):
+        return self._context
+
+    @context.setter
+    def context(self, context):
+        self._context = context
+        self._invalidate_all()
+
     def __contains__(self, input_name):
         input = self.inputs.get(input_name)
         if input is None:
             return False
-        return input.is_relevant(self)
+        return self.is_relevant(input)
 
     @property
     def input_names(self):
@@ -379,11 +558,13 @@ class InputSet:
         inputs = list(self.inputs.values())
 
         self.values = {}
+        self._invalidate_all()
         for value in values:
             input = inputs.pop(0)
-            while not input.is_relevant(self):
+            while not self.is_relevant(input):
                 input = inputs.pop(0)
             self.values[input.name] = value
+            self._invalidate(input.name)
 
     def input(self, input_name):
         return self.inputs.get(input_name)
@@ -394,8 +575,27 @@ class InputSet:
             res = self.default_value(input_name)
         return res
 
+    def resolved_values(self):
+        """
+        Returns the values of all the inputs, set or default, i.e. those read
+        by `value`
+        """
+        return {
+            input_name: self.value(input_name)
+            for input_name in self.input_names
+        }
+
     def set_value(self, input_name, value):
-        self.values[input_name] = self.inputs[input_name].transform(value)
+        value = self.inputs[input_name].transform(value)
+
+        previous = self.values.get(input_name)
+        if previous is None:
+            previous = self._defaults.get(input_name, _MISSING)
+        self.values[input_name] = value
+
+        # e.g. setting an input to its default value doesn't affect the others
+        if not _same_value(value, previous):
+            self._invalidate(input_name)
 
     def set_values(self, items):
         for input_name, value in items.items():
@@ -409,7 +609,27 @@ class InputSet:
         if input is None:
             return None
 
-        return input.default_value(self)
+        value = self._defaults.get(input_name, _MISSING)
+        if value is _MISSING:
+            value = input.default_value(self)
+            self._defaults[input_name] = value
+
+        # callers may modify the value they get (e.g. share tables)
+        return _copy_value(value)
+
+    def is_relevant(self, input):
+        """
+        Returns whether `input` applies given the current values and context
+        """
+        if self.inputs.get(input.name) is not input:
+            # e.g. groups, which aren't part of the set
+            return input.check_relevant(self)
+
+        relevant = self._relevance.get(input.name)
+        if relevant is None:
+            relevant = input.check_relevant(self)
+            self._relevance[input.name] = relevant
+        return relevant
 
     def set_default(self, input_name):
         self.set_value(input_name, self.default_value(input_name))
@@ -418,7 +638,7 @@ class InputSet:
         errors = {}
 
         for input_name, input in self.inputs.items():
-            if input.is_relevant(self):
+            if self.is_relevant(input):
                 value = self.value(input_name)
                 try:
                     input.validate(value)
@@ -428,6 +648,43 @@ class InputSet:
         if len(errors) > 0:
             raise CompoundError(errors)
 
+    def _dependency_graph(self):
+        if self._dependents is None:
+            # inputs with unknown dependencies are listed under `None`
+            dependents = {None: set()}
+            for name, input in self.inputs.items():
+                input_names = input.input_dependencies()
+                if input_names is None:
+                    dependents[None].add(name)
+                    continue
+                for input_name in input_names:
+                    dependents.setdefault(input_name, set()).add(name)
+            self._dependents = dependents
+        return self._dependents
+
+    def _invalidate(self, input_name):
+        """
+        Forgets the memoized results of the inputs depending on `input_name`
+        """
+        if len(self._relevance) == 0 and len(self._defaults) == 0:
+            return
+
+        dependents = self._dependency_graph()
+        stack = list(dependents.get(input_name, ())) + list(dependents[None])
+        seen = set()
+        while len(stack) > 0:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            self._relevance.pop(name, None)
+            self._defaults.pop(name, None)
+            stack.extend(dependents.get(name, ()))
+
+    def _invalidate_all(self):
+        self._relevance.clear()
+        self._defaults.clear()
+
     def _add_inputs(self, inputs):
         for input in inputs:
             if input.input_type != 'group':
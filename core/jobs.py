@@ -0,0 +1,174 @@
+"""
+Local queue running long analyses in a pool of worker processes, without
+an external broker.
+
+`JobQueue.submit` returns a job id straight away. Up to `workers` jobs run
+at a time, each in a worker process, and the others wait in submission
+order. A job is identified by its function and arguments, so submitting a
+job identical to one that is queued, running or finished (and not expired)
+returns the existing job instead of running it again.
+
+Job records (status, times and result) are kept in `store`: in memory by
+default, or e.g. in a `core.cache.SQLiteCache` shared by all processes on
+the host, so that any of them can report on the jobs of the others. The
+store may evict records, so the records of the queued and running jobs are
+also kept by the process running them until they finish, and rewritten to
+the store every `refresh_interval` seconds while they run.
+
+The `workers` limit is per queue, i.e. per process: with a queue in each
+API worker, up to (API workers × `workers`) analyses run at a time.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import os
+import threading
+import time
+
+from core.cache import LRUCache, fingerprint
+
+
+def _call(fn, args):
+    # errors are returned as text: exceptions don't always survive being
+    # pickled back to the parent process
+    try:
+        return True, fn(*args)
+    except Exception as e:
+        return False, f'{type(e).__name__}: {e}'
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class JobQueue:
+
+    # seconds between the rewrites of the records of the running jobs
+    refresh_interval = 60
+
+    def __init__(self, workers=2, store=None, ttl=3600):
+        self.workers = workers
+        self.store = store if store is not None else LRUCache(maxsize=64, ttl=ttl)
+        self.ttl = ttl
+
+        # created on first use, so that a queue created before the server
+        # forks its workers starts its pools in each of them
+        self._threads = None
+        self._processes = None
+
+        # ids of the jobs submitted by this process waiting for a worker
+        self._queued = []
+        # records of the jobs of this process until they finish, by id
+        self._active = {}
+        self._lock = threading.RLock()
+
+    def _update(self, job_id, **fields):
+        """
+        Updates the record of an active job of this process, in the store
+        too. Finished jobs are removed from the active ones.
+        """
+        with self._lock:
+            job = self._active.get(job_id)
+            if job is None:
+                # not a job of this process, or finished already
+                return
+            job = self._active[job_id] = dict(job, **fields)
+            self.store.set(job_id, job)
+            if job['status'] in ('done', 'failed'):
+                del self._active[job_id]
+
+    def submit(self, fn, *args):
+        """
+        Queues `fn(*args)` and returns the id of the job. `fn` and `args`
+        must be picklable (e.g. `fn` defined at the top level of a module).
+        """
+        job_id = fingerprint({'fn': f'{fn.__module__}.{fn.__qualname__}', 'args': args})
+        with self._lock:
+            job = self.status(job_id)
+            if job is not None and job['status'] != 'failed':
+                return job_id
+
+            job = {'status': 'queued', 'submitted': time.time(), 'pid': os.getpid()}
+            self._active[job_id] = job
+            self.store.set(job_id, job)
+            self._queued.append(job_id)
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.workers)
+                self._processes = ProcessPoolExecutor(max_workers=self.workers)
+            self._threads.submit(self._run, job_id, fn, args)
+        return job_id
+
+    def _run(self, job_id, fn, args):
+        with self._lock:
+            self._queued.remove(job_id)
+            processes = self._processes
+
+        self._update(job_id, status='running', started=time.time())
+        try:
+            future = processes.submit(_call, fn, args)
+            while True:
+                try:
+                    ok, res = future.result(timeout=min(self.refresh_interval, self.ttl / 2))
+                    break
+                except TimeoutError:
+                    # keeps the record from expiring or being evicted from
+                    # the store while the job runs
+                    self._update(job_id)
+        except BrokenProcessPool as e:
+            # a worker process died (e.g. killed for running out of memory):
+            # the pool can't be used anymore
+            ok, res = False, f'{type(e).__name__}: {e}'
+            with self._lock:
+                if self._processes is processes:
+                    self._processes = ProcessPoolExecutor(max_workers=self.workers)
+        except Exception as e:
+            ok, res = False, f'{type(e).__name__}: {e}'
+
+        if ok:
+            self._update(job_id, status='done', finished=time.time(), result=res)
+        else:
+            self._update(job_id, status='failed', finished=time.time(), error=res)
+
+    def status(self, job_id):
+        """
+        Returns the record of the job, or `None` if it is unknown or expired:
+        its `status` ('queued', 'running', 'done' or 'failed'), the times it
+        was `submitted`, `started` and `finished`, and its `result` or
+        `error`. Queued jobs submitted by this process also have their
+        `position` in the queue, and running jobs their `elapsed` time.
+        """
+        with self._lock:
+            job = self._active.get(job_id)
+        if job is None:
+            job = self.store.get(job_id, None)
+            if job is None:
+                return None
+
+        job = dict(job)
+        if job['status'] in ('queued', 'running') and not _alive(job['pid']):
+            job['status'] = 'failed'
+            job['error'] = 'the process running the job exited'
+        with self._lock:
+            if job['status'] == 'queued' and job_id in self._queued:
+                job['position'] = self._queued.index(job_id)
+        if job['status'] == 'running':
+            job['elapsed'] = time.time() - job['started']
+        return job
+
+    def shutdown(self):
+        """
+        Waits for the submitted jobs to finish and stops the workers.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, None
+        if threads is not None:
+            # the running jobs still need the lock and the process pool
+            threads.shutdown()
+            with self._lock:
+                processes, self._processes = self._processes, None
+            processes.shutdown()
@@ -1,7 +1,7 @@
 import re
 
 from core import conditionals
-from core.inputs import InputSet
+from core.inputs import InputSet, copy_inputs
 
 def prefix(name):
     return re.sub(r'[^A-Za-z0-9]+', '_', name).lower()
@@ -16,7 +16,8 @@ class ModelComposer:
         inputs = []
 
         for name, model in self.models:
-            for input in model.inputs():
+            # the model's inputs are shared, so they are renamed on a copy
+            for input in copy_inputs(model.inputs()):
                 inputs.append(self._transform_input(name, input))
 
         return inputs
@@ -1,15 +1,50 @@
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import math
+import os
+from core import cache, catalog, utils
 from core.common import DataSource, InputSource, Versioned
 from core.inputs import InputSet
+from core.tables import Table
 import analysis.lca as lca
-from analysis.sensitivity import SensitivityAnalysis
-import pandas as pd
-
-def compute_emissions(pathway, input_sets):
+from analysis.sensitivity import GlobalSensitivityAnalysis, SensitivityAnalysis
+
+# results of `Pathway.perform`, keyed on `pathway_key`
+results_cache = cache.TieredCache(
+    maxsize=int(os.environ.get('RESULTS_CACHE_SIZE') or 256),
+    path=os.environ.get('RESULTS_CACHE_DIR'),
+)
+
+def step_key(step):
+    return {
+        'source_id': step.source.id,
+        'version': step.source.cls.version,
+        # the default values too, which may change without the values set
+        'values': step.input_set.resolved_values(),
+        'context': step.input_set.context,
+    }
+
+def pathway_key(pathway):
+    return cache.fingerprint([step_key(step) for step in pathway.steps])
+
+def _init_worker():
+    # no-op when the pool is forked from a process that has already
+    # loaded the topology (source classes and their lookup tables are
+    # inherited), but required for spawned workers
+    import pathway.topology
+
+def _perform_chunk(serialized_pathways):
+    return [
+        Pathway.load(serialized).perform()
+        for serialized in serialized_pathways
+    ]
+
+def compute_emissions(pathway, input_sets, cached=True):
     for step in pathway.steps:
         step.input_set = input_sets[step.source]
 
-    results = lca.run([pathway])
+    results = lca.run([pathway], cached=cached)
     return results['data']['value'].sum()
 
 class Database:
@@ -111,6 +146,10 @@ class Activity:
         return None
 
     def register_source(self, name, cls, table=None):
+        """
+        `cls` is the source class, or its dotted path to import it only when
+        first used.
+        """
         source = Source(self, name, cls, table)
         self.sources.append(source)
         sources_db.insert(source)
@@ -126,9 +165,9 @@ class Activity:
             'name': self.name,
             'category': self.category,
             'sources': [source.serialize() for source in self.sources],
-            'products': list(self.products),
-            'product_types': list(self.product_types),
-            'resources': list(self.resources),
+            'products': sorted(self.products),
+            'product_types': sorted(self.product_types),
+            'resources': sorted(self.resources),
         }
 
 
@@ -137,10 +176,29 @@ class Source:
     def __init__(self, activity, name, cls, lookup_table):
         self.activity = activity
         self.name = name
-        self.cls = cls
-        self.cls.lookup_table = lookup_table
+        self.lookup_table = lookup_table
         self.id = None
 
+        self._cls = None
+        self._cls_path = None
+        if isinstance(cls, str):
+            self._cls_path = cls
+        else:
+            self._set_cls(cls)
+
+    @property
+    def cls(self):
+        if self._cls is None:
+            self._set_cls(utils.load_object(self._cls_path))
+        return self._cls
+
+    def is_loaded(self):
+        return self._cls is not None
+
+    def _set_cls(self, cls):
+        cls.lookup_table = self.lookup_table
+        self._cls = cls
+
     def __call__(self, *args, **kwargs):
         return self.instantiate(*args, **kwargs)
 
@@ -154,7 +212,7 @@ class Source:
         return self.cls(**kwargs)
 
     def inputs(self):
-        return self.cls.user_inputs()
+        return self.cls.inputs()
 
     def sensitivity(self):
         return self.cls.sensitivity()
@@ -203,15 +261,16 @@ class Step:
     @classmethod
     def load(self, serialized, context=None):
         source = sources_db.find(serialized['source_id'])
-        input_set = InputSet(source.inputs(), context=context)
+        context = serialized.get('context', context)
 
         # FIXME: can we make this consistent?
         # Maybe rename to `values` instead
         values = serialized['user_inputs']
         if type(values) == dict:
-            input_set = InputSet(source.inputs(), values)
+            input_set = InputSet(source.inputs(), values, context=context)
         else:
             # would be nice to deprecate this style
+            input_set = InputSet(source.inputs(), context=context)
             input_set.build(values)
 
         return Step(source, input_set)
@@ -278,6 +337,35 @@ class Pathway:
         steps = [build_step(item) for item in items]
         return Pathway(steps, **kwargs)
 
+    @classmethod
+    def perform_many(cls, pathways, workers=None, chunk_size=None):
+        """
+        Performs each of the given pathways, partitioning them across a pool of
+        `workers` processes in chunks of `chunk_size` pathways. Returns the list
+        of results in the same order as `pathways`.
+        """
+        pathways = list(pathways)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(pathways))
+
+        if workers <= 1:
+            return [pathway.perform() for pathway in pathways]
+
+        if chunk_size is None:
+            # a few chunks per worker to even out differences in pathway cost
+            chunk_size = max(1, math.ceil(len(pathways) / (workers * 4)))
+
+        serialized = [pathway._serialize_with_context() for pathway in pathways]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            chunk_results = executor.map(_perform_chunk, utils.chunks(serialized, chunk_size))
+            results = [res for chunk in chunk_results for res in chunk]
+
+        for pathway, res in zip(pathways, results):
+            pathway.results = res
+
+        return results
+
     def __init__(self, steps, name='Untitled', results=None):
         self.steps = steps
         self.name = name
@@ -285,21 +373,70 @@ class Pathway:
             self.name = self.steps[2].source.cls.__name__
         self.results = results
         self.instances = {}
+        self._results_cached = False
+
+        # state kept from the last evaluation so that only the steps affected
+        # by a change need to be recomputed (see `_dirty_steps`)
+        self._step_state = []
+        self._current_step = None
 
     def instance(self, stage_id):
+        if self._results_cached:
+            # the results came from the cache, so the step instances
+            # haven't been built yet
+            self.perform(cached=False)
+
+        if self._current_step is not None:
+            # a step is reaching into another step: remember the dependency
+            self._step_dependencies[self._current_step].add(stage_id)
+
         return self.instances.get(stage_id)
 
-    def perform(self):
-        for step in self.steps:
-            obj = step.source.instantiate()
-            obj.prepare(step.input_set)
-            obj.pathway = self
-            self.instances[step.stage.id] = obj
+    def perform(self, cached=True):
+        """
+        Performs the pathway. Steps whose inputs (and upstream flows) are the
+        same as in the previous call are not recomputed.
+        """
+        key = None
+        if cached:
+            key = pathway_key(self)
+            results = results_cache.get(key)
+            if results is not cache.MISSING:
+                self.results = copy.deepcopy(results)
+                self._results_cached = True
+                return self.results
+
+        self._results_cached = False
+        step_keys, dirty = self._dirty_steps()
+
+        self._step_dependencies = {
+            idx: (set() if idx in dirty else self._step_state[idx]['depends_on'])
+            for idx in range(len(self.steps))
+        }
 
-        results = {}
+        for idx, step in enumerate(self.steps):
+            if idx in dirty:
+                obj = step.source.instantiate()
+                obj.prepare(step.input_set)
+                obj.pathway = self
+                self.instances[step.stage.id] = obj
+
+        # recomputed steps share the primary flow objects, as they always
+        # have: steps may modify the flow they receive when serialized (the
+        # wind upstream removes the multiplier passed by the process stage),
+        # and the steps passing it through report it modified. A copy of
+        # each primary flow, as produced, is kept for the steps recomputed
+        # after a step that isn't.
+        primaries = {}
         prev_output = None
 
-        for step in self.steps:
+        for idx, step in enumerate(self.steps):
+            if idx not in dirty:
+                primaries[idx] = self._step_state[idx]['primary']
+                prev_output = copy.deepcopy(primaries[idx])
+                continue
+
+            self._current_step = idx
             obj = self.instances[step.stage.id]
             obj.output = prev_output
 
@@ -307,45 +444,125 @@ class Pathway:
             # so we need to call this again to make sure `self.output` exists
             obj.prepare(step.input_set)
 
-            results[step.source.activity.stage] = obj
             prev_output = obj.get_inputs()['primary']
+            primaries[idx] = copy.deepcopy(prev_output)
+
+        step_results = {}
+        for idx, step in enumerate(self.steps):
+            if idx in dirty:
+                self._current_step = idx
+                step_results[idx] = self.instances[step.stage.id].serialize()
+            else:
+                step_results[idx] = copy.deepcopy(self._step_state[idx]['result'])
+        self._current_step = None
 
+        results = {}
+        for idx, step in enumerate(self.steps):
+            results[step.source.activity.stage] = step_results[idx]
         self.results = {
-            str(stage): obj.serialize() for stage, obj in results.items()
+            str(stage): res for stage, res in results.items()
         }
 
+        # the results once all steps are serialized, since serializing a step
+        # can modify the flows it shares with the previous step
+        self._step_state = [
+            {
+                'key': step_keys[idx],
+                'primary': primaries[idx],
+                'result': copy.deepcopy(step_results[idx]),
+                'depends_on': self._step_dependencies[idx],
+            }
+            for idx in range(len(self.steps))
+        ]
+
+        if key is not None:
+            results_cache.set(key, copy.deepcopy(self.results))
+
         return self.results
 
+    def _dirty_steps(self):
+        """
+        Returns the step keys and the indices of the steps that need to be
+        recomputed: a step with changed inputs, every step after it in the
+        chain (towards Upstream), and any step that looked up the instance of
+        a step with changed inputs (e.g. a process reading the upstream coal type).
+        """
+        step_keys = [cache.fingerprint(step_key(step)) for step in self.steps]
+        count = len(self.steps)
+
+        if len(self._step_state) != count:
+            return step_keys, set(range(count))
+
+        changed = [
+            idx for idx in range(count)
+            if self._step_state[idx]['key'] != step_keys[idx]
+            or self.steps[idx].stage.id not in self.instances
+        ]
+        changed_stages = {self.steps[idx].stage.id for idx in changed}
+        changed += [
+            idx for idx in range(count)
+            if self._step_state[idx]['depends_on'] & changed_stages
+        ]
+
+        dirty = set(range(min(changed), count)) if len(changed) > 0 else set()
+        return step_keys, dirty
+
+    def copy(self):
+        """
+        Returns a pathway with the same steps that can be performed
+        independently of this one.
+        """
+        return Pathway([Step(step.source, step.input_set) for step in self.steps], name=self.name)
+
     def sensitivity_analysis(self):
         return SensitivityAnalysis(self, compute_emissions)
 
+    def global_sensitivity_analysis(self, **kwargs):
+        return GlobalSensitivityAnalysis(self, compute_emissions, **kwargs)
+
+    def uncertainty_analysis(self, **kwargs):
+        from analysis.uncertainty import MonteCarloAnalysis
+        return MonteCarloAnalysis(self, **kwargs)
+
     def serialize(self):
         return {
             'name': self.name,
             'steps': [step.serialize() for step in self.steps]
         }
 
+    def _serialize_with_context(self):
+        res = self.serialize()
+        for item, step in zip(res['steps'], self.steps):
+            item['context'] = step.input_set.context
+        return res
+
 
 class ActivitySource(DataSource, InputSource, Versioned):
     filters = []
     lookup_table = None
 
-    _df = None
+    _table = None
 
     @classmethod
     def sensitivity(cls):
         return None
 
     @classmethod
-    def data_frame(cls):
-        if cls._df is None:
-            df = pd.read_csv(cls.lookup_table)
+    def data_table(cls):
+        # `_table` is looked up on `cls` so that every subclass gets its own
+        if cls.__dict__.get('_table') is None:
+            df = catalog.read_csv(cls.lookup_table)
 
             for field, value in cls.filters:
                 df = df[df[field] == value]
 
-            cls._df = df
-        return cls._df.copy()
+            # shared between instances
+            cls._table = Table(df, read_only=True)
+        return cls._table
+
+    @classmethod
+    def data_frame(cls):
+        return cls.data_table().select([])
 
     def __init__(self, output=None):
         self.output = output
@@ -0,0 +1,121 @@
+"""
+Registry of the static data tables read by the models: the `LazyData`
+tables of every imported module, the lookup tables of the pathway sources
+and the LCIA data.
+
+`preload` loads all of them in the current process. Called in the parent
+process of a pre-forking server (e.g. gunicorn with `--preload`), it lets
+every worker share the parent's copy of the tables, copy-on-write, instead
+of loading its own. The tables are shared between callers and must not be
+modified in place: that would copy the modified pages into the worker (and
+change the data for later requests). Text columns hold Python objects whose
+reference counts are updated when they are read, so the pages holding them
+are still copied gradually.
+
+`report` lists the size of every loaded table and the memory saved across
+`workers` processes.
+"""
+import gc
+import importlib
+import sys
+
+import pandas as pd
+
+from core.utils import LazyData
+
+# modules holding tables, imported by `preload`
+MODULES = [
+    'pathway.topology',
+    'tea.topology',
+    'analysis.lca',
+    'analysis.system.grid.grid',
+    'analysis.system.fleet.fleet',
+    'analysis.system.fleet.fleet_price_labels',
+]
+
+
+def _lazy_data():
+    for module_name, module in list(sys.modules.items()):
+        for name, value in list(vars(module).items()):
+            if isinstance(value, LazyData):
+                yield f'{module_name}.{name}', value
+
+
+def _sources():
+    from core.pathway import sources_db
+    return [source for source in sources_db.records if source.lookup_table is not None]
+
+
+def tables():
+    """
+    Returns the loaded tables as a dict of name -> data frame.
+    """
+    res = {}
+    for name, data in _lazy_data():
+        for key in data.loaded_keys():
+            value = data[key]
+            if isinstance(value, pd.DataFrame):
+                res[f'{name}[{key}]'] = value
+
+    for source in _sources():
+        if source.is_loaded():
+            table = source.cls.__dict__.get('_table')
+            if table is not None:
+                res[f'{source.cls.__module__}.{source.cls.__name__}'] = table.frame
+
+    lca = sys.modules.get('analysis.lca')
+    if lca is not None and lca._lcia_data.cache_info().currsize > 0:
+        res['analysis.lca.lciadata'] = lca._lcia_data()
+        res['analysis.lca.characterization_factors'] = lca.characterization_factors()
+
+    return res
+
+
+def preload(modules=MODULES):
+    """
+    Imports `modules` and loads every table. Returns the tables as in
+    `tables`.
+    """
+    for module in modules:
+        importlib.import_module(module)
+
+    for source in _sources():
+        source.cls.data_table()
+
+    for _, data in _lazy_data():
+        for key in data:
+            data[key]
+
+    lca = sys.modules.get('analysis.lca')
+    if lca is not None:
+        lca.characterization_factors()
+
+    # keeps the collector from writing to (and so copying) the pages of every
+    # object loaded so far in the forked workers
+    gc.freeze()
+    return tables()
+
+
+def table_bytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def report(workers=1):
+    """
+    Returns the size of every loaded table, and an upper bound on the memory
+    saved by sharing them between `workers` processes rather than loading
+    them in each (`max_shared_bytes`: pages written to after the fork, e.g.
+    by reference counting, are copied anyway). The actual saving is measured
+    by `benchmarks/data_memory.py`.
+    """
+    rows = [
+        {'table': name, 'rows': len(df), 'columns': len(df.columns), 'bytes': table_bytes(df)}
+        for name, df in tables().items()
+    ]
+    total = sum(row['bytes'] for row in rows)
+    return {
+        'tables': sorted(rows, key=lambda row: row['bytes'], reverse=True),
+        'total_bytes': total,
+        'workers': workers,
+        'max_shared_bytes': total * max(workers - 1, 0),
+    }
@@ -0,0 +1,43 @@
+import os
+
+import pandas as pd
+
+
+class FrameSink:
+    """
+    Collects result batches in memory and concatenates them once when the
+    result is requested.
+    """
+
+    def __init__(self):
+        self._frames = []
+
+    def write(self, df):
+        self._frames.append(df)
+
+    def result(self):
+        if len(self._frames) == 0:
+            return pd.DataFrame()
+        return pd.concat(self._frames)
+
+
+class CSVSink:
+    """
+    Appends result batches to the CSV file at `path`, so that only the
+    current batch is held in memory. The result is the path of the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._header = True
+
+        # start from an empty file
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def write(self, df):
+        df.to_csv(self.path, mode='a', header=self._header, index=False)
+        self._header = False
+
+    def result(self):
+        return self.path
@@ -1,17 +1,103 @@
+import copy
+import functools
+import numbers
+import os
+from core import cache
+
+# results of `SystemAnalysis.run` and of the `versioned` functions, keyed on
+# their name, arguments and data version
+results_cache = cache.LRUCache(maxsize=int(os.environ.get('SYSTEM_CACHE_SIZE') or 256))
+
+
+def normalize(value):
+    """
+    Returns `value` such that equivalent values (e.g. 2020, 2020.0 and
+    '2020') are equal.
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            value = float(value)
+        except ValueError:
+            return value
+    if isinstance(value, numbers.Real) and not isinstance(value, bool) and float(value).is_integer():
+        return int(value)
+    return value
+
+
+def versioned(version):
+    """
+    Decorator caching the result of a function without arguments until
+    `version()` changes.
+    """
+    def decorator(f):
+        name = f'{f.__module__}.{f.__qualname__}'
+
+        @functools.wraps(f)
+        def wrapper():
+            key = cache.fingerprint({'name': name, 'version': version()})
+            res = results_cache.get(key)
+            if res is cache.MISSING:
+                res = f()
+                results_cache.set(key, copy.deepcopy(res))
+                return res
+            return copy.deepcopy(res)
+        return wrapper
+    return decorator
+
+
 class SystemAnalysis:
 
-    def __init__(self, name, query, inputs, axes):
+    def __init__(self, name, query, inputs, axes, version=None):
+        """
+        inputs: list of `Input`s, or a function returning them, which is
+        called when the inputs are first needed (and again whenever the
+        `version` changes)
+
+        version: function returning the version of the data queried, which
+        changes whenever the data does, to cache the results of `run` until
+        then, or `None` not to cache them
+        """
         self.name = name
         self.query = query
-        self.inputs = inputs
+        self._inputs = inputs
         self.axes = axes
+        self.version = version
+
+        self._built_inputs = None
+        self._inputs_version = None
+
+    @property
+    def inputs(self):
+        if not callable(self._inputs):
+            return self._inputs
+
+        version = self.version() if self.version is not None else None
+        if self._built_inputs is None or version != self._inputs_version:
+            self._built_inputs = self._inputs()
+            self._inputs_version = version
+        return self._built_inputs
 
     def __str__(self):
         return self.name
 
     def run(self, input_set):
         params = input_set.values
-        return self.query(**params)
+        if self.version is None:
+            return self.query(**params)
+
+        key = cache.fingerprint({
+            'name': self.name,
+            'values': {name: normalize(value) for name, value in params.items()},
+            'version': self.version(),
+        })
+        results = results_cache.get(key)
+        if results is cache.MISSING:
+            results = list(self.query(**params))
+            results_cache.set(key, copy.deepcopy(results))
+            return results
+        # callers may modify the rows, not the cached ones
+        return copy.deepcopy(results)
 
     def serialize(self):
         return {
@@ -0,0 +1,109 @@
+import threading
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+def _read_only(frame):
+    """
+    Returns a frame with the data of `frame`, whose numeric columns are
+    read-only numpy arrays.
+    """
+    # one array per column (pandas only stacks the columns of a dict when
+    # copying them), so that pandas writes to the read-only arrays. Not the
+    # object arrays (e.g. of strings): pandas can't compare read-only ones
+    columns = {}
+    for position, dtype in enumerate(frame.dtypes):
+        series = frame.iloc[:, position]
+        if isinstance(dtype, np.dtype) and dtype != object:
+            values = series.to_numpy(copy=False)
+            values.flags.writeable = False
+        else:
+            values = series.array
+        columns[position] = values
+
+    result = pd.DataFrame(columns, index=frame.index, copy=False)
+    result.columns = frame.columns
+    return result
+
+
+class Table:
+    """
+    Read-only wrapper around a data frame that answers equality lookups on
+    one or more columns through hash indexes instead of boolean filtering.
+
+    An index is built the first time a set of columns is queried: the rows
+    are reordered (once) so that every distinct key occupies a contiguous
+    block, and a lookup returns a slice of that block. Rows keep their
+    original relative order and index labels, so the result is the same as
+    filtering with `df[df[column] == value]` for each column.
+
+    Frames returned by a `Table` share their data between callers. With
+    `read_only`, the data can't be modified in place (e.g. with `.loc`
+    assignments, which raise a `ValueError`), and columns added to or
+    removed from the frames returned don't affect the table.
+    """
+
+    def __init__(self, frame, read_only=False):
+        self.read_only = read_only
+        self.frame = _read_only(frame) if read_only else frame
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.frame)
+
+    def select(self, criteria):
+        """
+        Returns the rows matching every `(column, value)` pair in `criteria`.
+        Values are compared as floats against numeric columns.
+        """
+        if len(criteria) == 0:
+            # shares the data, not the columns
+            return self.frame.copy(deep=False)
+
+        columns = tuple(column for column, _ in criteria)
+        key = tuple(
+            float(value) if is_numeric_dtype(self.frame[column].dtype) else value
+            for column, value in criteria
+        )
+
+        frame, positions = self._index(columns)
+        start, stop = positions.get(key, (0, 0))
+        return frame.iloc[start:stop]
+
+    def _index(self, columns):
+        index = self._indexes.get(columns)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(columns)
+                if index is None:
+                    index = self._build_index(columns)
+                    self._indexes[columns] = index
+        return index
+
+    def _build_index(self, columns):
+        # pandas may consolidate the columns of the frames it reads in place,
+        # into new (writable) arrays: read a copy sharing the data instead
+        source = self.frame.copy(deep=False)
+
+        # rows with a missing value in any of the columns never compare equal,
+        # so they are left out of the index just as `groupby` drops them
+        groups = source.groupby(list(columns), sort=False).indices
+
+        order = []
+        positions = {}
+        start = 0
+        for key, rows in groups.items():
+            if not isinstance(key, tuple):
+                key = (key,)
+            positions[key] = (start, start + len(rows))
+            order.append(rows)
+            start += len(rows)
+
+        order = np.concatenate(order) if len(order) > 0 else np.array([], dtype=int)
+        frame = source.take(order)
+        if self.read_only:
+            frame = _read_only(frame)
+        return frame, positions
@@ -1,9 +1,10 @@
 from core.common import DataSource, InputSource, Versioned
-from core.inputs import InputSet
+from core.inputs import InputSet, copy_inputs, schema
+from core.utils import load_object
 import numbers
 from pandas.api.types import is_numeric_dtype
 import pandas as pd
-from analysis.sensitivity import SensitivityAnalysis
+from analysis.sensitivity import GlobalSensitivityAnalysis, SensitivityAnalysis
 import analysis.tea as tea
 
 def pathway_id(pathway):
@@ -17,7 +18,9 @@ def pathway_id(pathway):
         activities['Upstream'].id
     )
 
-def compute_cost(tea_pathway, input_sets):
+def compute_cost(tea_pathway, input_sets, cached=True):
+    # `cached`: for compatibility with `compute_emissions`, TEA results
+    # aren't cached
     input_set = input_sets[tea_pathway.analysis]
 
     # instantiate a new pathway since the one passed in may have been
@@ -59,8 +62,12 @@ class TeaBase(DataSource, InputSource, Versioned):
 class TeaAnalysis:
 
     def __init__(self, name, cls, pathway_id=None, table=None, conditionals=None):
+        """
+        `cls` is the TEA class, or its dotted path to import it only when
+        first used.
+        """
         self.name = name
-        self.cls = cls
+        self._cls = cls
         self.pathway_id = pathway_id
         self.table = table
 
@@ -73,6 +80,12 @@ class TeaAnalysis:
     def __str__(self):
         return self.name
 
+    @property
+    def cls(self):
+        if isinstance(self._cls, str):
+            self._cls = load_object(self._cls)
+        return self._cls
+
     @property
     def unit(self):
         return self.cls.unit
@@ -86,11 +99,16 @@ class TeaAnalysis:
         return obj
 
     def inputs(self):
-        inputs = self.cls.user_inputs()
-        if self.conditionals is not None:
+        if self.conditionals is None:
+            return self.cls.inputs()
+
+        def build():
+            inputs = copy_inputs(self.cls.inputs())
             for input in inputs:
                 input.conditionals += self.conditionals
-        return inputs
+            return inputs
+
+        return schema((self, self.cls, getattr(self.cls, 'version', None)), build)
 
     def sensitivity(self, *args, **kwargs):
         return self.cls.sensitivity(*args, **kwargs)
@@ -165,12 +183,15 @@ class ComposedAnalysis:
         return type(self).TEA(self)
 
     def inputs(self):
-        res = []
-        for analysis in self.analyses:
-            for input in analysis.inputs():
-                input._source_analysis = analysis
-                res.append(input)
-        return res
+        def build():
+            res = []
+            for analysis in self.analyses:
+                for input in copy_inputs(analysis.inputs()):
+                    input._source_analysis = analysis
+                    res.append(input)
+            return res
+
+        return schema((self, tuple(self.analyses)), build)
 
     def serialize(self):
         return {
@@ -260,9 +281,15 @@ class TeaPathway:
             TeaStep(self.analysis, self.input_set)
         ]
 
+    def copy(self):
+        return TeaPathway(self.analysis, self.input_set, self.lca_pathway)
+
     def sensitivity_analysis(self):
         return SensitivityAnalysis(self, compute_cost, params={'lca_pathway': self.lca_pathway })
 
+    def global_sensitivity_analysis(self, **kwargs):
+        return GlobalSensitivityAnalysis(self, compute_cost, params={'lca_pathway': self.lca_pathway}, **kwargs)
+
     def perform(self):
         obj = self.analysis.instantiate(lca_pathway=self.lca_pathway)
         obj.prepare(self.input_set)
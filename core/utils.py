@@ -1,4 +1,6 @@
+from collections.abc import Mapping
 import importlib
+import threading
 
 def create_flow_object(name, value, unit):
     return {
@@ -11,8 +13,56 @@ def load_class(module_path, class_name):
     module = importlib.import_module(module_path)
     return getattr(module, class_name)
 
+def load_object(path):
+    """
+    Imports and returns the object at the dotted `path` (module path
+    followed by the object's name)
+    """
+    module_path, name = path.rsplit('.', 1)
+    return load_class(module_path, name)
+
+class LazyData(Mapping):
+    """
+    Read-only mapping of name -> data, where each value is loaded by calling
+    its (argument-less) loader when first accessed, e.g.
+
+        DATA = LazyData({
+            'master': functools.partial(pd.read_csv, 'master.csv'),
+        })
+    """
+
+    def __init__(self, loaders):
+        self._loaders = dict(loaders)
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        if name not in self._data:
+            loader = self._loaders[name]
+            with self._lock:
+                if name not in self._data:
+                    self._data[name] = loader()
+        return self._data[name]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def loaded_keys(self):
+        """
+        Returns the names of the values loaded so far
+        """
+        return list(self._data)
+
 def yes_no(boolean):
     if boolean:
         return 'Yes'
     else:
         return 'No'
+
+def chunks(items, size):
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
@@ -1,6 +1,6 @@
 import os
 
-import pandas as pd
+from core import catalog
 
 PATH = os.getcwd() + "/pathway/enduse/"
 
@@ -9,7 +9,7 @@ class Substance:
     def __init__(self, state, substance):
         self.state = state
         self.substance = substance
-        self.heat_values = pd.read_csv(PATH + "heat_values.csv")
+        self.heat_values = catalog.read_csv(PATH + "heat_values.csv")
 
     def filter_data(self):
         filtered_row = self.heat_values[
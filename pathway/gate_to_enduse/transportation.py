@@ -1,10 +1,9 @@
 import os
 
-import pandas as pd
 
 from core.pathway import ActivitySource
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 from analysis.lca import compute_input_flows, compute_emission_flows
 from analysis.sensitivity import SensitivityInput
 
@@ -13,9 +12,8 @@ class Transportation(ActivitySource):
 
     @classmethod
     def user_inputs(cls, default_mode, product):
-        df = cls.data_frame()
-        df['Distance'] = df['Default Distance (mile one-way)']
-        df = df[['Transport Mode, Process to Use', 'Distance']].drop_duplicates()
+        df = cls.data_frame()[['Transport Mode, Process to Use', 'Default Distance (mile one-way)']]
+        df = df.rename(columns={'Default Distance (mile one-way)': 'Distance'}).drop_duplicates()
 
         default_distances = [
             Default(
@@ -27,7 +25,7 @@ class Transportation(ActivitySource):
             for _, row in df.iterrows()
         ]
 
-        loss_df = pd.read_csv(os.getcwd() + "/pathway/gate_to_enduse/loss_defaults.csv")
+        loss_df = catalog.read_csv(os.getcwd() + "/pathway/gate_to_enduse/loss_defaults.csv")
         default_loss = loss_df[loss_df['Product'] == product]["Default Loss in %"].iloc[0]
 
         return [
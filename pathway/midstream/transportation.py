@@ -1,26 +1,26 @@
+from functools import partial
 import os
 
-import pandas as pd
-
 from core.pathway import ActivitySource
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from analysis.lca import compute_input_flows, compute_emission_flows
 import core.conditionals as conditionals
 import core.validators as validators
+from core import catalog
+from core.utils import LazyData
 from analysis.sensitivity import SensitivityInput
 
-DATA = {
-    'loss_defaults': pd.read_csv(os.path.join(os.getcwd(), 'pathway', 'midstream', 'loss_defaults.csv')),
-}
+DATA = LazyData({
+    'loss_defaults': partial(catalog.read_csv, os.path.join(os.getcwd(), 'pathway', 'midstream', 'loss_defaults.csv')),
+})
 
 
 class Transportation(ActivitySource):
 
     @classmethod
     def user_inputs(cls, default_mode, feed):
-        df = cls.data_frame()
-        df['Distance'] = df['Default Distance (mile one-way)']
-        df = df[['Transport Mode, Upstream to Process', 'Distance']].drop_duplicates()
+        df = cls.data_frame()[['Transport Mode, Upstream to Process', 'Default Distance (mile one-way)']]
+        df = df.rename(columns={'Default Distance (mile one-way)': 'Distance'}).drop_duplicates()
 
         default_distances = [
             Default(
@@ -9,9 +9,8 @@ from analysis.lca import compute_input_flows, compute_emission_flows
 import core.validators as validators
 import core.conditionals as conditionals
 from pathway.enduse.substance import Substance
-from core import utils
+from core import catalog, utils
 import sys
-import pandas as pd
 import os
 
 PATH = os.getcwd() + '/pathway/process/biofuel/'
@@ -143,7 +142,7 @@ class CornEthanolProduction(ActivitySource):
                        g_co2_in_mol_co2 / kg_g  # emission factor of NG units kgCo2/MJ NG burned
 
         # Modeling the co2 emission related to pipeline transportation of captured co2
-        co2_transportation = pd.read_csv(PATH[:-len("process/biofuel/")] + "gate_to_enduse/transportation_lcidata"
+        co2_transportation = catalog.read_csv(PATH[:-len("process/biofuel/")] + "gate_to_enduse/transportation_lcidata"
                                                                            ".csv")
         transport_emission = co2_transportation[co2_transportation['Feed'] == "co2"]
         transport_emission = transport_emission.get("value")
@@ -156,7 +155,7 @@ class CornEthanolProduction(ActivitySource):
         if self.boilerstack_ccs == 'No':
 
             # Reading csv file and extracting the energy usage value for compression & dehydration
-            CCS_inputs = pd.read_csv(PATH + 'corn_ethanol_nobiogen_ccs_lcidata.csv')
+            CCS_inputs = catalog.read_csv(PATH + 'corn_ethanol_nobiogen_ccs_lcidata.csv')
 
             for i in CCS_inputs.values:
                 ferment_electric_ccs = CCS_inputs.get("value").iloc[0]  # indexing to locate the data value in csv file
@@ -182,7 +181,7 @@ class CornEthanolProduction(ActivitySource):
         # Model for capturing Co2 from boiler stack and fermenter
 
         elif self.amine_regen_ccs == 'No':
-            CCS_inputs = pd.read_csv(PATH + 'corn_ethanol_nobiogen_ccs_lcidata.csv')
+            CCS_inputs = catalog.read_csv(PATH + 'corn_ethanol_nobiogen_ccs_lcidata.csv')
             for i in CCS_inputs:
                 ferment_electric_ccs = CCS_inputs.get("value").iloc[0]  # MJ elec/kgCO2
                 boiler_electric_ccs = CCS_inputs.get("value").iloc[1]  # MJ elec/kgCO2
@@ -226,7 +225,7 @@ class CornEthanolProduction(ActivitySource):
 
 
         elif self.amine_regen_ccs == 'Yes':
-            CCS_inputs = pd.read_csv(PATH + 'corn_ethanol_nobiogen_ccs_lcidata.csv')
+            CCS_inputs = catalog.read_csv(PATH + 'corn_ethanol_nobiogen_ccs_lcidata.csv')
             for i in CCS_inputs:
                 ferment_electric_ccs = CCS_inputs.get("value").iloc[0]  # MJ elec/kgCO2
                 boiler_electric_ccs = CCS_inputs.get("value").iloc[1]  # MJ elec/kgCO2
@@ -9,7 +9,7 @@ import core.conditionals as  conditionals
 from analysis.lca import compute_input_flows, compute_emission_flows
 import core.validators as validators
 import sys
-import pandas as pd
+from core import catalog
 import os
 
 PATH = os.getcwd() + '/pathway/process/biofuel/'
@@ -136,7 +136,7 @@ class StoverEthanolProduction(ActivitySource):
                        g_co2_in_mol_co2 / kg_g  # emission factor of NG
 
         # Modeling the co2 emission related to pipeline transportation of captured co2
-        co2_transportation = pd.read_csv(PATH[:-len("process/biofuel/")] + "gate_to_enduse/transportation_lcidata"
+        co2_transportation = catalog.read_csv(PATH[:-len("process/biofuel/")] + "gate_to_enduse/transportation_lcidata"
                                                                            ".csv")
         transport_emission = co2_transportation[co2_transportation['Feed'] == "co2"]
         transport_emission = transport_emission.get("value")
@@ -149,7 +149,7 @@ class StoverEthanolProduction(ActivitySource):
         if self.boilerstack_ccs == 'No':
 
             # Reading csv file and extracting the energy usage value for compression & dehydration
-            CCS_inputs = pd.read_csv(PATH + 'stover_ethanol_withbiogen_ccs_lcidata.csv')
+            CCS_inputs = catalog.read_csv(PATH + 'stover_ethanol_withbiogen_ccs_lcidata.csv')
 
             for i in CCS_inputs.values:
                 ferment_electric_ccs = CCS_inputs.get("value").iloc[0]  # indexing to locate the data value in csv file
@@ -175,7 +175,7 @@ class StoverEthanolProduction(ActivitySource):
         # Model for capturing Co2 from boiler stack and fermenter
 
         elif self.amine_regen_ccs == 'No':
-            CCS_inputs = pd.read_csv(PATH + 'stover_ethanol_withbiogen_ccs_lcidata.csv')
+            CCS_inputs = catalog.read_csv(PATH + 'stover_ethanol_withbiogen_ccs_lcidata.csv')
             for i in CCS_inputs:
                 ferment_electric_ccs = CCS_inputs.get("value").iloc[0]  # MJ elec/kgCO2
                 boiler_electric_ccs = CCS_inputs.get("value").iloc[1]  # MJ elec/kgCO2
@@ -219,7 +219,7 @@ class StoverEthanolProduction(ActivitySource):
 
 
         elif self.amine_regen_ccs == 'Yes':
-            CCS_inputs = pd.read_csv(PATH + 'stover_ethanol_withbiogen_ccs_lcidata.csv')
+            CCS_inputs = catalog.read_csv(PATH + 'stover_ethanol_withbiogen_ccs_lcidata.csv')
             for i in CCS_inputs:
                 ferment_electric_ccs = CCS_inputs.get("value").iloc[0]  # MJ elec/kgCO2
                 boiler_electric_ccs = CCS_inputs.get("value").iloc[1]  # MJ elec/kgCO2
@@ -8,8 +8,7 @@ Created on Wed Mar 24 14:07:00 2021
 from core.pathway import ActivitySource
 from core.inputs import CategoricalInput, ContinuousInput, OptionsInput, Default
 from analysis.lca import compute_input_flows, compute_emission_flows
-from core import conditionals, validators
-import pandas as pd
+from core import catalog, conditionals, validators
 import os
 # import numpy as np
 
@@ -40,7 +39,7 @@ class CAES(ActivitySource):
 
         
     def storage_emission(self):
-        df = pd.read_csv(PATH + "CAES_Data.csv")
+        df = catalog.read_csv(PATH + "CAES_Data.csv")
 
         # Values in table have units kg CO2
         ref_p_emissions = df.loc[df['Emissions Source'] == 'Total_Power']['Value'].item()
@@ -4,7 +4,7 @@ import core.validators as validators
 import core.conditionals as conditionals
 from core.inputs import CategoricalInput, ContinuousInput, OptionsInput, Default
 import sys
-import pandas as pd
+from core import catalog
 import os
 
 PATH = os.getcwd() + "/pathway/process/ccs/dac/"
@@ -51,7 +51,7 @@ class CcsDacLca(ActivitySource):
         return natgas_ci
 
     def get_elec_consumption(self):
-        ref_plant = pd.read_csv(PATH + "plant_ref_data_dac.csv")
+        ref_plant = catalog.read_csv(PATH + "plant_ref_data_dac.csv")
         filtered = ref_plant[ref_plant['Plant Technology'] == self.tech]
         dac_elec_consumption = float(
             filtered[filtered['Plant Technology'] == self.tech].iloc[0].dac_electricity)  # in MJ/kgCO2 captured
@@ -61,7 +61,7 @@ class CcsDacLca(ActivitySource):
         return total_elec_consumption
 
     def get_natgas_dac_consumption(self):  # dac
-        ref_plant = pd.read_csv(PATH + "plant_ref_data_dac.csv")
+        ref_plant = catalog.read_csv(PATH + "plant_ref_data_dac.csv")
         filtered = ref_plant[ref_plant['Plant Technology'] == self.tech]
         nat_gas_dac_consumption = float(
             filtered[filtered['Plant Technology'] == self.tech].iloc[0].gas)  # in MJ/kgCO2 captured from dac
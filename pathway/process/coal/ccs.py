@@ -1,17 +1,19 @@
+from functools import partial
 import os
-import pandas as pd
 
 from core.inputs import ContinuousInput, OptionsInput, Default
 import core.conditionals as conditionals
 import core.validators as validators
+from core import catalog
+from core.utils import LazyData
 import pathway.process.ccs as ccs
 
 PATH = os.path.join(os.getcwd(), 'pathway', 'process', 'coal')
-DATA = {
-    'CCS_inputs': pd.read_csv(os.path.join(PATH, 'coal_power_CCS_lcidata.csv')),
-    'coal_properties': pd.read_csv(os.path.join(PATH, 'coal_properties.csv')),
-    'co2_transportation': pd.read_csv(os.path.join(os.getcwd(), 'pathway', 'gate_to_enduse', 'transportation_lcidata.csv'))
-}
+DATA = LazyData({
+    'CCS_inputs': partial(catalog.read_csv, os.path.join(PATH, 'coal_power_CCS_lcidata.csv')),
+    'coal_properties': partial(catalog.read_csv, os.path.join(PATH, 'coal_properties.csv')),
+    'co2_transportation': partial(catalog.read_csv, os.path.join(os.getcwd(), 'pathway', 'gate_to_enduse', 'transportation_lcidata.csv'))
+})
 
 # general conversion factors needed for calculations
 g_in_kg = 1000
@@ -4,7 +4,7 @@ from analysis.lca import compute_input_flows, compute_emission_flows
 import core.validators as validators
 import core.conditionals as conditionals
 import os
-import pandas as pd
+from core import catalog
 
 from tea.electricity.coal.coal_tea import CoalTEA
 import pathway.process.coal.ccs as ccs
@@ -48,7 +48,7 @@ class CoalPowerASPEN(ActivitySource):
         if self.use_CCS == 'Yes':
             self.get_emissions()
 
-            CCS_inputs = pd.read_csv(PATH + "coal_power_CCS_lcidata.csv")
+            CCS_inputs = catalog.read_csv(PATH + "coal_power_CCS_lcidata.csv")
             filtered = CCS_inputs[CCS_inputs['technology'] == self.ccs.technology]
             coal_ccs = float(filtered[filtered['flows'] == "coal"].iloc[0].value)
             electricity_ccs = float(filtered[filtered['flows'] == "electricity"].iloc[0].value)
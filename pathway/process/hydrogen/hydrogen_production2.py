@@ -5,7 +5,7 @@ from analysis.lca import compute_input_flows, compute_emission_flows, adjust_emi
 import core.validators as validators
 import core.conditionals as conditionals
 import os
-import pandas as pd
+from core import catalog
 import numpy as np
 from analysis.sensitivity import SensitivityInput
 
@@ -65,7 +65,7 @@ class HydrogenProduction(ActivitySource):
             self.get_emissions(CCS_input = False)
 
             # lcidata values
-            CCS_inputs = pd.read_csv(PATH + "hydrogen_ccs_lcidata.csv")
+            CCS_inputs = catalog.read_csv(PATH + "hydrogen_ccs_lcidata.csv")
             filtered = CCS_inputs[CCS_inputs['technology'] == self.ccs.technology]
             nat_gas_ccs = float(filtered[filtered['flows'] == "natural gas"].iloc[0].value)
             electricity_ccs = float(filtered[filtered['flows'] == "electricity"].iloc[0].value)
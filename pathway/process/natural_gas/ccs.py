@@ -1,16 +1,18 @@
+from functools import partial
 import os
-import pandas as pd
 
 from core.inputs import ContinuousInput, OptionsInput, Default
 import core.conditionals as conditionals
 import core.validators as validators
+from core import catalog
+from core.utils import LazyData
 import pathway.process.ccs as ccs
 
 PATH = os.path.join(os.getcwd(), 'pathway', 'process', 'natural_gas')
-DATA = {
-    'CCS_inputs': pd.read_csv(os.path.join(PATH, 'ng_power_ccs_lcidata.csv')),
-    'co2_transportation': pd.read_csv(os.path.join(os.getcwd(), 'pathway', 'gate_to_enduse', 'transportation_lcidata.csv'))
-}
+DATA = LazyData({
+    'CCS_inputs': partial(catalog.read_csv, os.path.join(PATH, 'ng_power_ccs_lcidata.csv')),
+    'co2_transportation': partial(catalog.read_csv, os.path.join(os.getcwd(), 'pathway', 'gate_to_enduse', 'transportation_lcidata.csv'))
+})
 
 # conversion factors needed for calculations. Fuel specific values are from GREET fuel specs tab
 g_in_kg = 1000
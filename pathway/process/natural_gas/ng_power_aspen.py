@@ -5,6 +5,7 @@ import core.validators as validators
 import core.conditionals as conditionals
 import numpy as np
 import pandas as pd
+from core import catalog
 import os
 
 import pathway.process.natural_gas.ccs as ccs
@@ -20,7 +21,7 @@ class NGPowerASPEN(ActivitySource):
         for input in tea_inputs:
             input.conditionals.append(conditionals.context_equal_to('compute_cost', True))
 
-        greet_data = pd.read_csv(os.path.join(PATH, 'ng_power_greet_lcidata.csv'))
+        greet_data = catalog.read_csv(os.path.join(PATH, 'ng_power_greet_lcidata.csv'))
         greet_regions = list(greet_data['Region'].unique())
 
         lca_inputs = [
@@ -70,7 +71,7 @@ class NGPowerASPEN(ActivitySource):
         if self.use_CCS == 'Yes':
             self.get_emissions()
 
-            CCS_inputs = pd.read_csv(PATH + "ng_power_ccs_lcidata.csv")
+            CCS_inputs = catalog.read_csv(PATH + "ng_power_ccs_lcidata.csv")
             filtered = CCS_inputs[CCS_inputs['technology'] == self.ccs.technology]
             nat_gas_ccs = float(filtered[filtered['flows'] == "natural gas"].iloc[0].value)
             electricity_ccs = float(filtered[filtered['flows'] == "electricity"].iloc[0].value)
@@ -4,7 +4,7 @@ from analysis.lca import compute_input_flows, compute_emission_flows
 import core.validators as validators
 import core.conditionals as conditionals
 import os
-import pandas as pd
+from core import catalog
 
 import pathway.process.natural_gas.ccs as ccs
 from tea.electricity.ng.ng_tea import NaturalGasTEA
@@ -94,7 +94,7 @@ class NGPowerGREET(ActivitySource):
             self.get_emissions()
 
             # TODO: would be nice to move below into CCS module as well
-            CCS_inputs = pd.read_csv(PATH + "ng_power_ccs_lcidata.csv")
+            CCS_inputs = catalog.read_csv(PATH + "ng_power_ccs_lcidata.csv")
             filtered = CCS_inputs[CCS_inputs['technology'] == 'amine']
             nat_gas_ccs = float(filtered[filtered['flows'] == 'natural gas'].iloc[0].value)
             electricity_ccs = float(filtered[filtered['flows'] == 'electricity'].iloc[0].value)
@@ -2,20 +2,23 @@ from core.pathway import ActivitySource
 from core.inputs import CategoricalInput, ContinuousInput, OptionsInput, Default, Tooltip
 import core.conditionals as conditionals
 import core.validators as validators
+from core import catalog
+from core.utils import LazyData
 from tea.electricity.solar.solar_TEA import SolarTEA
 from analysis.sensitivity import SensitivityInput
 
+from functools import partial
 import pandas as pd
 import os
 import numpy as np
 
 PATH = os.path.dirname(__file__)
-DATA = {
-    'master': pd.read_csv(os.path.join(PATH, 'solar_master_sheet.csv')),
-    'ef': pd.read_csv(os.path.join(PATH, 'solar_ef.csv')),
-    'param': pd.read_csv(os.path.join(PATH, 'solar_parameters.csv')),
-    'cf': pd.read_csv(os.path.join(PATH, 'solar_cf_table.csv')),
-}
+DATA = LazyData({
+    'master': partial(catalog.read_csv, os.path.join(PATH, 'solar_master_sheet.csv')),
+    'ef': partial(catalog.read_csv, os.path.join(PATH, 'solar_ef.csv')),
+    'param': partial(catalog.read_csv, os.path.join(PATH, 'solar_parameters.csv')),
+    'cf': partial(catalog.read_csv, os.path.join(PATH, 'solar_cf_table.csv')),
+})
 
 class SolarPowerProduction(ActivitySource):
 
@@ -2,9 +2,11 @@ from core.pathway import ActivitySource
 from core.inputs import CategoricalInput, ContinuousInput, OptionsInput, Default
 import core.conditionals as conditionals
 import core.validators as validators
-import pandas as pd
+from functools import partial
 import os
 from analysis.sensitivity import SensitivityInput
+from core import catalog
+from core.utils import LazyData
 
 
 PARAMs = [{'name': 'Distance to grid of onshore wind farm, assumed', 'value': 20, 'unit': 'km'},
@@ -33,7 +35,9 @@ STEP_TO_COLUMN = {'operation': 'operation',
                   'others': 'other GHGs',
 
                   }
-REFERENCE_TABLE = pd.read_csv(os.getcwd() + "/pathway/process/wind/wind_reference_table.csv")
+DATA = LazyData({
+    'reference': partial(catalog.read_csv, os.getcwd() + "/pathway/process/wind/wind_reference_table.csv"),
+})
 
 
 class WindPowerProduction(ActivitySource):
@@ -247,7 +251,8 @@ class WindPowerProduction(ActivitySource):
         return self.get_ghg_dict(upstream_elec, distance_to_grid, hub_height, user_cf, lifetime)
 
     def get_all_emissions(self):
-        data = REFERENCE_TABLE[REFERENCE_TABLE['Turbine Model'] == self.turbine_model].iloc[0]
+        reference = DATA['reference']
+        data = reference[reference['Turbine Model'] == self.turbine_model].iloc[0]
         base_steps = ['operation', 'installation', 'foundation', 'tower', 'hub', 'nacelle', 'blade', 'cable']
         aggregate_steps = ['manufacturing', 'avoided', 'eol', 'others']
 
@@ -264,5 +269,6 @@ class WindPowerProduction(ActivitySource):
         return ghg
 
     def get_capacity_factor(self):
-        data = REFERENCE_TABLE[REFERENCE_TABLE['Turbine Model'] == self.turbine_model].iloc[0]
+        reference = DATA['reference']
+        data = reference[reference['Turbine Model'] == self.turbine_model].iloc[0]
         return data[self.wind_speed] if self.choice == "Wind Speed" else self.cap_fac
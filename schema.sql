@@ -92,6 +92,23 @@ CREATE INDEX IF NOT EXISTS arp_unit_idx ON arp (unit); --- TODO
 
 SELECT create_hypertable('arp', 'timestamp');
 
+--- ARP files (by year, month and state) imported, or that failed to import
+CREATE TABLE IF NOT EXISTS arp_ingestion_log (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    state TEXT NOT NULL,
+
+    status TEXT NOT NULL, --- 'done' or 'failed'
+    rows INTEGER,
+    skipped INTEGER,
+    seconds DOUBLE PRECISION,
+    error TEXT,
+    finished_at TIMESTAMP NOT NULL DEFAULT now(),
+    refreshed_at TIMESTAMP, --- `finished_at` of the import last included in the aggregates
+
+    PRIMARY KEY (year, month, state)
+);
+
 CREATE TABLE grid_unit_genmap (
     "Seqno" INTEGER,
     state CHARACTER VARYING NOT NULL,
@@ -119,45 +136,43 @@ CREATE TABLE loading_fraction (
     type TEXT
 );
 
-CREATE MATERIALIZED VIEW arp_egrid_capacity AS
-SELECT
-  date_part('year', arp.timestamp) AS year,
-  arp.plant_id,
-  arp.unit,
-  sum(arp.gload) AS generation,
-  max(arp.gload) AS max_generation,
-  sum(arp.so2_mass) AS so2,
-  sum(arp.nox_mass) AS nox,
-  sum(arp.co2_mass) AS co2,
-  sum(arp.heat_input) AS heat,
-  grid_unit_genmap.state,
-  grid_unit_genmap.orispl,
-  grid_unit_genmap.capacity_mw,
-  grid_unit_genmap.gen_prime_mover AS prime_mover,
-  grid_unit_genmap.gen_fuel AS fuel_type,
-  greatest(max(arp.gload), grid_unit_genmap.capacity_mw) AS nameplate_capacity
-FROM arp
-JOIN grid_unit_genmap
-  ON arp.plant_id = grid_unit_genmap.plant_id
-  AND arp.unit = grid_unit_genmap.unit
-  AND arp.plant_id IS NOT NULL
-GROUP BY
-  year,
-  arp.plant_id,
-  arp.unit,
-  grid_unit_genmap.gen_prime_mover,
-  grid_unit_genmap.capacity_mw,
-  grid_unit_genmap.state,
-  grid_unit_genmap.orispl,
-  grid_unit_genmap.gen_fuel
-;
+--- version of each data set, bumped whenever it changes (e.g. 'arp' when
+--- the ARP aggregates are refreshed) to invalidate the cached query results
+CREATE TABLE IF NOT EXISTS data_versions (
+    name TEXT PRIMARY KEY,
+    version BIGINT NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT now()
+);
 
-CREATE UNIQUE INDEX ON arp_egrid_capacity (year, plant_id, unit, prime_mover, capacity_mw, state, orispl, fuel_type);
+--- Aggregates of the ARP data by (year, state) partition, recomputed for the
+--- partitions of the files imported since the last refresh:
+--- python analysis/system/power_historic/cli.py arp_refresh
+CREATE TABLE IF NOT EXISTS arp_egrid_capacity (
+    year DOUBLE PRECISION NOT NULL,
+    plant_id BIGINT NOT NULL,
+    unit TEXT NOT NULL,
+    generation DOUBLE PRECISION,
+    max_generation DOUBLE PRECISION,
+    so2 DOUBLE PRECISION,
+    nox DOUBLE PRECISION,
+    co2 DOUBLE PRECISION,
+    heat DOUBLE PRECISION,
+    state CHARACTER VARYING,
+    orispl INTEGER,
+    capacity_mw NUMERIC,
+    prime_mover CHARACTER VARYING,
+    fuel_type CHARACTER VARYING,
+    nameplate_capacity DOUBLE PRECISION
+);
 
+CREATE UNIQUE INDEX IF NOT EXISTS arp_egrid_capacity_idx ON arp_egrid_capacity (year, plant_id, unit, prime_mover, capacity_mw, state, orispl, fuel_type);
+CREATE INDEX IF NOT EXISTS arp_egrid_capacity_year_state_idx ON arp_egrid_capacity (year, state);
+
+--- loading fraction bucket (in SQL rather than PL/pgSQL, so that it is inlined
+--- in the queries instead of being called for each row)
 CREATE OR REPLACE FUNCTION arp_bucket(lf double precision, prime_mover text)
 RETURNS double precision IMMUTABLE AS $$
-BEGIN
-  RETURN CASE
+  SELECT CASE
     WHEN (lf <= 0.2 AND prime_mover IN ('CT','CC','CS','ST')) THEN 0.2
 	WHEN (lf > 0.2 AND lf <= 0.75 AND prime_mover IN ('CT','CC','CS','ST')) THEN 0.75
 	WHEN (lf > 0.75 AND lf <= 0.9 AND prime_mover IN ('CT','CC','CS','ST')) THEN 0.9
@@ -166,10 +181,9 @@ BEGIN
 	WHEN (lf > 0.4 AND lf <= 0.75 AND prime_mover IN ('GT')) THEN 0.75
 	WHEN (lf > 0.75 AND lf <= 0.9 AND prime_mover IN ('GT')) THEN 0.9
 	WHEN (lf > 0.9 AND lf <= 1 AND prime_mover in ('GT')) THEN 1
-  END;
-END;
+  END
 $$
-LANGUAGE plpgsql;
+LANGUAGE sql;
 
 CREATE OR REPLACE VIEW arp_lf AS
 SELECT
@@ -188,7 +202,8 @@ SELECT
   loading_fraction.type
 FROM arp
 INNER JOIN arp_egrid_capacity ON
-  arp_egrid_capacity.plant_id = arp.plant_id
+  arp_egrid_capacity.year = date_part('year', arp.timestamp)
+  AND arp_egrid_capacity.plant_id = arp.plant_id
   AND arp_egrid_capacity.unit = arp.unit
 INNER JOIN loading_fraction ON
   arp_bucket(arp.gload / arp_egrid_capacity.nameplate_capacity, arp_egrid_capacity.prime_mover) = loading_fraction.loading_fraction
@@ -198,31 +213,19 @@ WHERE
   AND arp_egrid_capacity.nameplate_capacity <> 0
 ;
 
-CREATE MATERIALIZED VIEW arp_generation AS
-SELECT
-  year,
-  hour,
-  sum(gload) AS generation,
-  sum(so2_mass) AS so2,
-  sum(nox_mass) AS nox,
-  sum(co2_mass) AS co2,
-  sum(heat_input) AS heat,
-  sum(nameplate_capacity) AS total_capacity,
-  state,
-  status,
-  type
-FROM
-  arp_lf
-GROUP BY
-  hour,
-  year,
-  state,
-  status,
-  type
-;
-
-CREATE UNIQUE INDEX ON arp_generation (hour, year, state, status, type);
+CREATE TABLE IF NOT EXISTS arp_generation (
+    year DOUBLE PRECISION NOT NULL,
+    hour DOUBLE PRECISION NOT NULL,
+    generation DOUBLE PRECISION,
+    so2 DOUBLE PRECISION,
+    nox DOUBLE PRECISION,
+    co2 DOUBLE PRECISION,
+    heat DOUBLE PRECISION,
+    total_capacity DOUBLE PRECISION,
+    state CHARACTER VARYING,
+    status CHARACTER VARYING,
+    type TEXT
+);
 
--- To be run whenever arp data changes:
--- REFRESH MATERIALIZED VIEW CONCURRENTLY arp_egrid_capacity;
--- REFRESH MATERIALIZED VIEW CONCURRENTLY arp_generation;
+CREATE UNIQUE INDEX IF NOT EXISTS arp_generation_idx ON arp_generation (hour, year, state, status, type);
+CREATE INDEX IF NOT EXISTS arp_generation_state_year_idx ON arp_generation (state, year);
@@ -6,5 +6,6 @@ load_dotenv()
 
 DB_URL = os.getenv('DB_URL', 'postgresql:///sesame')
 SENTRY_DSN = os.environ.get('SENTRY_DSN', None)
+PRELOAD_DATA = os.environ.get('PRELOAD_DATA', '').lower() in ('1', 'true', 'yes')
 
 db.connect(DB_URL)
@@ -11,12 +11,12 @@ Created on Fri Nov 13 10:56:29 2020
 # Ask for natural gas industrial price by state from Ragini
 
 
-import pandas as pd
+from core import catalog
 import numpy as np
 
 #Read Data
 def read_data_tables():
-    shipping = pd.read_csv('shipping.csv')
+    shipping = catalog.read_csv('shipping.csv')
     return shipping
 
 shipping = read_data_tables()
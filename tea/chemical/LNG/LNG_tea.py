@@ -2,13 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import os
-import pandas as pd
 import us, statistics
 
 
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 
 PATH = os.getcwd() + "/tea/chemical/LNG/"
 
@@ -93,7 +92,7 @@ class LNGTEA(TeaBase):
 
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway
-        self.shipping_distance = pd.read_csv(PATH + "shipping.csv")
+        self.shipping_distance = catalog.read_csv(PATH + "shipping.csv")
         super().__init__()
 
 #Read Data
@@ -4,7 +4,7 @@
 
 """
 
-import pandas as pd
+from core import catalog
 import os
 
 PATH = os.getcwd() + "/tea/chemical/corn_ethanol/"
@@ -34,7 +34,7 @@ class BECCSTea:
         # Reading the reference and corn_ethanol_ccs csv file
 
         # Cost for transporting and storing CO2
-        other_costs = pd.read_csv(PATH + "transport&storage costs.csv")
+        other_costs = catalog.read_csv(PATH + "transport&storage costs.csv")
         ref_transport_cost = float(
             other_costs[other_costs["Generation Region"] == 'US'].iloc[0].transport)  # in USD/mile-tCO2
         ref_storage_cost = float(other_costs[other_costs["Generation Region"] == 'US'].iloc[0].storage)  # in USD/tCO2
@@ -52,7 +52,7 @@ class BECCSTea:
                        g_co2_in_mol_co2 / kg_g  # emission factor of NG units kgCo2/MJ NG burned
 
         if self.boilerstack_ccs == 'No':
-            ref_plant = pd.read_csv(PATH + "reference.csv")
+            ref_plant = catalog.read_csv(PATH + "reference.csv")
             filtered = ref_plant[ref_plant['plant type'] == "Ethanol Production"]
             ref_plant_size = float(filtered[filtered['technology'] == self.ferment_cap_tech].iloc[
                                        0].refsize)  # MMgal/yr  #units depend on plant type
@@ -79,7 +79,7 @@ class BECCSTea:
             fom_avg_cost = overnight_avg_cap_cost * (ferment_fom_capex / 100)  # fixed O&M USD/yr
 
             ## Variable O&M cost
-            power_cost = pd.read_csv(PATH + "electricity_industrial.csv")
+            power_cost = catalog.read_csv(PATH + "electricity_industrial.csv")
             electricity_cost = float(power_cost[power_cost['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                                ferment_elec_consumption * 1000 * cap_plant_emissions  # $/BTU *BTU/MJ * MJ/kgCo2 * 1000 kgCo2/tCo2 * tCo2 = $USD
             nat_gas_cost = 0
@@ -101,7 +101,7 @@ class BECCSTea:
         elif self.amine_regen_ccs == 'No' and self.biorefinery_model == 'AECOM':
 
             # Fermenter
-            ref_plant = pd.read_csv(PATH + "reference.csv")
+            ref_plant = catalog.read_csv(PATH + "reference.csv")
             filtered = ref_plant[ref_plant['plant type'] == "Ethanol Production"]
             ref_plant_size = float(filtered[filtered['technology'] == self.ferment_cap_tech].iloc[
                                        0].refsize)  # MMgal/yr  #units depend on plant type
@@ -159,7 +159,7 @@ class BECCSTea:
                            + ferment_overnght_avg_cap_cost * (ferment_fom_capex / 100)
 
             # Variable O&M cost
-            power_cost = pd.read_csv(PATH + "electricity_industrial.csv")
+            power_cost = catalog.read_csv(PATH + "electricity_industrial.csv")
             ferment_electricity_cost = float(
                 power_cost[power_cost['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                                        ferment_elec_consumption * 1000 * (
@@ -169,7 +169,7 @@ class BECCSTea:
                                       boiler_elec_consumption * 1000 * (
                                               boiler_ref_co2_captured_aecom * flow_scaling_factor * boiler_capture_scaling_factor)  # $/BTU *BTU/MJ * MJ/kgCo2 * 1000 kgCo2/tCo2 * tCo2 = $USD
 
-            fuel_costs = pd.read_csv(PATH + "natgas_industrial.csv")
+            fuel_costs = catalog.read_csv(PATH + "natgas_industrial.csv")
             nat_gas_cost = float(fuel_costs[fuel_costs['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                            boiler_fuel_consumption * 1000 * (
                                    boiler_ref_co2_captured_aecom * flow_scaling_factor * boiler_capture_scaling_factor)  # $/BTU *BTU/MJ * MJ/kgCo2 * 1000 kgCo2/tCo2 * tCo2 = $USD
@@ -190,7 +190,7 @@ class BECCSTea:
         elif self.amine_regen_ccs == 'No' and self.biorefinery_model == 'Avg 88':
 
             # Fermenter
-            ref_plant = pd.read_csv(PATH + "reference.csv")
+            ref_plant = catalog.read_csv(PATH + "reference.csv")
             filtered = ref_plant[ref_plant['plant type'] == "Ethanol Production"]
             ref_plant_size = float(filtered[filtered['technology'] == self.ferment_cap_tech].iloc[
                                        0].refsize)  # MMgal/yr  #units depend on plant type
@@ -248,7 +248,7 @@ class BECCSTea:
                            + ferment_overnght_avg_cap_cost * (ferment_fom_capex / 100)  # fixed O&M cost
 
             ## Variable O&M cost
-            power_cost = pd.read_csv(PATH + "electricity_industrial.csv")
+            power_cost = catalog.read_csv(PATH + "electricity_industrial.csv")
             ferment_electricity_cost = float(
                 power_cost[power_cost['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                                        ferment_elec_consumption * 1000 * (
@@ -258,7 +258,7 @@ class BECCSTea:
                                       boiler_elec_consumption * 1000 * (
                                               boiler_ref_co2_captured_avg88 * flow_scaling_factor * boiler_capture_scaling_factor)  # compression electricity cost
 
-            fuel_costs = pd.read_csv(PATH + "natgas_industrial.csv")
+            fuel_costs = catalog.read_csv(PATH + "natgas_industrial.csv")
             nat_gas_cost = float(fuel_costs[fuel_costs['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                            boiler_fuel_consumption * 1000 * (
                                    boiler_ref_co2_captured_avg88 * flow_scaling_factor * boiler_capture_scaling_factor)  # fuel cost
@@ -278,7 +278,7 @@ class BECCSTea:
 
         elif self.amine_regen_ccs == 'Yes' and self.biorefinery_model == 'AECOM':
             # Fermenter
-            ref_plant = pd.read_csv(PATH + "reference.csv")
+            ref_plant = catalog.read_csv(PATH + "reference.csv")
             filtered = ref_plant[ref_plant['plant type'] == "Ethanol Production"]
             ref_plant_size = float(filtered[filtered['technology'] == self.ferment_cap_tech].iloc[
                                        0].refsize)  # MMgal/yr  #units depend on plant type
@@ -342,7 +342,7 @@ class BECCSTea:
                            + ferment_overnght_avg_cap_cost * (ferment_fom_capex / 100)  # fixed O&M USD/yr
 
             ## Variable O&M cost
-            power_cost = pd.read_csv(PATH + "electricity_industrial.csv")
+            power_cost = catalog.read_csv(PATH + "electricity_industrial.csv")
             ferment_electricity_cost = float(
                 power_cost[power_cost['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                                        ferment_elec_consumption * 1000 * (
@@ -355,7 +355,7 @@ class BECCSTea:
             boiler_electricity_cost = float(power_cost[power_cost['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                                       boiler_elec_consumption * 1000 * boiler_total_ref_captured  # compression electricity cost
 
-            fuel_costs = pd.read_csv(PATH + "natgas_industrial.csv")
+            fuel_costs = catalog.read_csv(PATH + "natgas_industrial.csv")
             nat_gas_cost = float(fuel_costs[fuel_costs['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                            boiler_fuel_consumption * 1000 * boiler_total_ref_captured  # fuel cost
 
@@ -375,7 +375,7 @@ class BECCSTea:
         elif self.amine_regen_ccs == 'Yes' and self.biorefinery_model == 'Avg 88':
 
             # Fermenter
-            ref_plant = pd.read_csv(PATH + "reference.csv")
+            ref_plant = catalog.read_csv(PATH + "reference.csv")
             filtered = ref_plant[ref_plant['plant type'] == "Ethanol Production"]
             ref_plant_size = float(filtered[filtered['technology'] == self.ferment_cap_tech].iloc[
                                        0].refsize)  # MMgal/yr  #units depend on plant type
@@ -436,7 +436,7 @@ class BECCSTea:
                            + ferment_overnght_avg_cap_cost * (ferment_fom_capex / 100)
 
             ## Variable O&M cost
-            power_cost = pd.read_csv(PATH + "electricity_industrial.csv")
+            power_cost = catalog.read_csv(PATH + "electricity_industrial.csv")
             ferment_electricity_cost = float(
                 power_cost[power_cost['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                                        ferment_elec_consumption * 1000 * (
@@ -448,7 +448,7 @@ class BECCSTea:
             boiler_electricity_cost = float(power_cost[power_cost['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                                       boiler_elec_consumption * 1000 * boiler_total_ref_captured  # compression electricity cost
 
-            fuel_costs = pd.read_csv(PATH + "natgas_industrial.csv")
+            fuel_costs = catalog.read_csv(PATH + "natgas_industrial.csv")
             nat_gas_cost = float(fuel_costs[fuel_costs['State'] == 'US average'].iloc[0].value) * btu_in_mj * \
                            boiler_fuel_consumption * 1000 * boiler_total_ref_captured  # fuel cost
 
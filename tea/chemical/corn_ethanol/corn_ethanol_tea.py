@@ -11,11 +11,10 @@ Created on Wed August 4 10:00:29 2021
 
 
 import os
-import pandas as pd
 # import us, statistics
 
 
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 from core.inputs import ContinuousInput, Default, OptionsInput, CategoricalInput, Tooltip
 from core.tea import TeaBase
 from tea.chemical.corn_ethanol.corn_ethanol_ccs_tea import BECCSTea
@@ -154,8 +153,8 @@ class corn_EthanolTEA(TeaBase):
 
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway
-        self.ethanol_production_param = pd.read_csv(PATH + "corn_ethanol_production_tech.csv")
-        self.cost_transportation = pd.read_csv(PATH + "corn_ethanol_transportation_costs.csv")
+        self.ethanol_production_param = catalog.read_csv(PATH + "corn_ethanol_production_tech.csv")
+        self.cost_transportation = catalog.read_csv(PATH + "corn_ethanol_transportation_costs.csv")
         super().__init__()
 
     def get_cost_breakdown(self):
@@ -2,11 +2,10 @@
 # -*- coding: utf-8 -*
 
 import os
-import pandas as pd
 from us import STATES
 
 from tea.chemical.SLCOE import SLCOE
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
 
@@ -52,15 +51,15 @@ class DieselTEA(TeaBase):
 
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway
-        self.cost_crude = pd.read_csv(PATH + "domesticcrude_refinerprice.csv")
-        self.cost_residoil = pd.read_csv(PATH + "residoil_industrial.csv")
-        self.cost_hydrogen = pd.read_csv(PATH + "hydrogen_industrial.csv")
-        self.cost_electricity = pd.read_csv(PATH + "electricity_industrial.csv")
-        self.cost_natgas = pd.read_csv(PATH + "natgas_industrial.csv")
-        self.cost_other = pd.read_csv(PATH + "diesel_costpar.csv")
-        self.taxes = pd.read_csv(PATH + "diesel_taxes.csv")
-        self.input_fractions = pd.read_csv(PATH + "diesel_input_fractions.csv")
-        self.cost_transportation = pd.read_csv(PATH + "diesel_transportation_costs.csv")
+        self.cost_crude = catalog.read_csv(PATH + "domesticcrude_refinerprice.csv")
+        self.cost_residoil = catalog.read_csv(PATH + "residoil_industrial.csv")
+        self.cost_hydrogen = catalog.read_csv(PATH + "hydrogen_industrial.csv")
+        self.cost_electricity = catalog.read_csv(PATH + "electricity_industrial.csv")
+        self.cost_natgas = catalog.read_csv(PATH + "natgas_industrial.csv")
+        self.cost_other = catalog.read_csv(PATH + "diesel_costpar.csv")
+        self.taxes = catalog.read_csv(PATH + "diesel_taxes.csv")
+        self.input_fractions = catalog.read_csv(PATH + "diesel_input_fractions.csv")
+        self.cost_transportation = catalog.read_csv(PATH + "diesel_transportation_costs.csv")
 
     def get_fuel_cost(self):
         filtered = self.input_fractions
@@ -6,13 +6,12 @@
 # See sources for values in 'hydrogen_production_tech.csv' in 'hydrogen_production_tech_sources.csv'
 
 import os
-import pandas as pd
 import us, statistics
 
 
 from core.inputs import OptionsInput, Default, ContinuousInput, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 from tea.electricity.ccs.pointsources.ccs_tea import CcsTea
 from analysis.sensitivity import SensitivityInput
 
@@ -249,7 +248,7 @@ class HydrogenTEA(TeaBase):
 
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway
-        self.h2_production_param = pd.read_csv(PATH + "hydrogen_production_tech.csv")
+        self.h2_production_param = catalog.read_csv(PATH + "hydrogen_production_tech.csv")
         # if lca_pathway is not None:
         super().__init__(lca_pathway)
 
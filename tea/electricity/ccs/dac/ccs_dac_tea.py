@@ -1,8 +1,7 @@
-import pandas as pd
 import os
 from core.inputs import CategoricalInput, ContinuousInput, OptionsInput, Default
 from core.tea import TeaBase
-from core import validators
+from core import catalog, validators
 import core.conditionals as conditionals
 from us import STATES
 
@@ -82,7 +81,7 @@ class CcsDacTea(TeaBase):
 
     #Electricity consumption calculation based on dac process electricity requiremens and compression electricity requirements
     def get_elec_consumption(self):
-        ref_plant = pd.read_csv(PATH + "plant_ref_data_dac.csv")
+        ref_plant = catalog.read_csv(PATH + "plant_ref_data_dac.csv")
         filtered = ref_plant[ref_plant['Plant Technology'] == self.tech]
         dac_elec_consumption = float(
             filtered[filtered['Plant Technology'] == self.tech].iloc[0].dac_electricity)  # in MJ/kgCO2 captured
@@ -93,7 +92,7 @@ class CcsDacTea(TeaBase):
 
     #NG dac process consumption calculation based on technology requirements
     def get_natgas_dac_consumption(self): # dac
-        ref_plant = pd.read_csv(PATH + "plant_ref_data_dac.csv")
+        ref_plant = catalog.read_csv(PATH + "plant_ref_data_dac.csv")
         filtered = ref_plant[ref_plant['Plant Technology'] == self.tech]
         nat_gas_dac_consumption = float(
             filtered[filtered['Plant Technology'] == self.tech].iloc[0].gas)  # in MJ/kgCO2 captured from dac
@@ -122,7 +121,7 @@ class CcsDacTea(TeaBase):
     # TEA
     #Fuel cost calculation based on natural gas consumption and natural gas price
     def get_fuel_cost(self):
-        us_prices = pd.read_csv(PATH + "us_prices.csv")
+        us_prices = catalog.read_csv(PATH + "us_prices.csv")
         filtered = us_prices[us_prices['state'] == self.state]
         nat_gas_price = float(filtered[filtered['state'] == self.state].iloc[0].gas)
         natgas_dac_consumption = self.get_natgas_dac_consumption() * 1000 * self.capacity # MJ/year for dac capture
@@ -137,7 +136,7 @@ class CcsDacTea(TeaBase):
     # Electricity cost calculation based on electricity consumption and electricity price
     def get_elec_cost(self):
         if self.use_user_elec_price == 'No':
-            us_prices = pd.read_csv(PATH + "us_prices.csv")
+            us_prices = catalog.read_csv(PATH + "us_prices.csv")
             filtered = us_prices[us_prices['state'] == self.state]
             elec_price = float(filtered[filtered['state'] == self.state].iloc[0].electricity)  # in USD/MJ
             elec_cost = self.get_elec_consumption() * 1000 * self.capacity * elec_price  # in USD/year
@@ -148,7 +147,7 @@ class CcsDacTea(TeaBase):
     #Capital cost calculation
     def get_capital_cost(self):
         if self.use_user_capex_cost == 'No':
-            ref_plant = pd.read_csv(PATH + "plant_ref_data_dac.csv")
+            ref_plant = catalog.read_csv(PATH + "plant_ref_data_dac.csv")
             filtered = ref_plant[ref_plant['Plant Technology'] == self.tech]
             ref_capacity = float(
                 filtered[filtered['Plant Technology'] == self.tech].iloc[0].refsize)  # ton/year
@@ -187,7 +186,7 @@ class CcsDacTea(TeaBase):
 
     # Fixed O&M Cost Calculation
     def get_fom_cost(self):
-        ref_plant = pd.read_csv(PATH + "plant_ref_data_dac.csv")
+        ref_plant = catalog.read_csv(PATH + "plant_ref_data_dac.csv")
         filtered = ref_plant[ref_plant['Plant Technology'] == self.tech]
         opex = float(
             filtered[filtered['Plant Technology'] == self.tech].iloc[0].opex)  # in MJ/kgCO2 captured
@@ -201,7 +200,7 @@ class CcsDacTea(TeaBase):
 
     # Transport Cost Calculation based on distance
     def get_transport_cost(self):
-        us_prices = pd.read_csv(PATH + "us_prices.csv")
+        us_prices = catalog.read_csv(PATH + "us_prices.csv")
         filtered = us_prices[us_prices['state'] == self.state]
         ref_transp_cost = float(filtered[filtered['state'] == self.state].iloc[0].transport)  # in USD/mile-tCO2
         transp_cost = ref_transp_cost * self.distance * self.get_co2_captured()[2]  # in USD/year
@@ -210,7 +209,7 @@ class CcsDacTea(TeaBase):
     # Storage Cost Calculation
     def get_storage_cost(self):
         if self.use_user_storage_cost == 'No':
-            us_prices = pd.read_csv(PATH + "us_prices.csv")
+            us_prices = catalog.read_csv(PATH + "us_prices.csv")
             filtered = us_prices[us_prices['state'] == self.state]
             ref_storage_cost = float(filtered[filtered['state'] == self.state].iloc[0].storage)  # in USD/tCO2
             storage_cost = ref_storage_cost * self.get_co2_captured()[2]  # in USD/year
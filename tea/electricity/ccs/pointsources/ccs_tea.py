@@ -1,10 +1,9 @@
-import pandas as pd
 import os
 import us, statistics
 
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 
 
 PATH = os.getcwd() + "/tea/electricity/ccs/pointsources/"
@@ -14,7 +13,7 @@ class CcsTea:
 
     @classmethod
     def user_inputs(cls, source = "Hydrogen Production", tea_lca = False, cost_or_not = "Cost"):
-        cost_defaults = pd.read_csv(PATH + "transport&storage costs.csv")
+        cost_defaults = catalog.read_csv(PATH + "transport&storage costs.csv")
 
         cap_tech = "amine" # Presently the only CCS Technology modeled in SESAME
         # cls.plant_type = source
@@ -160,7 +159,7 @@ class CcsTea:
 
         # Read techno-economic reference data
         global cap_regen_emissions, cap_comp_emissions
-        ref_plant = pd.read_csv(PATH + "reference.csv")
+        ref_plant = catalog.read_csv(PATH + "reference.csv")
         filtered = ref_plant[ref_plant['plant type'] == self.plant_type]
         ref_plant_size = float(
             filtered[filtered['technology'] == self.capture_tech].iloc[0].refsize)  # units depend on plant type
@@ -184,7 +183,7 @@ class CcsTea:
         #filtered = fuel_costs[fuel_costs["Generation Region"] == self.gr]
         #coal_price = float(filtered[filtered['Year'] == self.yr].iloc[0].value)/1055 # in USD/MJ
 
-        other_costs = pd.read_csv(PATH + "transport&storage costs.csv")
+        other_costs = catalog.read_csv(PATH + "transport&storage costs.csv")
         ref_transp_cost = float(other_costs[other_costs["Generation Region"] == self.gr].iloc[0].transport)  # in USD/mile-tCO2
         if self.storage_cost_source != 'User defined':
             ref_storage_cost = float(other_costs[other_costs["Generation Region"] == self.gr].iloc[0].storage)  # in USD/tCO2
@@ -223,7 +222,7 @@ class CcsTea:
             # gathering energy density based on type of coal
             coal_rank = self.extra_inputs['coal_rank']
             print(coal_rank)
-            coal_properties = pd.read_csv(PATH [:- len ("ccs/pointsources/")] + "coal/coal_properties.csv")
+            coal_properties = catalog.read_csv(PATH [:- len ("ccs/pointsources/")] + "coal/coal_properties.csv")
             coal_densities = coal_properties[coal_properties['characteristic'] == 'energy density']
             filtered = coal_densities[coal_densities['coal rank'] == coal_rank] #default value
             btu_in_short_ton = float(filtered.iloc[0].value)
@@ -4,11 +4,10 @@ CAPITAL_FRACTION = [0.8, 0.1, 0.1]
 DEPRECIATION = [0.2, 0.32, 0.192, 0.1152, 0.1152, 0.0576]
 
 import os
-import pandas as pd
 import us, statistics
 
 from tea.electricity.SLCOE import SLCOE
-from core import validators
+from core import catalog, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
 import core.conditionals as conditionals
@@ -16,7 +15,6 @@ from tea.electricity.ccs.pointsources.ccs_tea import CcsTea
 from analysis.sensitivity import SensitivityInput
 
 PATH = os.getcwd() + "/tea/electricity/coal/"
-REGION_STATE = pd.read_csv(os.getcwd() + "/tea/electricity/regions_mapping.csv")
 #States_available = pd.read_csv(os.getcwd() + "/tea/electricity/coal/coal_heatrate_cf.csv")
 
 
@@ -253,10 +251,10 @@ class CoalTEA(TeaBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fuel_costs = pd.read_csv(PATH + "coal_EIA_fuelcost.csv")
-        self.heatrate_cf = pd.read_csv(PATH + "coal_heatrate_cf_new.csv")
-        self.other_costs = pd.read_csv(PATH + "coal_other_costs.csv")
-        self.finance = pd.read_csv(PATH + "coal_finance.csv")
+        self.fuel_costs = catalog.read_csv(PATH + "coal_EIA_fuelcost.csv")
+        self.heatrate_cf = catalog.read_csv(PATH + "coal_heatrate_cf_new.csv")
+        self.other_costs = catalog.read_csv(PATH + "coal_other_costs.csv")
+        self.finance = catalog.read_csv(PATH + "coal_finance.csv")
 
     def prepare(self, input_set):
         super().prepare(input_set)
@@ -1,11 +1,10 @@
 import os
 import statistics
 
-import pandas as pd
 import us
 
 from tea.electricity.LCOE import LCOE
-from core import conditionals, validators
+from core import catalog, conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput
 from core.tea import TeaBase
 
@@ -91,8 +90,8 @@ class HydropowerTEA(TeaBase):
 
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway
-        self.finance = pd.read_csv(PATH + "hydropower_finance.csv")
-        self.cost_data = pd.read_csv(PATH + "hydropower_costs_v2.csv")
+        self.finance = catalog.read_csv(PATH + "hydropower_finance.csv")
+        self.cost_data = catalog.read_csv(PATH + "hydropower_costs_v2.csv")
         super().__init__()
 
     def get_capacity_factor(self):
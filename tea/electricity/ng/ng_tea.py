@@ -4,12 +4,11 @@ CAPITAL_FRACTION = [0.8, 0.1, 0.1]
 DEPRECIATION = [0.2, 0.32, 0.192, 0.1152, 0.1152, 0.0576]
 
 import os
-import pandas as pd
 import  statistics
 
 from tea.electricity.LCOE import LCOE
 from tea.electricity.SLCOE import SLCOE
-from core import validators
+from core import catalog, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
 import core.conditionals as conditionals
@@ -18,7 +17,6 @@ from us import STATES
 from analysis.sensitivity import SensitivityInput
 
 PATH = os.getcwd() + "/tea/electricity/ng/"
-REGION_STATE = pd.read_csv(os.getcwd() + "/tea/electricity/nerc_mapping.csv")
 
 
 # inputs are read from the electricity database based on the parameters from JSON
@@ -243,10 +241,10 @@ class NaturalGasTEA(TeaBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fuel_costs = pd.read_csv(PATH + "ng_EIA_fuelcost.csv")
-        self.heatrate_cf = pd.read_csv(PATH + "ng_heatrate_cf_new.csv")
-        self.other_costs = pd.read_csv(PATH + "ng_other_costs.csv")
-        self.finance = pd.read_csv(PATH + "ng_finance.csv")
+        self.fuel_costs = catalog.read_csv(PATH + "ng_EIA_fuelcost.csv")
+        self.heatrate_cf = catalog.read_csv(PATH + "ng_heatrate_cf_new.csv")
+        self.other_costs = catalog.read_csv(PATH + "ng_other_costs.csv")
+        self.finance = catalog.read_csv(PATH + "ng_finance.csv")
 
     def prepare(self, input_set):
         super().prepare(input_set)
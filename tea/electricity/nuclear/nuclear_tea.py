@@ -9,11 +9,10 @@ Created on Tue Jan 26 10:44:43 2021
 import os
 import statistics
 
-import pandas as pd
 import us
 
 from tea.electricity.LCOE import LCOE
-from core import conditionals, validators
+from core import catalog, conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
 
@@ -129,8 +128,8 @@ class NuclearTEA(TeaBase):
 
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway
-        self.finance = pd.read_csv(PATH + "nuclear_finance.csv")
-        self.other_costs = pd.read_csv(PATH + "nuclear_costs.csv")
+        self.finance = catalog.read_csv(PATH + "nuclear_finance.csv")
+        self.other_costs = catalog.read_csv(PATH + "nuclear_costs.csv")
         super().__init__()
 
 
@@ -6,10 +6,9 @@ Purpose: Estimate LCOE of electricity supplied by intermittent renewable with st
 """
 
 import os
-import pandas as pd
 
 from core.tea import TeaBase
-from core import conditionals, validators
+from core import catalog, conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Option, InputSet
 import numpy as np
 import core.conditionals as conditionals
@@ -114,7 +113,7 @@ class StorageCombination(TeaBase):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.psm_df = pd.read_csv(os.path.join(PATH, "compiled_results.csv"))
+        self.psm_df = catalog.read_csv(os.path.join(PATH, "compiled_results.csv"))
 
         self.wind = WindTEA_PS()
         self.solar = SolarTEA()
@@ -182,7 +181,7 @@ class StorageCombination(TeaBase):
             path_storage_data = PATH_lib_data
         elif sto == 'Compressed Air':
             path_storage_data = PATH_caes_data
-        sto_cost_df = pd.read_csv(path_storage_data)
+        sto_cost_df = catalog.read_csv(path_storage_data)
 
         eta_c = self.read_storage_data(sto_cost_df, sto_opt, 'Efficiency up')
         eta_d = self.read_storage_data(sto_cost_df, sto_opt, 'Efficiency down')
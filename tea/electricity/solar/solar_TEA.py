@@ -1,18 +1,20 @@
+from functools import partial
 import os
-import pandas as pd
 import numpy as np
 import math
 
 from core import conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput
 from core.tea import TeaBase
+from core import catalog
+from core.utils import LazyData
 from analysis.sensitivity import SensitivityInput
 
 PATH = os.path.dirname(__file__)
-DATA = {
-    'cf': pd.read_csv(os.path.join(os.getcwd(), 'pathway', 'process', 'solar', 'solar_cf_table.csv')),
-    'ATB' : pd.read_csv(os.path.join(os.getcwd(), 'tea', 'electricity', 'solar', 'ATB.csv'), index_col = 0),
-}
+DATA = LazyData({
+    'cf': partial(catalog.read_csv, os.path.join(os.getcwd(), 'pathway', 'process', 'solar', 'solar_cf_table.csv')),
+    'ATB' : partial(catalog.read_csv, os.path.join(os.getcwd(), 'tea', 'electricity', 'solar', 'ATB.csv'), index_col = 0),
+})
 
 class SolarTEA(TeaBase):
     unit = '$/MWh'
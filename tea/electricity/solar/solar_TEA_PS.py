@@ -12,7 +12,7 @@ import numpy as np
 import us
 
 from tea.electricity.LCOE import LCOE
-from core import conditionals, validators
+from core import catalog, conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput
 from core.tea import TeaBase
 
@@ -66,7 +66,7 @@ class SolarTEA(TeaBase):
     def __init__(self, lca_pathway=None):
         # print(lca_pathway)
         self.lca_pathway = lca_pathway
-        self.finance = pd.read_csv(PATH + "finance.csv")
+        self.finance = catalog.read_csv(PATH + "finance.csv")
         if lca_pathway is None:
             # print('Hi')
             pass
@@ -120,7 +120,7 @@ class SolarTEA(TeaBase):
         # print(self.shading)
         #pulling initial TEA values based on user input and then adjusting necessary values based on input efficiency and ILR
         if self.cell or self.cell == 'CIGS':
-            cost_perW = pd.read_csv(PATH + 'thin film.csv', index_col = 0)
+            cost_perW = catalog.read_csv(PATH + 'thin film.csv', index_col = 0)
             if self.cell == 'CdTe':
                 efficiency_mf = 14/float(self.efficiency) 
                 ILR_mf = 1.3/float(self.ILR)         
@@ -187,9 +187,9 @@ class SolarTEA(TeaBase):
         if self.location == 'Residential':
             ILR_mf = 1.14/float(self.ILR)  
             if self.roof == 'Retrofit':
-                cost_perW = pd.read_csv(PATH + 'residential.csv', index_col = 0)
+                cost_perW = catalog.read_csv(PATH + 'residential.csv', index_col = 0)
             elif self.roof != 'Retrofit':
-                cost_perW = pd.read_csv(PATH + 'residential_new.csv', index_col = 0)
+                cost_perW = catalog.read_csv(PATH + 'residential_new.csv', index_col = 0)
         
             if self.cell == 'multi crystal Si':
                 multi_cost = -0.06
@@ -333,8 +333,8 @@ class SolarTEA(TeaBase):
         
         if self.location == 'Commercial':
             ILR_mf = 1.14/float(self.ILR)
-            df = pd.read_csv(PATH +'commercial.csv', index_col = 0)
-            alphas_df = pd.read_csv(PATH +'commercial alphas.csv', index_col = 0)
+            df = catalog.read_csv(PATH +'commercial.csv', index_col = 0)
+            alphas_df = catalog.read_csv(PATH +'commercial alphas.csv', index_col = 0)
             if self.cell == 'multi crystal Si':
                 multi_cost = -0.06
                 df.iloc[-1, 0] = df.iloc[-1, 0] + multi_cost
@@ -392,8 +392,8 @@ class SolarTEA(TeaBase):
                 
             
         if self.location == 'Utility':
-            df = pd.read_csv(PATH +'utility.csv', index_col = 0)
-            alphas_df = pd.read_csv(PATH +'utility alphas.csv', index_col = 0)
+            df = catalog.read_csv(PATH +'utility.csv', index_col = 0)
+            alphas_df = catalog.read_csv(PATH +'utility alphas.csv', index_col = 0)
             if self.cell == 'multi crystal Si':
                 multi_cost = -0.05
                 df.iloc[-1, 0] = df.iloc[-1, 0] + multi_cost
@@ -490,7 +490,7 @@ class SolarTEA(TeaBase):
         tec=0.4223 # Typical tracker energy consumption per panel area in kWh/m²/yr
         # (Source: (5) Sinha, Eco-Efficiency of CdTe Photovoltaics with Tracking Systems, 2013, IEEE)
         
-        cf_table=pd.read_csv(PATH +"solar_tables.csv")
+        cf_table=catalog.read_csv(PATH +"solar_tables.csv")
         if 'Si' in self.cell:
              pat=' Si'
         else:
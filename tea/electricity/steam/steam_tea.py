@@ -1,8 +1,7 @@
 import os
-import pandas as pd
 from core.inputs import OptionsInput, Default, ContinuousInput, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
-from core import validators, conditionals
+from core import validators, conditionals, catalog
 from tea.electricity.ccs.pointsources.ccs_tea import CcsTea
 
 #PATH = os.getcwd() + "/tea/electricity/steam/"
@@ -100,7 +99,7 @@ class SteamTEA(TeaBase):
 
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway
-        self.cost_par = pd.read_csv(PATH + "steam_costpar.csv")
+        self.cost_par = catalog.read_csv(PATH + "steam_costpar.csv")
         #        self.cost_coal_filename = pd.read_csv(PATH + "coal_industrialprice.csv")
         #        self.cost_ng_filename = pd.read_csv(PATH + "ng_industrialprice.csv")
         super().__init__()
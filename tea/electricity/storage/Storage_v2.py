@@ -11,12 +11,11 @@ There is also an option to use this class with the Power with Storage feature.
 
 """
 
-import pandas as pd
 import os
 
 from tea.electricity.LCOE import LCOE
 from core.tea import TeaBase
-from core import conditionals, validators
+from core import catalog, conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput
 
 PATH = os.getcwd() + "/tea/electricity/storage/"
@@ -224,7 +223,7 @@ class StorageTEA(TeaBase):
         
     # How to deal with file names and paths?
     def __init__(self, power_storage_dict=None, *args, **kwargs):
-        self.finance = pd.read_csv(PATH + "finance.csv")   
+        self.finance = catalog.read_csv(PATH + "finance.csv")   
         # Can't initialize cost data here because haven't selected values for user input yet
         # self.cost_data = pd.read_csv(PATH + "storage_data.csv")
         super().__init__(*args, **kwargs)
@@ -243,7 +242,7 @@ class StorageTEA(TeaBase):
 
 
     def load_cost_data(self):
-        self.cost_data = pd.read_csv(os.path.join(PATH_cost, cost_files[self.storage_tech]))
+        self.cost_data = catalog.read_csv(os.path.join(PATH_cost, cost_files[self.storage_tech]))
         return None
 
     # Does storage CF include charge duration?
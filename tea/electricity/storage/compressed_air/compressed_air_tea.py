@@ -2,12 +2,11 @@ import os
 # import statistics
 # from pathlib import Path
 
-import pandas as pd
 # import us
 
 from tea.electricity.storage.Storage import Storage
 # from tea.electricity.LCOE import LCOE
-from core import conditionals, validators
+from core import catalog, conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput
 # from core.tea import TeaBase
 
@@ -50,5 +49,5 @@ class CompressedAirTEA(Storage):
     
     def __init__(self, lca_pathway=None):
         self.lca_pathway = lca_pathway   
-        self.finance = pd.read_csv(PATH + "finance.csv")   
-        self.cost_data = pd.read_csv(PATH + "compressed_air_costs.csv")
\ No newline at end of file
+        self.finance = catalog.read_csv(PATH + "finance.csv")   
+        self.cost_data = catalog.read_csv(PATH + "compressed_air_costs.csv")
\ No newline at end of file
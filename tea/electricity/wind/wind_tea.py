@@ -1,11 +1,10 @@
 import os
 import statistics
 
-import pandas as pd
 import us
 
 from tea.electricity.LCOE import LCOE
-from core import conditionals, validators
+from core import catalog, conditionals, validators
 from core.inputs import OptionsInput, ContinuousInput, Default, CategoricalInput, Tooltip, PercentInput, Input
 from core.tea import TeaBase
 from analysis.sensitivity import SensitivityInput
@@ -149,12 +148,12 @@ class WindTEA(TeaBase):
         ]
 
     def __init__(self, **kwargs):
-        self.cost_by_parts = pd.read_csv(PATH + "cost_by_parts.csv")
-        self.cost_multipliers = pd.read_csv(PATH + "capital_cost_multipliers.csv")
-        self.finance = pd.read_csv(PATH + "finance.csv")
-        self.region_speed = pd.read_csv(PATH + "region_speed_new.csv")
+        self.cost_by_parts = catalog.read_csv(PATH + "cost_by_parts.csv")
+        self.cost_multipliers = catalog.read_csv(PATH + "capital_cost_multipliers.csv")
+        self.finance = catalog.read_csv(PATH + "finance.csv")
+        self.region_speed = catalog.read_csv(PATH + "region_speed_new.csv")
         # self.trgs_speed = pd.read_csv(PATH + "trgs_speed.csv")
-        self.other_costs = pd.read_csv(PATH + "wind_other_costs.csv")
+        self.other_costs = catalog.read_csv(PATH + "wind_other_costs.csv")
         super().__init__(**kwargs)
 
     def prepare(self, input_set):
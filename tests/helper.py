@@ -3,6 +3,8 @@ from core.pathway import Pathway, Step
 import random
 from pathway.topology import metadata as pathway_metadata
 import json
+import os
+import re
 
 def _filter_activities(activities):
     return [
@@ -70,3 +72,38 @@ def random_input_set(source):
                 input_set.set_value(input.name, random.randint(min, max))
 
     return input_set
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), '..', 'schema.sql')
+
+_CREATE = re.compile(
+    r'CREATE (?:TABLE (?:IF NOT EXISTS )?(\w+)'
+    r'|(?:UNIQUE )?INDEX (?:IF NOT EXISTS )?\w+ ON (\w+)'
+    r'|OR REPLACE (?:FUNCTION|VIEW) (\w+))'
+)
+
+def schema_statements(*names):
+    """
+    Returns the statements of schema.sql creating the tables (with their
+    indexes), functions and views in `names`, in the order of the schema.
+    """
+    with open(SCHEMA_PATH) as f:
+        lines = f.read().splitlines()
+
+    statements = []
+    statement = []
+    quoted = False
+    for line in lines:
+        code = line if quoted else line.split('---')[0]
+        statement.append(code)
+        # statements end with a semicolon, except within function bodies
+        quoted ^= code.count('$$') % 2 == 1
+        if not quoted and code.rstrip().endswith(';'):
+            statements.append('\n'.join(statement).strip())
+            statement = []
+
+    res = []
+    for statement in statements:
+        match = _CREATE.match(statement)
+        if match and any(name in names for name in match.groups()):
+            res.append(statement)
+    return res
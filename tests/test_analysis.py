@@ -1,10 +1,17 @@
+import numpy as np
 import pandas as pd
+import pytest
 import tests.helper as helper
 
 import analysis.lca as lca
+from analysis.lca.matrix import MatrixLCA, MatrixLCAError, topology_chains
 import analysis.tea as tea
+import analysis.uncertainty as uncertainty
 from analysis.system.fleet.fleet import FleetModel
+from core.pathway import Pathway
+from core.sinks import CSVSink
 from core.tea import TeaPathway
+from pathway.topology import metadata
 from tea.topology import tea_registry
 
 def test_lca():
@@ -18,3 +25,148 @@ def test_lca():
 #     data = tea.run(tea_pathway)
 #     assert type(data) == dict
 #     assert type(data['data']) == pd.DataFrame
+
+def _pathways():
+    # fixed pathways, so that results can be compared between runs
+    return [
+        Pathway.build([
+            'enduse-electricity-default',
+            'gatetoenduse-transmission-literaturereview',
+            f'process-{process}',
+            f'upstream-{upstream}',
+        ])
+        for process, upstream in [
+            ('solarpowerproduction-default', 'solar-default'),
+            ('windpowerproduction-default', 'wind-default'),
+            ('hydropowerproduction-greet', 'hydropower-default'),
+        ]
+    ]
+
+def test_lca_batch():
+    pathways = _pathways()
+    serial = lca.run(pathways)
+    batch = lca.run_batch(pathways, workers=2)
+    assert batch['unit'] == serial['unit']
+    pd.testing.assert_frame_equal(batch['data'], serial['data'])
+
+def test_compute_flows():
+    df = pd.DataFrame([
+        ('a', 'CO2', 1.0, 'kg/MJ'),
+        ('a', 'ch4', 0.5, 'kg/MJmile'),
+        ('b', 'co2', 2.0, 'kg/MJ'),
+        ('a', 'CO2', 3.0, 'kg/MJ'),
+    ], columns=['activity', 'flows', 'value', 'unit'])
+
+    flows = lca.compute_flows(df, {'unit': 'MJ', 'value': 2}, {'distance': 10})
+    assert flows == {
+        'a': {
+            'co2': {'name': 'co2', 'unit': 'kg', 'value': 8.0},
+            'ch4': {'name': 'ch4', 'unit': 'kg', 'value': 10.0},
+        },
+        'b': {
+            'co2': {'name': 'co2', 'unit': 'kg', 'value': 4.0},
+        },
+    }
+    assert list(flows['a']) == ['co2', 'ch4']
+
+    # Python floats, whatever the type of the output value
+    flows = lca.compute_flows(df, {'unit': 'MJ', 'value': np.float64(1 / 3)}, {'distance': 10})
+    assert type(flows['a']['co2']['value']) is float
+    assert flows['a']['co2']['value'] == round(4.0 * (1 / 3), 9)
+
+    with pytest.raises(AssertionError, match=r"output unit \(kWh\): CO2 \(kg/MJ\), ch4 \(kg/MJmile\)"):
+        lca.compute_flows(df, {'unit': 'kWh', 'value': 1}, {'distance': 10})
+
+def test_matrix_lca():
+    # the first chain that can't be compiled fails
+    with pytest.raises(MatrixLCAError, match='process-windpowerproduction-default'):
+        MatrixLCA.compile()
+
+    model = MatrixLCA.compile(skip_errors=True)
+    # the default inputs of the DAC process fail
+    assert 'Direct air capture > Direct Air Capture Process > DAC' in model.errors
+    # the wind process takes the emissions of the WindTEA step, not a flow
+    assert 'Electricity > Transmission > WindPowerProduction > WindTEA > Wind' in model.errors
+    assert len(model.chains) + len(model.errors) == len(topology_chains(metadata))
+    assert model.verify() == []
+
+    reference = model.solve()
+    doubled = model.solve({chain['name']: 2 for chain in model.chains})
+    assert list(doubled['pathway']) == list(reference['pathway'])
+    assert np.allclose(doubled['value'], 2 * reference['value'])
+
+    name = model.chains[0]['name']
+    single = model.solve({name: 3})
+    assert np.allclose(single[single['pathway'] == name]['value'], 3 * reference[reference['pathway'] == name]['value'])
+    assert np.allclose(model.totals().sum(), reference['value'].sum())
+
+    with pytest.raises(ValueError):
+        model.solve({'unknown': 1})
+
+def test_lca_indicators():
+    pathways = _pathways()
+    data = lca.run(pathways, indicators=['GWP', 'AP'])
+    assert data['params'] == {'indicators': ['GWP', 'AP']}
+    assert set(data['data']['indicator']) <= {'GWP', 'AP'}
+
+    gwp = data['data'][data['data']['indicator'] == 'GWP'].drop(columns=['indicator'])
+    pd.testing.assert_frame_equal(gwp, lca.run(pathways)['data'])
+
+def test_lca_sink(tmp_path):
+    pathways = _pathways()
+    expected = lca.run(pathways)
+
+    path = str(tmp_path / 'results.csv')
+    results = lca.run((pathway for pathway in pathways), sink=CSVSink(path))
+    assert results['data'] == path
+    assert results['unit'] == expected['unit']
+
+    data = pd.read_csv(path)
+    assert list(data.columns) == expected['columns']
+    assert np.allclose(data['value'], expected['data']['value'])
+
+def test_monte_carlo(monkeypatch):
+    pathway = Pathway.build([
+        'enduse-electricity-default',
+        'gatetoenduse-transmission-literaturereview',
+        'process-windpowerproduction-default',
+        'upstream-wind-default',
+    ])
+
+    analysis = pathway.uncertainty_analysis(samples=50, seed=1)
+    assert analysis.runnable
+
+    # one sample per stratum of each input
+    rows = analysis.sample()
+    for idx, (_, _, low, high, numeric) in enumerate(analysis.parameters):
+        if numeric:
+            strata = sorted(int((row[idx] - low) / (high - low) * 50) for row in rows)
+            assert strata == list(range(50))
+
+    results = analysis.run(workers=1)
+    data = results['data']
+    assert list(data.columns) == results['columns']
+    assert data['stage'].iloc[-1] == 'Total'
+    assert (data['p5'] <= data['p50']).all() and (data['p50'] <= data['p95']).all()
+    assert results['params']['failed_samples'] == 0
+    assert results['errors'] == []
+
+    # failed samples are counted, and too many of them raise
+    calls = []
+    def stage_impacts(results, indicator='GWP'):
+        calls.append(indicator)
+        # every 5th sample, after the base results
+        if len(calls) % 5 == 1 and len(calls) > 1:
+            raise ValueError('unsupported')
+        return {'Process': 1.0}
+
+    monkeypatch.setattr(uncertainty, 'stage_impacts', stage_impacts)
+    with pytest.raises(RuntimeError, match='10 of 50 samples failed, e.g. ValueError: unsupported'):
+        analysis.run(workers=1)
+
+    calls.clear()
+    analysis.max_failures = 0.5
+    results = analysis.run(workers=1)
+    assert results['params']['failed_samples'] == 10
+    assert results['errors'] == [{'error': 'ValueError: unsupported', 'samples': 10}]
+    assert results['data']['mean'].tolist() == [1.0, 1.0]
@@ -2,6 +2,7 @@ import app
 import json
 import pathway.topology as pathway_topology
 import pytest
+import time
 from core.inputs import InputSet
 
 @pytest.fixture
@@ -19,6 +20,31 @@ def test_pathway_metadata(client):
     body = json.loads(res.data)
     assert len(body['stages']) == 6
 
+def test_metadata_etag(client):
+    res = client.get('/pathway/metadata')
+    etag = res.headers['ETag']
+    assert etag == f'"{json.loads(res.data)["hash"]}"'
+
+    res = client.get('/pathway/metadata', headers={'If-None-Match': etag})
+    assert res.status_code == 304
+    assert res.data == b''
+
+    res = client.get('/pathway/metadata', headers={'If-None-Match': '"outdated"'})
+    assert res.status_code == 200
+    assert res.headers['ETag'] == etag
+
+def test_metadata_data_version(client):
+    import analysis.system.power_historic as power_historic
+    res = client.get('/power_historic/metadata')
+    etag = res.headers['ETag']
+
+    # the ARP data was refreshed
+    power_historic._data_version.set('arp', -1)
+    res = client.get('/power_historic/metadata', headers={'If-None-Match': etag})
+    assert res.status_code == 200
+    assert res.headers['ETag'] != etag
+    power_historic._data_version.clear()
+
 def test_pathway_input_options(client):
     source = pathway_topology.ng_power_production.sources[1] # ASPEN
     res = client.get(f'/pathway/sources/{source.id}/user_inputs/turbine')
@@ -165,6 +191,27 @@ def test_grid_analysis(client):
     )
     assert res.status_code == 200
 
+def test_grid_analysis_async(client):
+    input_set = InputSet.build_default(Grid)
+    res = client.post(
+        '/grid/analysis?async=true',
+        data=json.dumps(input_set.values),
+        content_type='application/json',
+    )
+    assert res.status_code == 202
+    job_id = res.json['id']
+    assert res.headers['Location'].endswith(f'/jobs/{job_id}')
+
+    while res.json['status'] not in ('done', 'failed'):
+        time.sleep(0.1)
+        res = client.get(f'/jobs/{job_id}')
+        assert res.status_code == 200
+    assert res.json['status'] == 'done'
+    assert 'figures' in res.json['result']
+
+    res = client.get('/jobs/unknown')
+    assert res.status_code == 404
+
 # industry cement
 
 from analysis.system.industry.cement.cement import Cement
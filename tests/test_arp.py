@@ -0,0 +1,180 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy
+
+import core.db as db
+from analysis.system.power_historic import aggregates, arp
+from tests.helper import schema_statements
+
+HEADER = 'STATE,FACILITY_NAME,ORISPL_CODE,UNITID,OP_DATE,OP_HOUR,OP_TIME,GLOAD (MW),SO2_MASS (lbs),NOX_MASS (lbs),CO2_MASS (tons),HEAT_INPUT (mmBtu)'
+
+
+def write_csv(path, rows):
+    with open(path, 'w') as f:
+        f.write(HEADER + '\n')
+        for row in rows:
+            f.write(','.join(str(value) for value in row) + '\n')
+    return path
+
+
+@pytest.fixture
+def connection():
+    """
+    Connection to the local database (`DB_URL`), in a schema of its own
+    with the tables used by the import, dropped afterwards.
+    """
+    try:
+        connection = db.engine.raw_connection()
+    except sqlalchemy.exc.OperationalError:
+        pytest.skip('database not available')
+
+    schema = f'test_arp_{os.getpid()}'
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE SCHEMA {schema}')
+        cursor.execute(f'SET search_path TO {schema}')
+        for statement in schema_statements(
+            'utilities', 'balancing_authorities', 'plants', 'arp', 'arp_ingestion_log', 'data_versions',
+            'grid_unit_genmap', 'loading_fraction', 'arp_egrid_capacity', 'arp_bucket', 'arp_generation',
+        ):
+            cursor.execute(statement)
+        cursor.execute('''
+            INSERT INTO grid_unit_genmap (state, orispl, unit, gen_prime_mover, gen_fuel, capacity_mw, plant_id)
+            VALUES ('AL', 3, '1', 'CT', 'NG', 100, 1);
+
+            INSERT INTO loading_fraction VALUES
+                ('CT', 0.2, 'start or stop', 'combined cycle'),
+                ('CT', 0.75, 'partial', 'combined cycle'),
+                ('CT', 0.9, 'full', 'combined cycle'),
+                ('CT', 1, 'full', 'combined cycle');
+
+            INSERT INTO utilities (utlsrvid) VALUES ('195');
+            INSERT INTO plants (utility_id, orispl, state, name, nerc_region) VALUES
+                ((SELECT id FROM utilities), '3', 'AL', 'Plant 3', 'SERC'),
+                ((SELECT id FROM utilities), '10', 'AL', 'Plant 10', 'SERC');
+        ''')
+    connection.commit()
+
+    yield connection
+
+    connection.rollback()
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP SCHEMA {schema} CASCADE')
+        cursor.execute('RESET search_path')
+    connection.commit()
+    connection.close()
+
+
+def test_read_csv(tmp_path):
+    path = write_csv(tmp_path / 'arp.csv', [
+        ('AL', 'Barry', 3, 1, '01-01-2020', 0, 1, 100.5, 1, 2, 3, 4),
+        ('AL', 'Barry', 3, 'CT1', '01-01-2020', 23, 1, '', 1, 2, 3, 4),
+        ('AL', 'Barry', 3, 1, '01-01-2020', 0, 1, 120, 1, 2, 3, 4),
+    ])
+    df = arp.read_csv(path)
+    assert list(df.columns) == arp.COLUMNS
+    assert list(df['orispl']) == ['3', '3']
+    assert list(df['unit']) == ['CT1', '1']
+    assert list(df['timestamp']) == [pd.Timestamp('2020-01-01 23:00'), pd.Timestamp('2020-01-01 00:00')]
+    # the last of the duplicate rows is kept
+    assert np.isnan(df['gload'].iloc[0])
+    assert df['gload'].iloc[1] == 120
+    assert df['heat_input'].dtype == np.float64
+
+
+def test_upsert(tmp_path, connection):
+    df = arp.read_csv(write_csv(tmp_path / 'arp.csv', [
+        ('AL', 'Barry', 3, 1, '01-01-2020', 0, 1, 100, 1, 2, 3, 4),
+        ('AL', 'Barry', 3, 1, '01-01-2020', 1, 1, '', 1, 2, 3, 4),
+        ('AL', 'Gadsden', 10, 'CT1', '01-01-2020', 0, 1, 50, 1, 2, 3, 4),
+        ('AL', 'Unknown', 99, 1, '01-01-2020', 0, 1, 10, 1, 2, 3, 4),
+    ]))
+    assert arp.upsert(df, connection) == (3, ['99'])
+
+    # existing rows are updated
+    df = arp.read_csv(write_csv(tmp_path / 'arp.csv', [
+        ('AL', 'Barry', 3, 1, '01-01-2020', 0, 1, 110, 1, 2, 3, 4),
+        ('AL', 'Barry', 3, 1, '01-01-2020', 2, 1, 90, 1, 2, 3, 4),
+    ]))
+    assert arp.upsert(df, connection) == (2, [])
+
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            SELECT plants.orispl, arp.unit, date_part('hour', arp.timestamp), arp.gload
+            FROM arp INNER JOIN plants ON plants.id = arp.plant_id
+            ORDER BY 1, 2, 3
+        ''')
+        assert cursor.fetchall() == [
+            ('10', 'CT1', 0, 50),
+            ('3', '1', 0, 110),
+            ('3', '1', 1, None),
+            ('3', '1', 2, 90),
+        ]
+
+
+def test_import_csv(tmp_path, connection):
+    write_csv(tmp_path / '2020al01.csv', [
+        ('AL', 'Barry', 3, 1, '01-01-2020', 0, 1, 100, 1, 2, 3, 4),
+        ('AL', 'Unknown', 99, 1, '01-01-2020', 0, 1, 10, 1, 2, 3, 4),
+    ])
+    stats = arp.import_csv(2020, 1, 'al', data_dir=tmp_path, connection=connection)
+    assert stats['rows'] == 1
+    assert stats['skipped'] == 1
+    assert stats['missing_plants'] == ['99']
+
+    (tmp_path / '2020al02.csv').write_text('invalid')
+    with pytest.raises(ValueError):
+        arp.import_csv(2020, 2, 'al', data_dir=tmp_path, connection=connection)
+    with pytest.raises(FileNotFoundError):
+        arp.import_csv(2020, 3, 'al', data_dir=tmp_path, connection=connection)
+
+    # only the imported file is skipped by the next imports
+    assert arp.completed(connection) == {(2020, 1, 'al')}
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT month, status, rows, skipped, error IS NULL FROM arp_ingestion_log ORDER BY month')
+        assert cursor.fetchall() == [(1, 'done', 1, 1, True), (2, 'failed', None, None, False)]
+
+
+def test_refresh(tmp_path, connection):
+    write_csv(tmp_path / '2020al01.csv', [
+        ('AL', 'Barry', 3, 1, '01-01-2020', 0, 1, 10, 1, 2, 3, 4),
+        ('AL', 'Barry', 3, 1, '01-01-2020', 1, 1, 50, 1, 2, 3, 4),
+        ('AL', 'Barry', 3, 1, '01-01-2020', 2, 1, 95, 1, 2, 3, 4),
+    ])
+    arp.import_csv(2020, 1, 'al', data_dir=tmp_path, connection=connection)
+    assert aggregates.pending(connection) == [(2020, 'AL')]
+
+    aggregates.refresh_partition(connection, 2020, 'AL')
+    assert aggregates.pending(connection) == []
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT version FROM data_versions WHERE name = 'arp'")
+        assert cursor.fetchall() == [(1,)]
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT year, unit, generation, max_generation, nameplate_capacity FROM arp_egrid_capacity')
+        assert cursor.fetchall() == [(2020, '1', 155, 95, 100)]
+
+        cursor.execute('SELECT year, hour, generation, total_capacity, state, status FROM arp_generation ORDER BY hour')
+        assert cursor.fetchall() == [
+            (2020, 0, 10, 100, 'AL', 'start or stop'),
+            (2020, 1, 50, 100, 'AL', 'partial'),
+            (2020, 2, 95, 100, 'AL', 'full'),
+        ]
+
+    # imported again: the partition is recomputed on the next refresh
+    write_csv(tmp_path / '2020al01.csv', [
+        ('AL', 'Barry', 3, 1, '01-01-2020', 0, 1, 120, 1, 2, 3, 4),
+    ])
+    arp.import_csv(2020, 1, 'al', data_dir=tmp_path, connection=connection)
+    assert aggregates.pending(connection) == [(2020, 'AL')]
+
+    aggregates.refresh_partition(connection, 2020, 'AL')
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT hour, generation, total_capacity, status FROM arp_generation ORDER BY hour')
+        assert cursor.fetchall() == [
+            (0, 120, 120, 'full'),
+            (1, 50, 120, 'partial'),
+            (2, 95, 120, 'full'),
+        ]
@@ -0,0 +1,56 @@
+import time
+
+from core import cache
+
+
+def test_lru_cache():
+    lru = cache.LRUCache(maxsize=2)
+    lru.set('a', 1)
+    lru.set('b', 2)
+    assert lru.get('a') == 1
+    lru.set('c', 3)
+
+    # 'b' was the least recently used entry
+    assert lru.get('b') is cache.MISSING
+    assert lru.get('c') == 3
+    assert lru.stats() == {'hits': 2, 'misses': 1, 'evictions': 1, 'expirations': 0, 'size': 2}
+
+
+def test_lru_cache_ttl():
+    lru = cache.LRUCache(maxsize=2, ttl=0.01)
+    lru.set('a', 1)
+    assert lru.get('a') == 1
+    time.sleep(0.02)
+    assert lru.get('a', None) is None
+    assert lru.stats()['expirations'] == 1
+
+
+def test_sqlite_cache(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    shared = cache.SQLiteCache(path, maxsize=2)
+    shared.set('a', {'value': 1})
+
+    # visible to other instances (e.g. other processes)
+    other = cache.SQLiteCache(path)
+    assert other.get('a') == {'value': 1}
+    assert other.get('b') is cache.MISSING
+
+    shared.set('b', 2)
+    shared.set('c', 3)
+    shared.prune()
+    assert shared.get('a') is cache.MISSING
+    assert shared.stats()['evictions'] == 1
+
+    tiered = cache.TieredCache(maxsize=1, shared=other)
+    assert tiered.get('c') == 3
+    assert tiered.stats()['memory']['size'] == 1
+
+
+def test_tiered_cache_clear(tmp_path):
+    for tiered in [
+        cache.TieredCache(path=str(tmp_path / 'disk')),
+        cache.TieredCache(shared=cache.SQLiteCache(str(tmp_path / 'cache.sqlite'))),
+    ]:
+        tiered.set('a', 1)
+        tiered.clear()
+        assert tiered.get('a') is cache.MISSING
@@ -0,0 +1,49 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from core import catalog
+
+
+def test_read_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = str(tmp_path / 'data.csv')
+    pd.DataFrame({
+        'year': [2020, 2021, 2022],
+        'name': ['a', None, 'c'],
+        'kind': ['x', 'y', 'x'],
+        'value': [1.5, np.nan, 3.0],
+        'flag': [True, False, True],
+    }).to_csv(path, index=False)
+
+    for kwargs in [{}, {'index_col': 'year'}, {'index_col': ['year', 'name']}]:
+        expected = pd.read_csv(path, **kwargs)
+        # the first read stores the entry, the second loads it
+        pd.testing.assert_frame_equal(catalog.read_csv(path, **kwargs), expected)
+        df = catalog.read_csv(path, **kwargs)
+        pd.testing.assert_frame_equal(df, expected)
+
+        # loaded frames can be modified without changing the cache
+        df.iloc[0, -1] = False
+        pd.testing.assert_frame_equal(catalog.read_csv(path, **kwargs), expected)
+
+    entries = [name for _, _, names in os.walk(catalog.CACHE_DIR) for name in names if name.endswith('.json')]
+    assert len(entries) == 3
+
+
+def test_read_csv_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = str(tmp_path / 'data.csv')
+
+    pd.DataFrame({'value': [1, 2]}).to_csv(path, index=False)
+    assert catalog.read_csv(path)['value'].tolist() == [1, 2]
+
+    pd.DataFrame({'value': [3, 4, 5]}).to_csv(path, index=False)
+    assert catalog.read_csv(path)['value'].tolist() == [3, 4, 5]
+
+
+
+def test_cache_dir():
+    # not relative to the working directory
+    assert catalog.CACHE_DIR == '' or os.path.isabs(catalog.CACHE_DIR)
@@ -0,0 +1,35 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from core.analysis import AnalysisResult
+from core.common import JSONEncoder
+
+
+def test_json_encoder():
+    df = pd.DataFrame({
+        'float': [1.5, np.nan, np.inf, -np.inf],
+        'int': [1, 2, 3, 4],
+    })
+    # NaN and inf are null, -inf is kept
+    assert json.dumps(df, cls=JSONEncoder) == '[[1.5, 1.0], [null, 2.0], [null, 3.0], [-Infinity, 4.0]]'
+    assert json.dumps(df['float'], cls=JSONEncoder) == '[1.5, null, null, -Infinity]'
+    assert json.dumps(df['int'], cls=JSONEncoder) == '[1, 2, 3, 4]'
+    assert json.dumps(df['float'].to_numpy(), cls=JSONEncoder) == '[1.5, null, null, -Infinity]'
+
+    df['name'] = ['a', None, 'c', 'd']
+    assert json.dumps(df, cls=JSONEncoder) == (
+        '[[1.5, 1, "a"], [null, 2, null], [null, 3, "c"], [-Infinity, 4, "d"]]'
+    )
+
+    mixed = pd.Series([1, 2.5, np.nan, np.int64(3), np.float64(np.inf), None, True], dtype=object)
+    assert json.dumps(mixed, cls=JSONEncoder) == '[1, 2.5, null, 3, null, null, true]'
+
+
+def test_analysis_result_serialize():
+    res = AnalysisResult(columns=['stage', 'value'], data=pd.DataFrame({
+        'stage': ['Enduse', 'Process'],
+        'value': [1.5, 2.0],
+    }))
+    assert res.serialize()['data'] == [['Enduse', 1.5], ['Process', 2.0]]
@@ -0,0 +1,86 @@
+import os
+
+import pandas as pd
+import pytest
+import sqlalchemy
+
+import core.db as db
+from analysis.system.power_historic import egrid
+from tests.helper import schema_statements
+
+COLUMNS = [
+    'YEAR', 'UTLSRVID', 'UTLSRVNM', 'BACODE', 'BANAME', 'ORISPL', 'PSTATABB', 'PNAME', 'NERC', 'SUBRGN',
+    'SRNAME', 'ISORTO', 'CNTYNAME', 'LAT', 'LON', 'NUMUNT', 'PLPRMFL', 'NAMEPCAP',
+] + list(egrid.EGRID_COLUMNS)
+
+
+def sheet(*rows):
+    return pd.DataFrame([
+        [year, utlsrvid, f'Utility {utlsrvid}', bacode, bacode and f'BA {bacode}', orispl, 'AL', f'Plant {orispl}',
+         'SERC', 'SRSO', 'SERC South', None, 'Mobile', 31.0, -88.0, 2, 'NG', capacity] + [rate] * len(egrid.EGRID_COLUMNS)
+        for year, utlsrvid, bacode, orispl, capacity, rate in rows
+    ], columns=COLUMNS)
+
+
+@pytest.fixture
+def connection():
+    """
+    Connection to the local database (`DB_URL`), in a schema of its own
+    with the tables used by the import, dropped afterwards.
+    """
+    try:
+        connection = db.engine.raw_connection()
+    except sqlalchemy.exc.OperationalError:
+        pytest.skip('database not available')
+
+    schema = f'test_egrid_{os.getpid()}'
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE SCHEMA {schema}')
+        cursor.execute(f'SET search_path TO {schema}')
+        # the unique indexes are the conflict targets of the import
+        for statement in schema_statements('utilities', 'balancing_authorities', 'plants', 'egrid'):
+            cursor.execute(statement)
+    connection.commit()
+
+    yield connection
+
+    connection.rollback()
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP SCHEMA {schema} CASCADE')
+        cursor.execute('RESET search_path')
+    connection.commit()
+    connection.close()
+
+
+def test_import_frame(connection):
+    counts = egrid.import_frame(sheet(
+        (2018, 195, 'SOCO', 3, 2000.5, 1.0),
+        (2018, 195, None, 10, None, None),
+        # the first row of a plant is imported
+        (2018, 7, 'SOCO', 3, 1.0, 2.0),
+    ), connection)
+    assert counts == {'utilities': 2, 'balancing_authorities': 1, 'plants': 2, 'egrid': 2}
+
+    # the plants imported already are kept, their rates are added for other years
+    counts = egrid.import_frame(sheet(
+        (2016, 195, 'SOCO', 3, 1800.0, 3.0),
+        (2016, 8, 'MISO', 4, 10.0, 4.0),
+    ), connection)
+    assert counts == {'utilities': 1, 'balancing_authorities': 1, 'plants': 1, 'egrid': 2}
+
+    with connection.cursor() as cursor:
+        cursor.execute('''
+            SELECT plants.orispl, utilities.utlsrvid, balancing_authorities.code, plants.nameplate_capacity
+            FROM plants
+            INNER JOIN utilities ON utilities.id = plants.utility_id
+            LEFT JOIN balancing_authorities ON balancing_authorities.id = plants.balancing_authority_id
+            ORDER BY plants.orispl
+        ''')
+        assert cursor.fetchall() == [('10', '195', None, None), ('3', '195', 'SOCO', 2000.5), ('4', '8', 'MISO', 10.0)]
+
+        cursor.execute('''
+            SELECT egrid.year, plants.orispl, egrid.annual_co2_rate
+            FROM egrid INNER JOIN plants ON plants.id = egrid.plant_id
+            ORDER BY 1, 2
+        ''')
+        assert cursor.fetchall() == [(2016, '3', 3.0), (2016, '4', 4.0), (2018, '10', None), (2018, '3', 1.0)]
@@ -0,0 +1,101 @@
+import pytest
+
+from core import conditionals
+from core.common import InputSource, Versioned
+from core.inputs import ContinuousInput, Default, InputSet, OptionsInput, copy_inputs
+
+
+class Source:
+
+    @classmethod
+    def inputs(cls):
+        return [
+            OptionsInput('fuel', 'Fuel', options=['Coal', 'Gas'], defaults=[Default('Coal')]),
+            OptionsInput(
+                'ccs', 'CCS', options=['Yes', 'No'],
+                defaults=[Default('Yes')],
+                conditionals=[conditionals.input_equal_to('fuel', 'Coal')],
+            ),
+            ContinuousInput(
+                'capture_rate', 'Capture rate',
+                defaults=[
+                    Default(90, conditionals=[conditionals.input_equal_to('fuel', 'Coal')]),
+                    Default(85, conditionals=[conditionals.input_equal_to('fuel', 'Gas')]),
+                ],
+                conditionals=[conditionals.input_equal_to('ccs', 'Yes')],
+            ),
+            ContinuousInput(
+                'price', 'Price',
+                defaults=[Default(3)],
+                conditionals=[conditionals.context_equal_to('compute_cost', True)],
+            ),
+        ]
+
+
+class CachedSource(InputSource, Versioned):
+    builds = 0
+
+    @classmethod
+    def user_inputs(cls):
+        cls.builds += 1
+        return Source.inputs()
+
+
+def test_dependencies():
+    input_set = InputSet.build_default(Source)
+    assert input_set.input('capture_rate').input_dependencies() == {'ccs', 'fuel'}
+    assert input_set.input('price').input_dependencies() == set()
+
+
+def test_relevance_invalidation():
+    input_set = InputSet.build_default(Source)
+    assert 'capture_rate' in input_set
+    assert input_set.default_value('capture_rate') == 90
+
+    # `capture_rate` depends on `fuel` through `ccs`
+    input_set.set_value('fuel', 'Gas')
+    assert 'ccs' not in input_set
+    assert 'capture_rate' not in input_set
+    assert input_set.default_value('capture_rate') == 85
+
+    input_set.set_value('fuel', 'Coal')
+    assert 'capture_rate' in input_set
+
+    input_set.build(['Coal', 'No'])
+    assert 'capture_rate' not in input_set
+
+
+def test_context_invalidation():
+    input_set = InputSet.build_default(Source)
+    assert 'price' not in input_set
+
+    input_set.context = {'compute_cost': True}
+    assert 'price' in input_set
+
+
+def test_schema():
+    inputs = CachedSource.inputs()
+    assert CachedSource.inputs() is inputs
+    assert CachedSource.builds == 1
+
+    # shared inputs can't be modified
+    with pytest.raises(TypeError):
+        inputs[1].conditionals.append(conditionals.input_equal_to('fuel', 'Gas'))
+    with pytest.raises(TypeError):
+        inputs[0].name = 'other'
+    with pytest.raises(TypeError):
+        inputs[2].defaults[0].conditionals[0].args = ('ccs', 'No')
+
+    # but copies can
+    inputs_copy = copy_inputs(inputs)
+    inputs_copy[1].conditionals.append(conditionals.input_equal_to('fuel', 'Gas'))
+    inputs_copy[0].name = 'other'
+    assert inputs_copy[1].input_dependencies() == {'fuel'}
+    assert len(inputs[1].conditionals) == 1
+    assert inputs[0].name == 'fuel'
+
+
+def test_resolved_values():
+    input_set = InputSet(Source.inputs(), values={'fuel': 'Gas'})
+    assert input_set.values == {'fuel': 'Gas'}
+    assert input_set.resolved_values() == {'fuel': 'Gas', 'ccs': 'Yes', 'capture_rate': 85, 'price': 3}
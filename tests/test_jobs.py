@@ -0,0 +1,98 @@
+import time
+
+from core import cache
+from core.jobs import JobQueue
+
+
+def add(a, b):
+    return a + b
+
+
+def wait(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def fail():
+    raise ValueError('invalid')
+
+
+def result(queue, job_id, timeout=30):
+    start = time.time()
+    while time.time() - start < timeout:
+        job = queue.status(job_id)
+        if job['status'] in ('done', 'failed'):
+            return job
+        time.sleep(0.01)
+    raise TimeoutError(job_id)
+
+
+def test_job_queue():
+    queue = JobQueue(workers=1)
+    try:
+        slow = queue.submit(wait, 0.5)
+        while queue.status(slow)['status'] == 'queued':
+            time.sleep(0.01)
+        job_id = queue.submit(add, 1, 2)
+
+        # one job at a time: the second waits for the first
+        job = queue.status(job_id)
+        assert job['status'] == 'queued'
+        assert job['position'] == 0
+
+        # identical jobs are run once
+        assert queue.submit(add, 1, 2) == job_id
+        assert queue.submit(add, 2, 2) != job_id
+
+        job = result(queue, job_id)
+        assert job['status'] == 'done'
+        assert job['result'] == 3
+        assert job['submitted'] <= job['started'] <= job['finished']
+        assert result(queue, slow)['result'] == 0.5
+        assert queue.submit(add, 1, 2) == job_id
+
+        job = result(queue, queue.submit(fail))
+        assert job['status'] == 'failed'
+        assert job['error'] == 'ValueError: invalid'
+
+        assert queue.status('unknown') is None
+    finally:
+        queue.shutdown()
+
+
+def test_job_queue_shared(tmp_path):
+    path = str(tmp_path / 'jobs.sqlite')
+    queue = JobQueue(workers=1, store=cache.SQLiteCache(path))
+    try:
+        job_id = queue.submit(add, 1, 2)
+        result(queue, job_id)
+    finally:
+        queue.shutdown()
+
+    # e.g. another API worker on the same host
+    other = JobQueue(workers=1, store=cache.SQLiteCache(path))
+    assert other.status(job_id)['result'] == 3
+    assert other.submit(add, 1, 2) == job_id
+
+
+def test_job_queue_evicted():
+    # the store keeps the last job only
+    queue = JobQueue(workers=1, store=cache.LRUCache(maxsize=1))
+    try:
+        slow = queue.submit(wait, 0.5)
+        while queue.status(slow)['status'] == 'queued':
+            time.sleep(0.01)
+        queued = queue.submit(add, 1, 2)
+        last = queue.submit(add, 2, 2)
+
+        # the jobs are known until they finish
+        assert queue.status(slow)['status'] == 'running'
+        assert queue.status(queued)['status'] == 'queued'
+        assert queue.status(queued)['position'] == 0
+        assert result(queue, last)['result'] == 4
+
+        # then only as long as the store keeps them
+        assert queue.status(slow) is None
+        assert queue.status(queued) is None
+    finally:
+        queue.shutdown()
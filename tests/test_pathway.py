@@ -1,4 +1,16 @@
-from core.pathway import Pathway
+import json
+import os
+import warnings
+
+from pandas.api.types import is_numeric_dtype
+import pytest
+
+from analysis.sensitivity import GlobalSensitivityAnalysis
+import analysis.sensitivity as sensitivity
+from core import cache
+from core.inputs import InputSet
+from core.pathway import ActivitySource, Pathway, Source, Step, pathway_key, results_cache
+from core.utils import LazyData
 import pathway.topology
 
 # from tests.helper import random_pathway
@@ -12,6 +24,9 @@ context = {
     'compute_cost': True,
 }
 
+class LazySource(ActivitySource):
+    pass
+
 def test_solar_pathway():
     pathway = Pathway.build([
         'enduse-electricity-default',
@@ -81,3 +96,254 @@ def test_h2_pathway():
 
     results = pathway.perform()
     assert results is not None
+
+def test_perform_many():
+    def build():
+        return [
+            Pathway.build([
+                'enduse-electricity-default',
+                'gatetoenduse-transmission-literaturereview',
+                process,
+                upstream,
+            ], context=context)
+            for process, upstream in [
+                ('process-solarpowerproduction-default', 'upstream-solar-default'),
+                ('process-ngpowerproduction-aspen', 'upstream-naturalgas-greet'),
+                ('process-windpowerproduction-default', 'upstream-wind-default'),
+            ]
+        ]
+
+    serial = [pathway.perform() for pathway in build()]
+    parallel = Pathway.perform_many(build(), workers=2, chunk_size=1)
+    assert parallel == serial
+
+def test_step_load():
+    step = Step.build('process-solarpowerproduction-default', context=context)
+    values = [step.input_set.value(name) for name in step.input_set.values]
+
+    # the serialized context applies to both styles of input values
+    for user_inputs in [dict(step.input_set.values), values]:
+        serialized = {'source_id': step.source.id, 'user_inputs': user_inputs, 'context': context}
+        loaded = Step.load(serialized, context={'compute_cost': False})
+        assert loaded.input_set.context == context
+        assert loaded.input_set.values == step.input_set.values
+
+def test_perform_cached():
+    def build(loss):
+        return Pathway.build([
+            'enduse-electricity-default',
+            ('gatetoenduse-transmission-literaturereview', {'loss': loss}),
+            'process-windpowerproduction-default',
+            'upstream-wind-default',
+        ], context=context)
+
+    results_cache.clear()
+    stats = results_cache.memory.stats()
+
+    results = build(5.5).perform()
+    assert results_cache.memory.stats()['misses'] == stats['misses'] + 1
+
+    pathway = build(5.5)
+    assert pathway.perform() == results
+    assert results_cache.memory.stats()['hits'] == stats['hits'] + 1
+
+    # step instances are still available after a cache hit
+    assert pathway.instance('gatetoenduse').loss == 5.5
+
+    assert build(6.5).perform() != results
+
+    # keyed on the default values too, not only those set
+    step = Step.build('gatetoenduse-transmission-literaturereview', context=context)
+    unset = Step(step.source, InputSet(step.source.inputs(), context=context))
+    assert unset.input_set.values == {}
+    assert pathway_key(Pathway([unset], name='unset')) == pathway_key(Pathway([step], name='set'))
+
+def test_perform_incremental():
+    items = [
+        'enduse-electricity-default',
+        'gatetoenduse-transmission-literaturereview',
+        'process-coalpowerproduction-greet',
+        'midstream-coaltransportation-greet',
+        'upstream-coal-greet',
+    ]
+
+    pathway = Pathway.build(items, context=context)
+    pathway.perform(cached=False)
+    process = pathway.instance('process')
+
+    pathway.steps[3].input_set.set_value('distance', 300)
+    results = pathway.perform(cached=False)
+
+    # steps before the changed step are reused
+    assert pathway.instance('gatetoenduse') is not None
+    assert pathway.instance('process') is process
+
+    expected = Pathway.build(items[:3] + [
+        ('midstream-coaltransportation-greet', {'distance': 300}),
+        items[4],
+    ], context=context).perform(cached=False)
+    assert results == expected
+
+def test_perform_incremental_modified_flows():
+    # the upstream stage removes the multiplier passed by the process stage
+    # from the flow it receives when serialized
+    items = [
+        'enduse-electricity-default',
+        'gatetoenduse-transmission-literaturereview',
+        'process-windpowerproduction-default',
+        'tea-windtea-default',
+        'upstream-wind-default',
+    ]
+
+    pathway = Pathway.build(items, context=context)
+    pathway.perform(cached=False)
+    pathway.steps[3].input_set.set_value('tax_rate', 30)
+    results = pathway.perform(cached=False)
+
+    expected = Pathway.build(items[:3] + [
+        ('tea-windtea-default', {'tax_rate': 30}),
+        items[4],
+    ], context=context).perform(cached=False)
+    assert results == expected
+    assert '__multiplier' not in results['TEA']['flow_inputs']['primary']
+
+def test_perform_baseline():
+    # results of these pathways before incremental performs were introduced
+    # (tests/data/baseline_results.json, keyed by the source IDs)
+    with open(os.path.join(os.path.dirname(__file__), 'data', 'baseline_results.json')) as f:
+        baseline = json.load(f)
+
+    for name, expected in baseline.items():
+        pathway = Pathway.build(name.split(' > '), context=context)
+        assert json.loads(json.dumps(pathway.perform(cached=False))) == expected, name
+
+def test_filtered_data_frame():
+    pathway = Pathway.build([
+        'enduse-electricity-default',
+        'gatetoenduse-transmission-literaturereview',
+        'process-ngpowerproduction-greet',
+        'upstream-naturalgas-greet',
+    ], context=context)
+    pathway.perform(cached=False)
+
+    for step in pathway.steps:
+        obj = pathway.instance(step.stage.id)
+        if obj.lookup_table is None:
+            continue
+
+        df = obj.data_frame()
+        # the shared data, but not the shared frame
+        assert obj.data_frame() is not df
+        assert obj.data_frame().equals(df)
+
+        expected = df
+        for input_name, input in obj.input_set.inputs.items():
+            value = obj.input_set.value(input_name, default=False)
+            if value is not None and input.input_type == 'categorical':
+                if is_numeric_dtype(expected[input.label].dtype):
+                    value = float(value)
+                expected = expected[expected[input.label] == value]
+
+        filtered = obj.filtered_data_frame()
+        assert filtered.index.equals(expected.index)
+        assert filtered.equals(expected)
+
+def test_sensitivity_analysis(monkeypatch):
+    pathway = Pathway.build([
+        'enduse-electricity-default',
+        'gatetoenduse-transmission-literaturereview',
+        'process-windpowerproduction-default',
+        'upstream-wind-default',
+    ], context=context)
+    input_sets = [step.input_set for step in pathway.steps]
+
+    analysis = pathway.sensitivity_analysis()
+    results = analysis.serialize()
+
+    # runs are performed on copies of the pathway
+    assert [step.input_set for step in pathway.steps] == input_sets
+
+    source = pathway.steps[2].source
+    for item in results['inputs']:
+        if item['name'] == 'lifetime':
+            assert item['min_value'] == analysis.run(source, 'lifetime', item['minimizing_value'])
+            assert item['max_value'] == analysis.run(source, 'lifetime', item['maximizing_value'])
+
+    # same results when run on a pool of processes
+    monkeypatch.setattr(sensitivity, 'workers', 2)
+    monkeypatch.setattr(sensitivity, '_cache', cache.TieredCache())
+    assert pathway.sensitivity_analysis().serialize() == results
+
+
+def test_global_sensitivity_analysis(monkeypatch):
+    pathway = Pathway.build([
+        'enduse-electricity-default',
+        'gatetoenduse-transmission-literaturereview',
+        'process-windpowerproduction-default',
+        'upstream-wind-default',
+    ], context=context)
+    input_sets = [step.input_set for step in pathway.steps]
+
+    results_cache.clear()
+    morris = pathway.global_sensitivity_analysis(method='morris', trajectories=4, seed=1).serialize()
+    k = len(morris['inputs'])
+    assert k > 0
+    assert morris['evaluations'] == 4 * (k + 1)
+    assert morris['failures'] == 0
+    # the evaluations don't fill the results cache
+    assert results_cache.stats()['memory']['size'] == 1
+    assert all(item['mu_star'] >= abs(item['mu']) - 1e-9 for item in morris['inputs'])
+
+    sobol = pathway.global_sensitivity_analysis(method='sobol', samples=16, seed=1).serialize()
+    assert sobol['evaluations'] == 16 * (k + 2)
+    assert all(item['ST'] >= 0 for item in sobol['inputs'])
+
+    # the wind speed dominates the emissions of wind power
+    ranking = sorted(sobol['inputs'], key=lambda item: item['ST'], reverse=True)
+    assert 'wind_speed' in [item['name'] for item in ranking[:2]]
+
+    # evaluations are performed on copies of the pathway
+    assert [step.input_set for step in pathway.steps] == input_sets
+
+    # same results when run on a pool of processes
+    monkeypatch.setattr(sensitivity, 'workers', 2)
+    assert pathway.global_sensitivity_analysis(method='sobol', samples=16, seed=1).serialize() == sobol
+
+    # failed evaluations are counted, and too many of them raise
+    def runner(pathway, input_sets, cached=True):
+        if not cached:
+            raise ValueError('unsupported')
+        return 0
+
+    analysis = GlobalSensitivityAnalysis(pathway, runner, method='morris', trajectories=2, seed=1)
+    with pytest.raises(RuntimeError, match='ValueError: unsupported'):
+        analysis.serialize()
+    analysis.max_failures = 1
+    with warnings.catch_warnings():
+        # no indices without any evaluation
+        warnings.simplefilter('ignore', RuntimeWarning)
+        assert analysis.serialize()['failures'] == 2 * (k + 1)
+
+
+def test_lazy_source():
+    activity = pathway.topology.metadata.stages[0].activities[0]
+    source = Source(activity, 'Lazy', 'tests.test_pathway.LazySource', 'lazy.csv')
+
+    # the class is only imported when first used
+    assert source._cls is None
+    assert source.cls is LazySource
+    assert LazySource.lookup_table == 'lazy.csv'
+
+
+def test_lazy_data():
+    loads = []
+
+    def load():
+        loads.append(1)
+        return len(loads)
+
+    data = LazyData({'table': load})
+    assert loads == []
+    assert data['table'] == 1
+    assert data['table'] == 1
+    assert list(data) == ['table']
@@ -0,0 +1,23 @@
+import gc
+
+from core import registry
+from core.pathway import sources_db
+
+
+def test_preload():
+    try:
+        tables = registry.preload(['pathway.topology', 'analysis.lca'])
+    finally:
+        gc.unfreeze()
+
+    # every source with a lookup table has loaded it
+    for source in sources_db.records:
+        if source.lookup_table is not None:
+            assert f'{source.cls.__module__}.{source.cls.__name__}' in tables
+    assert 'analysis.lca.lciadata' in tables
+    assert any(name.startswith('pathway.process.coal.ccs.DATA[') for name in tables)
+
+    report = registry.report(workers=4)
+    assert len(report['tables']) == len(tables)
+    assert report['total_bytes'] == sum(row['bytes'] for row in report['tables']) > 0
+    assert report['max_shared_bytes'] == 3 * report['total_bytes']
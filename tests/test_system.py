@@ -0,0 +1,70 @@
+from core.inputs import CategoricalInput, InputSet, OptionsInput
+from core.system import SystemAnalysis, normalize, versioned
+
+
+def test_normalize():
+    assert normalize('2020') == normalize(2020.0) == normalize(' 2020 ') == 2020
+    assert normalize('2020.5') == 2020.5
+    assert normalize('CA') == 'CA'
+    assert normalize(None) is None
+    assert normalize(True) is True
+
+
+def test_run_cached():
+    version = 1
+    calls = []
+
+    def query(**params):
+        calls.append(params)
+        return iter([{'state': params['state'], 'version': version}])
+
+    def user_inputs():
+        calls.append('inputs')
+        return [
+            OptionsInput('state', 'State', options=['CA', 'NY']),
+            CategoricalInput('start_year', 'Start year'),
+        ]
+
+    analysis = SystemAnalysis('test_run_cached', query, user_inputs, {}, version=lambda: version)
+
+    def run(state, start_year):
+        input_set = InputSet(analysis.inputs)
+        input_set.build([state, start_year])
+        return analysis.run(input_set)
+
+    assert run('CA', '2020') == [{'state': 'CA', 'version': 1}]
+    assert run('CA', 2020) == [{'state': 'CA', 'version': 1}]
+    assert run('NY', 2020) == [{'state': 'NY', 'version': 1}]
+    assert calls == ['inputs', {'state': 'CA', 'start_year': '2020'}, {'state': 'NY', 'start_year': 2020}]
+
+    # the cached rows can't be modified through the results
+    run('CA', 2020)[0]['state'] = 'NY'
+    assert run('CA', 2020) == [{'state': 'CA', 'version': 1}]
+
+    # the data changed
+    version = 2
+    assert run('CA', 2020) == [{'state': 'CA', 'version': 2}]
+    assert calls[3:] == ['inputs', {'state': 'CA', 'start_year': 2020}]
+
+    # not cached without a version
+    analysis = SystemAnalysis('test_run_uncached', query, user_inputs, {})
+    run('CA', 2020)
+    run('CA', 2020)
+    assert len([call for call in calls if call != 'inputs']) == 5
+
+
+def test_versioned():
+    version = 1
+    calls = []
+
+    @versioned(lambda: version)
+    def states():
+        calls.append(version)
+        return ['CA']
+
+    assert states() == states() == ['CA']
+    states().append('NY')
+    assert states() == ['CA']
+    version = 2
+    assert states() == ['CA']
+    assert calls == [1, 2]
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from core.tables import Table
+
+
+def test_select():
+    table = Table(pd.DataFrame({
+        'fuel': ['Coal', 'Gas', 'Coal', None],
+        'year': [2020, 2020, 2030, 2030],
+        'value': [1.0, 2.0, 3.0, 4.0],
+    }))
+    df = table.frame
+
+    res = table.select([('fuel', 'Coal'), ('year', '2030')])
+    assert res.equals(df[(df['fuel'] == 'Coal') & (df['year'] == 2030)])
+    assert len(table.select([('fuel', 'Oil')])) == 0
+    assert table.select([]).equals(df)
+
+
+def test_select_read_only():
+    table = Table(pd.DataFrame({'fuel': ['Coal', 'Gas'], 'value': [1.0, 2.0]}), read_only=True)
+
+    # columns added to or removed from the frames returned aren't shared
+    df = table.select([])
+    df['year'] = 2020
+    del df['fuel']
+    assert list(table.frame.columns) == ['fuel', 'value']
+
+    # the data can't be modified in place
+    with pytest.raises(ValueError):
+        table.select([]).loc[0, 'value'] = 10.0
+    with pytest.raises(ValueError):
+        table.select([('fuel', 'Gas')]).iloc[0, 1] = 10.0
+    assert list(table.frame['value']) == [1.0, 2.0]
+
+    # including once the indexes are built
+    table.select([('value', 2.0)]).sort_values('fuel')
+    with pytest.raises(ValueError):
+        table.select([]).loc[0, 'value'] = 10.0
+
+    # but new frames can be computed from it
+    assert list(table.select([])['value'] * 2) == [2.0, 4.0]